@@ -0,0 +1,97 @@
+"""Benchmark of the conversion of large DataFrames to DataBases.
+
+The former path, validating columns one by one, slicing a copy and
+converting it with gstlearn's pandas helper, is compared with the bulk
+conversion from a single contiguous block.
+"""
+
+import time
+import tracemalloc
+from collections.abc import Callable
+from functools import partial
+from typing import Any
+
+import gstlearn as gl
+import numpy as np
+import pandas as pd
+
+from bramm_data_analysis.loaders.df_to_db.converters import DF2Db
+
+SIZE = 1_000_000
+XS = ["longitude", "latitude"]
+ZS = ["cu", "pb", "zn"]
+REPEATS = 5
+
+
+def measure(function: Callable[[], Any]) -> tuple[float, float]:
+    """Measure the duration and memory peak of a function.
+
+    Parameters
+    ----------
+    function : Callable[[], Any]
+        Function to run.
+
+    Returns
+    -------
+    tuple[float, float]
+        Best duration over several runs, in seconds, and peak of memory
+        allocated by python and numpy during a run, in MiB.
+    """
+    durations = []
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        function()
+        durations.append(time.perf_counter() - start)
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return min(durations), peak / 1024**2
+
+
+def convert_by_slicing(converter: DF2Db) -> gl.Db:
+    """Convert using a sliced copy of the DataFrame.
+
+    Parameters
+    ----------
+    converter : DF2Db
+        Converter.
+
+    Returns
+    -------
+    gl.Db
+        DataBase.
+    """
+    database = gl.Db_fromPandas(converter.slice_df(xs=XS, zs=ZS))
+    database.setLocators(XS, gl.ELoc.X)
+    database.setLocators(ZS, gl.ELoc.Z)
+    return database
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    dataframe = pd.DataFrame(
+        {
+            "longitude": rng.uniform(-5, 8, SIZE),
+            "latitude": rng.uniform(42, 51, SIZE),
+            **{z: rng.lognormal(size=SIZE) for z in ZS},
+            "label": rng.integers(100, size=SIZE),
+        }
+    )
+    converter = DF2Db(dataframe)
+    runs = {
+        "Sliced copy": partial(convert_by_slicing, converter),
+        "Bulk block": partial(converter.retrieve_db, xs=XS, zs=ZS),
+    }
+    # Missing values policies
+    with_nans = dataframe.copy()
+    with_nans.loc[with_nans.index[::10], "cu"] = np.nan
+    for nan_policy in ["drop", "mask"]:
+        runs[f"Bulk, NaN {nan_policy}"] = partial(
+            DF2Db(with_nans, nan_policy=nan_policy).retrieve_db,
+            xs=XS,
+            zs=ZS,
+        )
+    for name, run in runs.items():
+        duration, peak = measure(run)
+        print(f"{name:<16}: {duration:.3f} s, {peak:6.1f} MiB")
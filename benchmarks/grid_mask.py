@@ -0,0 +1,35 @@
+"""Benchmark of the inland mask of regular grids.
+
+Testing a point per cell against the boundary polygon is compared with
+rasterizing the polygon onto the grid lattice.
+"""
+
+import time
+from pathlib import Path
+
+import numpy as np
+
+from bramm_data_analysis.spatial import Boundary, RegularGrid
+
+BOUNDARY_PATH = Path(__file__).parents[1] / "data" / "metropole.json"
+STEPS = [0.1, 0.05, 0.01, 0.005]
+
+
+if __name__ == "__main__":
+    boundary = Boundary(boundary_geojson_path=BOUNDARY_PATH)
+    print(f"{'Step':>6}{'Cells':>12}{'Within':>10}{'Scanline':>10}  Same")
+    for step in STEPS:
+        durations = {}
+        masks = {}
+        for mask_method in RegularGrid.mask_methods:
+            grid = RegularGrid(boundary, mask_method=mask_method)
+            start = time.perf_counter()
+            db_grid = grid.retrieve_grid(step=step)
+            durations[mask_method] = time.perf_counter() - start
+            masks[mask_method] = np.asarray(db_grid[grid.insider_field])
+        identical = np.array_equal(masks["within"], masks["scanline"])
+        print(
+            f"{step:>6}{db_grid.getNSample():>12,}"
+            f"{durations['within']:>9.2f}s{durations['scanline']:>9.2f}s"
+            f"  {identical}"
+        )
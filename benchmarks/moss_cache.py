@@ -0,0 +1,42 @@
+"""Benchmark of the MossReader sheet cache (cold vs. warm loads)."""
+
+import tempfile
+import time
+from pathlib import Path
+
+from bramm_data_analysis.loaders.reading.moss import MossReader
+
+DATA_PATH = Path(__file__).parents[1] / "data" / "Mines_2024.xlsx"
+REPEATS = 5
+
+
+def time_retrieve(reader: MossReader) -> float:
+    """Time a single retrieval of the merged DataFrame.
+
+    Parameters
+    ----------
+    reader : MossReader
+        Reader to use.
+
+    Returns
+    -------
+    float
+        Elapsed time in seconds.
+    """
+    start = time.perf_counter()
+    reader.retrieve()
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as cache_dir:
+        reader = MossReader(data_path=DATA_PATH, cache_dir=Path(cache_dir))
+        cold = time_retrieve(reader)
+        warm = min(time_retrieve(reader) for _ in range(REPEATS))
+    uncached = min(
+        time_retrieve(MossReader(data_path=DATA_PATH)) for _ in range(REPEATS)
+    )
+    print(f"No cache : {uncached:.3f} s")
+    print(f"Cold     : {cold:.3f} s")
+    print(f"Warm     : {warm:.3f} s")
+    print(f"Speedup  : x{uncached / warm:.1f}")
@@ -0,0 +1,56 @@
+"""Benchmark of the parallel matching of a large grid of points.
+
+Every point of a national-scale grid is matched to its closest reference
+site, serially and with several threads querying chunks of the grid.
+"""
+
+import os
+import time
+
+import numpy as np
+import pandas as pd
+
+from bramm_data_analysis.matching import Matcher
+
+GRID_SIZE = 2_000
+SITES = 2_200
+KM_THRESHOLD = 20
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    longitudes, latitudes = np.meshgrid(
+        np.linspace(-5, 8, GRID_SIZE),
+        np.linspace(42, 51, GRID_SIZE),
+    )
+    grid = pd.DataFrame(
+        {"longitude": longitudes.ravel(), "latitude": latitudes.ravel()}
+    )
+    sites = pd.DataFrame(
+        {
+            "longitude": rng.uniform(-5, 8, SITES),
+            "latitude": rng.uniform(42, 51, SITES),
+            "site": np.arange(SITES),
+        }
+    )
+    cores = os.cpu_count() or 1
+    workers_nbs = sorted({1, 2, 4, cores} & set(range(1, cores + 1)))
+    for engine in Matcher.engines:
+        reference = None
+        for workers in workers_nbs:
+            matcher = Matcher(
+                km_threshold=KM_THRESHOLD,
+                engine=engine,
+                workers=workers,
+            )
+            start = time.perf_counter()
+            matched = matcher.right_to_left(grid, sites, radians=False)
+            duration = time.perf_counter() - start
+            if reference is None:
+                reference = matched
+            identical = matched.equals(reference)
+            print(
+                f"{engine:<10}{workers:>3} workers: {duration:.2f} s,"
+                f" {grid.shape[0] / duration:,.0f} points/s,"
+                f" identical: {identical}"
+            )
@@ -0,0 +1,129 @@
+"""Benchmark of the memory peaks of the loading pipeline's stages.
+
+The stages of `BaseLoader.retrieve_db` are run one after the other, with
+and without the copy-free mode, on an enlarged copy of the RMQS data.
+Peaks are measured with tracemalloc, which accounts for numpy buffers.
+"""
+
+import tempfile
+import tracemalloc
+from collections.abc import Callable
+from contextlib import nullcontext
+from pathlib import Path
+from typing import Any
+
+import pandas as pd
+
+from bramm_data_analysis.loaders.df_to_db.converters import DF2Db
+from bramm_data_analysis.loaders.preprocessing.duplicates import (
+    DuplicatesRemover,
+)
+from bramm_data_analysis.loaders.preprocessing.outliers.thresholds import (
+    ValueThreshold,
+)
+from bramm_data_analysis.loaders.preprocessing.rmqs import RMQSPreprocessor
+from bramm_data_analysis.loaders.reading.rmqs import RMQSReader
+
+DATA_PATH = Path(__file__).parents[1] / "data" / "RMQS.csv"
+REPLICATES = 50
+FIELDS = [
+    "date_complete",
+    "longitude",
+    "latitude",
+    "cu_tot_hf",
+    "pb_tot_hf",
+    "zn_tot_hf",
+]
+
+
+def measure(stage: Callable[[], Any]) -> tuple[Any, float]:
+    """Run a stage and measure its memory peak.
+
+    Parameters
+    ----------
+    stage : Callable[[], Any]
+        Stage to run.
+
+    Returns
+    -------
+    tuple[Any, float]
+        Output of the stage and peak of allocated memory during the
+        stage, in MiB, relative to the memory allocated before it.
+    """
+    tracemalloc.reset_peak()
+    start, _ = tracemalloc.get_traced_memory()
+    output = stage()
+    _, peak = tracemalloc.get_traced_memory()
+    return output, (peak - start) / 1024**2
+
+
+def run_pipeline(data_path: Path, *, copy_free: bool) -> dict[str, float]:
+    """Run the pipeline's stages.
+
+    Parameters
+    ----------
+    data_path : Path
+        Path to the RMQS file.
+    copy_free : bool
+        Whether to run the stages in copy-free mode.
+
+    Returns
+    -------
+    dict[str, float]
+        Memory peak of each stage, in MiB.
+    """
+    reader = RMQSReader(data_path=data_path)
+    preprocessor = RMQSPreprocessor()
+    threshold = ValueThreshold(field="cu_tot_hf", lower=0, upper=1e6)
+    remover = DuplicatesRemover("mean", copy=not copy_free)
+    remover.date_field = "date_complete"
+    context = (
+        pd.option_context("mode.copy_on_write", True)
+        if copy_free
+        else nullcontext()
+    )
+    peaks = {}
+    with context:
+        dataframe, peaks["read"] = measure(
+            lambda: reader.retrieve_and_filter(FIELDS),
+        )
+        if copy_free:
+            _, peaks["preprocess"] = measure(
+                lambda: preprocessor.preprocess(dataframe, inplace=True),
+            )
+        else:
+            dataframe, peaks["preprocess"] = measure(
+                lambda: preprocessor.preprocess(dataframe, inplace=False),
+            )
+        mask = threshold.check_threshold(dataframe)
+        if not (copy_free and mask.all()):
+            dataframe, peaks["thresholds"] = measure(lambda: dataframe[mask])
+        else:
+            peaks["thresholds"] = 0.0
+        dataframe, peaks["duplicates"] = measure(
+            lambda: remover.process_duplicates(dataframe),
+        )
+        converter = DF2Db(source=dataframe, copy=not copy_free)
+        _, peaks["slice"] = measure(
+            lambda: converter.slice_df(
+                xs=["longitude", "latitude"],
+                zs=["cu_tot_hf", "pb_tot_hf", "zn_tot_hf"],
+            ),
+        )
+    return peaks
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        data_path = Path(tmp_dir) / "rmqs.csv"
+        pd.concat([pd.read_csv(DATA_PATH)] * REPLICATES).to_csv(
+            data_path,
+            index=False,
+        )
+        tracemalloc.start()
+        copying = run_pipeline(data_path, copy_free=False)
+        copy_free = run_pipeline(data_path, copy_free=True)
+        tracemalloc.stop()
+    print(f"{'Stage':<12}{'Copying':>12}{'Copy-free':>12}")
+    for stage, peak in copying.items():
+        print(f"{stage:<12}{peak:>9.1f} MiB{copy_free[stage]:>9.1f} MiB")
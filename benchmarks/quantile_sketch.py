@@ -0,0 +1,54 @@
+"""Benchmark of the accuracy of the streaming quantile sketches.
+
+Sketches are built on chunks spread over several simulated workers,
+merged, and their quantiles are compared to the exact ones.
+"""
+
+import numpy as np
+
+from bramm_data_analysis.loaders.preprocessing.outliers.sketches import (
+    QuantileSketch,
+)
+
+SIZE = 2_000_000
+WORKERS = 4
+CHUNKS = 50
+LEVELS = [0.001, 0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99, 0.999]
+
+
+def rank_error(values: np.ndarray, sketch: QuantileSketch) -> float:
+    """Maximal error on the ranks of the sketch's quantiles.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Sorted values summarized by the sketch.
+    sketch : QuantileSketch
+        Sketch to evaluate.
+
+    Returns
+    -------
+    float
+        Maximal rank error, as a fraction of the number of values.
+    """
+    ranks = np.searchsorted(values, sketch.quantile(LEVELS)) / values.size
+    return float(np.abs(ranks - LEVELS).max())
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    values = rng.lognormal(size=SIZE)
+    sorted_values = np.sort(values)
+    print(f"{'Error':>8}{'Measured':>10}{'Retained':>10}")
+    for error in [0.05, 0.01, 0.002]:
+        sketches = []
+        for part in np.array_split(values, WORKERS):
+            sketch = QuantileSketch(error=error, seed=0)
+            for chunk in np.array_split(part, CHUNKS):
+                sketch.update(chunk)
+            sketches.append(sketch)
+        merged, *others = sketches
+        for other in others:
+            merged.merge(other)
+        measured = rank_error(sorted_values, merged)
+        print(f"{error:>8}{measured:>10.4f}{merged.size:>10}")
@@ -0,0 +1,72 @@
+"""Benchmark of the memory footprint of the loaded frames' types."""
+
+from pathlib import Path
+
+import pandas as pd
+from pandas.core.api import DataFrame
+
+from bramm_data_analysis.loaders import from_moss_csv, from_rmqs_csv
+from bramm_data_analysis.loaders.reading.moss import MossReader
+from bramm_data_analysis.loaders.reading.rmqs import RMQSReader
+
+DATA_DIR = Path(__file__).parents[1] / "data"
+MOSS_PATH = DATA_DIR / "Mines_2024.xlsx"
+RMQS_PATH = DATA_DIR / "RMQS.csv"
+
+
+def footprint(dataframe: DataFrame) -> float:
+    """Memory footprint of a DataFrame.
+
+    Parameters
+    ----------
+    dataframe : DataFrame
+        DataFrame to measure.
+
+    Returns
+    -------
+    float
+        Footprint in MiB, including the content of python objects.
+    """
+    return dataframe.memory_usage(deep=True).sum() / 1024**2
+
+
+def report(
+    name: str,
+    raw: DataFrame,
+    typed: DataFrame,
+    compact: DataFrame,
+) -> None:
+    """Print the footprints of a dataset's frames.
+
+    Parameters
+    ----------
+    name : str
+        Name of the dataset.
+    raw : DataFrame
+        Frame with the types inferred by the parser.
+    typed : DataFrame
+        Frame with the schema's types.
+    compact : DataFrame
+        Frame with the schema's types and float32 concentrations.
+    """
+    reference = footprint(raw)
+    print(f"{name}")
+    print(f"  Inferred types : {reference:.2f} MiB")
+    for label, dataframe in [("Schema", typed), ("Schema float32", compact)]:
+        size = footprint(dataframe)
+        print(f"  {label:<15}: {size:.2f} MiB (x{reference / size:.1f})")
+
+
+if __name__ == "__main__":
+    report(
+        "Moss",
+        raw=MossReader(data_path=MOSS_PATH).retrieve(),
+        typed=from_moss_csv(MOSS_PATH).retrieve_df(),
+        compact=from_moss_csv(MOSS_PATH, float_dtype="float32").retrieve_df(),
+    )
+    report(
+        "RMQS",
+        raw=pd.read_csv(RMQS_PATH, na_values=RMQSReader.na_values),
+        typed=from_rmqs_csv(RMQS_PATH).retrieve_df(),
+        compact=from_rmqs_csv(RMQS_PATH, float_dtype="float32").retrieve_df(),
+    )
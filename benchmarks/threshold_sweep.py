@@ -0,0 +1,76 @@
+"""Benchmark of the sweep over matching thresholds.
+
+Matching once per pair of thresholds is compared with a single sweep
+over the whole grid of thresholds. RMQS sites hold several layers at the
+same coordinates, so that matched pairs are only identical if both
+methods break ties between co-located points the same way.
+"""
+
+import time
+
+import numpy as np
+import pandas as pd
+
+from bramm_data_analysis.matching import Matcher
+
+MOSS_SIZE = 20_000
+RMQS_SIZE = 2_200
+LAYERS_NB = 3
+KM_THRESHOLDS = np.linspace(1, 20, 10)
+YEAR_THRESHOLDS = np.arange(2000, 2020, 2)
+
+
+if __name__ == "__main__":
+    rng = np.random.default_rng(0)
+    moss = pd.DataFrame(
+        {
+            "longitude": rng.uniform(-5, 8, MOSS_SIZE),
+            "latitude": rng.uniform(42, 51, MOSS_SIZE),
+        }
+    )
+    sites = pd.DataFrame(
+        {
+            "longitude": rng.uniform(-5, 8, RMQS_SIZE),
+            "latitude": rng.uniform(42, 51, RMQS_SIZE),
+            Matcher.rmqs_date_column: pd.to_datetime("2000-01-01")
+            + pd.to_timedelta(rng.uniform(0, 20 * 365, RMQS_SIZE), "D"),
+        }
+    )
+    # Layers of a site share its coordinates, in shuffled order
+    rmqs = (
+        sites.loc[sites.index.repeat(LAYERS_NB)]
+        .sample(frac=1, random_state=0)
+        .reset_index(drop=True)
+    )
+    start = time.perf_counter()
+    matches = {
+        (int(year), km): Matcher(
+            km_threshold=km,
+            year_threshold=int(year),
+        ).match_rmqs_to_moss(moss, rmqs)
+        for year in YEAR_THRESHOLDS
+        for km in KM_THRESHOLDS
+    }
+    repeated = time.perf_counter() - start
+    start = time.perf_counter()
+    sweep = Matcher().sweep_rmqs_to_moss(
+        moss,
+        rmqs,
+        km_thresholds=KM_THRESHOLDS,
+        year_thresholds=YEAR_THRESHOLDS,
+    )
+    pairs = {
+        (year, km): sweep.pairs(km, year) for (year, km) in matches
+    }
+    swept = time.perf_counter() - start
+    # Both DataFrames have a RangeIndex: labels are positions
+    identical = all(
+        np.array_equal(pairs[key][0], matched.index.to_numpy())
+        and np.array_equal(
+            pairs[key][1],
+            matched[Matcher.key_column].to_numpy(),
+        )
+        for key, matched in matches.items()
+    )
+    print(f"Repeated matches: {repeated:.2f} s")
+    print(f"Single sweep    : {swept:.2f} s, identical pairs: {identical}")
@@ -1,8 +1,15 @@
 """Loading Tools."""
 
+from bramm_data_analysis.loaders.caching import ResultCache
 from bramm_data_analysis.loaders.core import (
+    from_moss_campaigns,
     from_moss_csv,
     from_rmqs_csv,
 )
 
-__all__ = ["from_moss_csv", "from_rmqs_csv"]
+__all__ = [
+    "ResultCache",
+    "from_moss_campaigns",
+    "from_moss_csv",
+    "from_rmqs_csv",
+]
@@ -1,12 +1,19 @@
 """DataBase Converting Tools."""
 
+import asyncio
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
+from concurrent.futures import Executor
+from contextlib import AbstractContextManager, nullcontext
+from functools import partial
 from typing import Generic, TypeVar
 
 import numpy as np
+import pandas as pd
 from gstlearn import Db
 from pandas.core.api import DataFrame
 
+from bramm_data_analysis.loaders.caching import ResultCache
 from bramm_data_analysis.loaders.df_to_db.converters import DF2Db
 from bramm_data_analysis.loaders.preprocessing._base import BasePreprocessor
 from bramm_data_analysis.loaders.preprocessing.duplicates import (
@@ -14,6 +21,7 @@ from bramm_data_analysis.loaders.preprocessing.duplicates import (
 )
 from bramm_data_analysis.loaders.preprocessing.outliers.thresholds import (
     Threshold,
+    ThresholdSet,
 )
 from bramm_data_analysis.loaders.reading._base import BaseReader
 
@@ -29,6 +37,9 @@ class BaseLoader(ABC, Generic[T]):
     latitude_field = "latitude"
     _reader: BaseReader
     _preprocessor: BasePreprocessor
+    _result_cache: ResultCache | None = None
+    _copy_free: bool = False
+    _duplicates_tolerance: float | None = None
 
     @abstractmethod
     def __init__(self, source: T) -> None:
@@ -46,6 +57,145 @@ class BaseLoader(ABC, Generic[T]):
         """Data Path."""
         return self._source
 
+    @property
+    def result_cache(self) -> ResultCache | None:
+        """Cache of the filtered DataFrames, None if results are not cached."""
+        return self._result_cache
+
+    @result_cache.setter
+    def result_cache(self, result_cache: ResultCache | None) -> None:
+        self._result_cache = result_cache
+
+    @property
+    def copy_free(self) -> bool:
+        """Whether the pipeline avoids copying the data between stages.
+
+        In this mode, the stages rely on pandas' copy-on-write: the freshly
+        read data is preprocessed in place and the following stages only
+        copy the columns they modify.
+
+        Copy-on-write is a process-wide pandas option, which changes the
+        behaviour of any code writing through views. It is therefore never
+        enabled by the loaders: the mode requires the process to opt in
+        beforehand, with `pd.set_option("mode.copy_on_write", True)`.
+        """
+        return self._copy_free
+
+    @copy_free.setter
+    def copy_free(self, copy_free: bool) -> None:
+        if copy_free:
+            self._raise_if_copy_on_write_disabled()
+        self._copy_free = copy_free
+
+    @staticmethod
+    def _raise_if_copy_on_write_disabled() -> None:
+        """Raise Error if pandas' copy-on-write is not enabled.
+
+        Raises
+        ------
+        ValueError
+            If the process has not enabled copy-on-write.
+        """
+        if pd.get_option("mode.copy_on_write") is not True:
+            msg = (
+                "The copy-free mode requires pandas' copy-on-write, enable"
+                " it for the process with"
+                ' pd.set_option("mode.copy_on_write", True).'
+            )
+            raise ValueError(msg)
+
+    @property
+    def duplicates_tolerance(self) -> float | None:
+        """Distance (in meters) under which samples are duplicates.
+
+        If None, only samples with identical coordinates are duplicates.
+        """
+        return self._duplicates_tolerance
+
+    @duplicates_tolerance.setter
+    def duplicates_tolerance(self, tolerance: float | None) -> None:
+        self._duplicates_tolerance = tolerance
+
+    def _pipeline_context(self) -> AbstractContextManager:
+        """Context in which to run the pipeline's stages.
+
+        The pandas options are left untouched: in copy-free mode,
+        copy-on-write must still be enabled for the process.
+
+        Returns
+        -------
+        AbstractContextManager
+            Context of the stages.
+        """
+        if self.copy_free:
+            self._raise_if_copy_on_write_disabled()
+        return nullcontext()
+
+    def _preprocess(self, dataframe: DataFrame) -> DataFrame:
+        """Preprocess freshly read data.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            Data read from the source.
+
+        Returns
+        -------
+        DataFrame
+            Preprocessed data, which is the same object as `dataframe`
+            in copy-free mode.
+        """
+        if not self.copy_free:
+            return self._preprocessor.preprocess(
+                unprocessed_data=dataframe,
+                inplace=False,
+            )
+        # Data has just been read, nothing else refers to it
+        self._preprocessor.preprocess(unprocessed_data=dataframe, inplace=True)
+        return dataframe
+
+    def _result_key(
+        self,
+        fields: list[str],
+        *,
+        duplicates_handling_strategy: str | None,
+        thresholds: list[Threshold | ThresholdSet] | None,
+        dtypes: dict[str, str] | None,
+    ) -> str:
+        """Key identifying a filtered DataFrame in the result cache.
+
+        Parameters
+        ----------
+        fields : list[str]
+            List of fields to conserve.
+        duplicates_handling_strategy : str | None
+            Aggregation method to handle duplicates.
+        thresholds : list[Threshold | ThresholdSet] | None
+            Thresholds to satisfy for the data.
+        dtypes : dict[str, str] | None
+            Types to assign to the fields when parsing.
+
+        Returns
+        -------
+        str
+            Key of the result.
+        """
+        specifications = (
+            None
+            if thresholds is None
+            else [threshold.specification for threshold in thresholds]
+        )
+        return ResultCache.make_key(
+            self.__class__.__name__,
+            self._reader.fingerprint(),
+            sorted(vars(self._preprocessor).items()),
+            list(fields),
+            duplicates_handling_strategy,
+            self.duplicates_tolerance,
+            specifications,
+            None if dtypes is None else sorted(dtypes.items()),
+        )
+
     def _handle_duplicates(
         self, dataframe: DataFrame, *, duplicates_handling_strategy: str | None
     ) -> DataFrame:
@@ -66,16 +216,62 @@ class BaseLoader(ABC, Generic[T]):
         """
         if duplicates_handling_strategy is None:
             return dataframe
+        duplicate_remover = self._duplicates_remover(
+            duplicates_handling_strategy=duplicates_handling_strategy,
+        )
+        # Process duplicates
+        return duplicate_remover.process_duplicates(dataframe)
+
+    def _duplicates_remover(
+        self, *, duplicates_handling_strategy: str
+    ) -> DuplicatesRemover:
+        """Create the Duplicates Remover matching the loader's fields.
+
+        Parameters
+        ----------
+        duplicates_handling_strategy : str
+            Strategy to follow to aggregate duplicates.
+
+        Returns
+        -------
+        DuplicatesRemover
+            Duplicates Remover.
+        """
         # Create Duplicate Remover
         duplicate_remover = DuplicatesRemover(
             aggregating_method=duplicates_handling_strategy,
+            copy=not self.copy_free,
+            tolerance=self.duplicates_tolerance,
         )
         # Modify fields to match dataframe's
         duplicate_remover.date_field = self.date_field
         duplicate_remover.longitude_field = self.longitude_field
         duplicate_remover.latitude_field = self.latitude_field
-        # Process duplicates
-        return duplicate_remover.process_duplicates(dataframe)
+        # Samples of different sets (such as campaigns) are not aggregated
+        duplicate_remover.group_fields = tuple(self._reader.kept_fields)
+        return duplicate_remover
+
+    def _check_thresholds(
+        self,
+        dataframe: DataFrame,
+        thresholds: list[Threshold | ThresholdSet],
+    ) -> np.ndarray:
+        """Check all thresholds on a DataFrame.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            DataFrame to check.
+        thresholds : list[Threshold | ThresholdSet]
+            Thresholds to satisfy for the data.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask : True if the row satisfies all thresholds.
+        """
+        # Compile all thresholds into a single mask evaluation
+        return ThresholdSet(*thresholds).check_threshold(dataframe)
 
     def raise_if_essential_columns_missing(self, dataframe: DataFrame) -> None:
         """Raise an error if one essential column is missing.
@@ -102,10 +298,15 @@ class BaseLoader(ABC, Generic[T]):
         fields: list[str],
         *,
         duplicates_handling_strategy: str | None = None,
-        thresholds: list[Threshold] | None = None,
+        thresholds: list[Threshold | ThresholdSet] | None = None,
+        dtypes: dict[str, str] | None = None,
+        chunksize: int | None = None,
     ) -> DataFrame:
         """Retrieve Filtered DataFrame.
 
+        Only the requested fields are parsed from the source. If the loader
+        has a result cache, results are looked up in and stored to it.
+
         Parameters
         ----------
         fields : list[str]
@@ -113,41 +314,293 @@ class BaseLoader(ABC, Generic[T]):
         duplicates_handling_strategy : str | None, optional
             Aggregation method to handle duplicates.
             If None, the duplicates will not be removed., by default None
-        thresholds : list[Threshold] | None, optional
+        thresholds : list[Threshold | ThresholdSet] | None, optional
             Thresholds to satisfy for the data.
               If None, no threshold selection is made., by default None
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the fields when parsing., by default None
+        chunksize : int | None, optional
+            If not None, the source is streamed by chunks of this number
+            of rows, so that the memory footprint does not depend on the
+            size of the source., by default None
 
         Returns
         -------
         DataFrame
             Filtered DataFrame
         """
-        # Retrieve filtered df
-        dataframe = self._reader.retrieve_and_filter(fields)
-        self.raise_if_essential_columns_missing(dataframe)
-        # Preprocess Data
-        preprocessed = self._preprocessor.preprocess(
-            unprocessed_data=dataframe,
-            inplace=False,
+        if self.result_cache is None:
+            return self._compute_filtered_df(
+                fields=fields,
+                duplicates_handling_strategy=duplicates_handling_strategy,
+                thresholds=thresholds,
+                dtypes=dtypes,
+                chunksize=chunksize,
+            )
+        # The chunksize does not change the result: it is not part of the key
+        key = self._result_key(
+            fields=fields,
+            duplicates_handling_strategy=duplicates_handling_strategy,
+            thresholds=thresholds,
+            dtypes=dtypes,
         )
-        if thresholds is None:
+        # Results of a source are stored under its content hash, so that
+        # results of outdated contents are purged from the cache
+        namespace = ResultCache.make_key(
+            self.__class__.__name__, repr(self.source)
+        )
+        version = self._reader.fingerprint()
+        cached = self.result_cache.get(
+            key, namespace=namespace, version=version
+        )
+        if cached is not None:
+            return cached
+        dataframe = self._compute_filtered_df(
+            fields=fields,
+            duplicates_handling_strategy=duplicates_handling_strategy,
+            thresholds=thresholds,
+            dtypes=dtypes,
+            chunksize=chunksize,
+        )
+        self.result_cache.put(
+            key, dataframe, namespace=namespace, version=version
+        )
+        return dataframe
+
+    def _compute_filtered_df(
+        self,
+        fields: list[str],
+        *,
+        duplicates_handling_strategy: str | None,
+        thresholds: list[Threshold | ThresholdSet] | None,
+        dtypes: dict[str, str] | None,
+        chunksize: int | None,
+    ) -> DataFrame:
+        """Compute Filtered DataFrame from the source.
+
+        Parameters
+        ----------
+        fields : list[str]
+            List of fields to conserve. If empty, return the same DataFrame.
+        duplicates_handling_strategy : str | None
+            Aggregation method to handle duplicates.
+            If None, the duplicates will not be removed.
+        thresholds : list[Threshold | ThresholdSet] | None
+            Thresholds to satisfy for the data.
+              If None, no threshold selection is made.
+        dtypes : dict[str, str] | None
+            Types to assign to the fields when parsing.
+        chunksize : int | None
+            If not None, the source is streamed by chunks of this number
+            of rows.
+
+        Returns
+        -------
+        DataFrame
+            Filtered DataFrame
+        """
+        if chunksize is not None:
+            return self._retrieve_filtered_df_by_chunks(
+                fields=fields,
+                chunksize=chunksize,
+                duplicates_handling_strategy=duplicates_handling_strategy,
+                thresholds=thresholds,
+                dtypes=dtypes,
+            )
+        with self._pipeline_context():
+            # Retrieve filtered df
+            dataframe = self._reader.retrieve_and_filter(fields, dtypes=dtypes)
+            self.raise_if_essential_columns_missing(dataframe)
+            # Preprocess Data
+            preprocessed = self._preprocess(dataframe)
+            if thresholds is None:
+                # Handle Dulicates
+                return self._handle_duplicates(
+                    preprocessed,
+                    duplicates_handling_strategy=duplicates_handling_strategy,
+                )
+            # Check Thresholds
+            verify_threshold = self._check_thresholds(preprocessed, thresholds)
+            if not (self.copy_free and verify_threshold.all()):
+                preprocessed = preprocessed[verify_threshold]
             # Handle Dulicates
             return self._handle_duplicates(
                 preprocessed,
                 duplicates_handling_strategy=duplicates_handling_strategy,
             )
-        # Check Thresholds
-        verify_threshold = np.full(
-            fill_value=True,
-            shape=(preprocessed.shape[0],),
-        )
-        for threshold in thresholds:
-            verify_threshold &= threshold.check_threshold(preprocessed)
-        # Handle Dulicates
-        return self._handle_duplicates(
-            preprocessed[verify_threshold],
+
+    def iter_filtered_df(
+        self,
+        fields: list[str],
+        *,
+        chunksize: int,
+        thresholds: list[Threshold | ThresholdSet] | None = None,
+        dtypes: dict[str, str] | None = None,
+    ) -> Iterator[DataFrame]:
+        """Iterate over chunks of the filtered DataFrame.
+
+        Each chunk is preprocessed and checked against the thresholds.
+        Thresholds which must be fitted (such as SketchQuantileThreshold)
+        and are not fitted yet are first fitted on a pass over all chunks.
+        Copies are fitted, so the given thresholds are not modified, and
+        thresholds fitted beforehand (for instance by merging the sketches
+        of several workers) are used as they are.
+
+        Parameters
+        ----------
+        fields : list[str]
+            List of fields to conserve. If empty, all fields are conserved.
+        chunksize : int
+            Number of rows to read for each chunk.
+        thresholds : list[Threshold | ThresholdSet] | None, optional
+            Thresholds to satisfy for the data.
+              If None, no threshold selection is made., by default None
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the fields when parsing., by default None
+
+        Yields
+        ------
+        DataFrame
+            Filtered chunk.
+
+        Raises
+        ------
+        ValueError
+            If a threshold can not be checked on chunks.
+        """
+        if thresholds is not None:
+            for threshold in thresholds:
+                if not threshold.chunkable:
+                    msg = (
+                        f"{threshold.__class__.__name__} can not be checked"
+                        " on chunks of the data."
+                    )
+                    raise ValueError(msg)
+        if thresholds is None:
+            yield from self._iter_preprocessed_chunks(
+                fields,
+                chunksize=chunksize,
+                dtypes=dtypes,
+            )
+            return
+        # Fit private copies of the unfitted thresholds, the given ones
+        # being left untouched
+        fittables: dict[int, Threshold] = {}
+
+        def private_copy(threshold: Threshold) -> Threshold:
+            if not threshold.fittable or threshold.fitted:
+                return threshold
+            return fittables.setdefault(
+                id(threshold),
+                threshold.unfitted_copy(),
+            )
+
+        threshold_set = ThresholdSet(*thresholds).map_leaves(private_copy)
+        if fittables:
+            # First pass: fit the thresholds on all chunks
+            for dataframe in self._iter_preprocessed_chunks(
+                fields,
+                chunksize=chunksize,
+                dtypes=dtypes,
+            ):
+                for threshold in fittables.values():
+                    threshold.partial_fit(dataframe)
+        for dataframe in self._iter_preprocessed_chunks(
+            fields,
+            chunksize=chunksize,
+            dtypes=dtypes,
+        ):
+            # Check Thresholds
+            yield dataframe[self._check_thresholds(dataframe, [threshold_set])]
+
+    def _iter_preprocessed_chunks(
+        self,
+        fields: list[str],
+        *,
+        chunksize: int,
+        dtypes: dict[str, str] | None,
+    ) -> Iterator[DataFrame]:
+        """Iterate over preprocessed chunks of the source.
+
+        Parameters
+        ----------
+        fields : list[str]
+            List of fields to conserve. If empty, all fields are conserved.
+        chunksize : int
+            Number of rows to read for each chunk.
+        dtypes : dict[str, str] | None
+            Types to assign to the fields when parsing.
+
+        Yields
+        ------
+        DataFrame
+            Preprocessed chunk.
+        """
+        chunks = self._reader.iter_chunks(
+            chunksize=chunksize,
+            fields=fields,
+            dtypes=dtypes,
+        )
+        for chunk in chunks:
+            dataframe = self._reader.filter_dataframe(chunk, fields=fields)
+            self.raise_if_essential_columns_missing(dataframe)
+            # Preprocess Data
+            self._preprocessor.preprocess(
+                unprocessed_data=dataframe,
+                inplace=True,
+            )
+            yield dataframe
+
+    def _retrieve_filtered_df_by_chunks(
+        self,
+        fields: list[str],
+        *,
+        chunksize: int,
+        duplicates_handling_strategy: str | None = None,
+        thresholds: list[Threshold | ThresholdSet] | None = None,
+        dtypes: dict[str, str] | None = None,
+    ) -> DataFrame:
+        """Retrieve Filtered DataFrame by streaming the source by chunks.
+
+        Parameters
+        ----------
+        fields : list[str]
+            List of fields to conserve. If empty, all fields are conserved.
+        chunksize : int
+            Number of rows to read for each chunk.
+        duplicates_handling_strategy : str | None, optional
+            Aggregation method to handle duplicates.
+            If None, the duplicates will not be removed., by default None
+        thresholds : list[Threshold | ThresholdSet] | None, optional
+            Thresholds to satisfy for the data.
+              If None, no threshold selection is made., by default None
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the fields when parsing., by default None
+
+        Returns
+        -------
+        DataFrame
+            Filtered DataFrame
+        """
+        chunks = self.iter_filtered_df(
+            fields=fields,
+            chunksize=chunksize,
+            thresholds=thresholds,
+            dtypes=dtypes,
+        )
+        if duplicates_handling_strategy is None:
+            chunks = list(chunks)
+            if not chunks:
+                return pd.DataFrame(columns=fields)
+            dataframe = pd.concat(chunks)
+            # Chunks' categories differ, concatenation falls back to objects
+            categories = chunks[0].select_dtypes(include="category").columns
+            return dataframe.astype(dict.fromkeys(categories, "category"))
+        duplicate_remover = self._duplicates_remover(
             duplicates_handling_strategy=duplicates_handling_strategy,
         )
+        # Reduce duplicates chunk after chunk
+        return duplicate_remover.process_duplicates_by_chunks(chunks)
 
     def retrieve_df(
         self, *, duplicates_handling_strategy: str | None = None
@@ -165,19 +618,17 @@ class BaseLoader(ABC, Generic[T]):
         DataFrame
             DataFrame
         """
-        # Retrieve unfiltered DF
-        dataframe = self._reader.retrieve()
-        self.raise_if_essential_columns_missing(dataframe)
-        # Preprocess Data
-        preprocessed = self._preprocessor.preprocess(
-            unprocessed_data=dataframe,
-            inplace=False,
-        )
-        # remove Duplicates
-        return self._handle_duplicates(
-            preprocessed,
-            duplicates_handling_strategy=duplicates_handling_strategy,
-        )
+        with self._pipeline_context():
+            # Retrieve unfiltered DF
+            dataframe = self._reader.retrieve()
+            self.raise_if_essential_columns_missing(dataframe)
+            # Preprocess Data
+            preprocessed = self._preprocess(dataframe)
+            # remove Duplicates
+            return self._handle_duplicates(
+                preprocessed,
+                duplicates_handling_strategy=duplicates_handling_strategy,
+            )
 
     def retrieve_db(
         self,
@@ -185,7 +636,9 @@ class BaseLoader(ABC, Generic[T]):
         xs: list[str],
         zs: list[str],
         duplicates_handling_strategy: str | None = None,
-        thresholds: list[Threshold] | None = None,
+        thresholds: list[Threshold | ThresholdSet] | None = None,
+        chunksize: int | None = None,
+        nan_policy: str = "raise",
     ) -> Db:
         """Retrieve the DataBase.
 
@@ -198,9 +651,17 @@ class BaseLoader(ABC, Generic[T]):
         duplicates_handling_strategy: str | None
             Aggregation method to handle duplicates.
             If None, the duplicates will not be removed., by default None
-        thresholds : list[Threshold] | None, optional
+        thresholds : list[Threshold | ThresholdSet] | None, optional
             Thresholds to satisfy for the data.
               If None, no threshold selection is made., by default None
+        chunksize : int | None, optional
+            If not None, the source is streamed by chunks of this number
+            of rows., by default None
+        nan_policy : str, optional
+            Handling of missing values in the locators: "raise" to raise
+            an error, "drop" to drop the rows with any missing value,
+            "mask" to drop the rows with missing X values and keep missing
+            Z values as undefined values., by default "raise"
 
         Returns
         -------
@@ -227,8 +688,391 @@ class BaseLoader(ABC, Generic[T]):
             fields=fields,
             duplicates_handling_strategy=duplicates_handling_strategy,
             thresholds=thresholds,
+            chunksize=chunksize,
         )
 
         # Convert DataFrame to Db
-        converter = DF2Db(source=source_df)
-        return converter.retrieve_db(xs=xs, zs=zs)
+        converter = DF2Db(
+            source=source_df,
+            copy=not self.copy_free,
+            nan_policy=nan_policy,
+        )
+        with self._pipeline_context():
+            return converter.retrieve_db(xs=xs, zs=zs)
+
+    def _targets_masks(
+        self,
+        dataframe: DataFrame,
+        targets: dict[str, list[Threshold | ThresholdSet] | None],
+        *,
+        common: bool,
+    ) -> DataFrame:
+        """Compute the validity of the values of each target.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            Preprocessed DataFrame.
+        targets : dict[str, list[Threshold | ThresholdSet] | None]
+            Thresholds to satisfy for each target.
+        common : bool
+            Whether a row must be valid for all targets to be valid.
+
+        Returns
+        -------
+        DataFrame
+            Boolean mask of each target: True if the value is not missing
+            and satisfies the target's thresholds.
+        """
+        masks = pd.DataFrame(
+            {
+                target: dataframe[target].notna().to_numpy()
+                & self._check_thresholds(dataframe, thresholds or [])
+                for target, thresholds in targets.items()
+            },
+            index=dataframe.index,
+        )
+        if not common:
+            return masks
+        valid = masks.all(axis=1)
+        return masks.apply(lambda _: valid)
+
+    def _retrieve_targets(
+        self,
+        xs: list[str],
+        targets: dict[str, list[Threshold | ThresholdSet] | None],
+        *,
+        duplicates_handling_strategy: str | None,
+        common: bool,
+    ) -> list[DataFrame]:
+        """Retrieve the DataFrames of several targets with a single read.
+
+        Parameters
+        ----------
+        xs : list[str]
+            X Locator(s).
+        targets : dict[str, list[Threshold | ThresholdSet] | None]
+            Thresholds to satisfy for each target.
+        duplicates_handling_strategy : str | None
+            Aggregation method to handle duplicates.
+            If None, the duplicates will not be removed.
+        common : bool
+            If True, a single DataFrame is retrieved with the samples
+            valid for all targets. Otherwise, one DataFrame is retrieved
+            per target.
+
+        Returns
+        -------
+        list[DataFrame]
+            DataFrame of each target, or single DataFrame if `common`.
+        """
+        locations = [
+            self.date_field,
+            self.longitude_field,
+            self.latitude_field,
+            *self._reader.kept_fields,
+        ]
+        other_xs = [x for x in xs if x not in locations]
+        threshold_fields = [
+            field
+            for thresholds in targets.values()
+            for threshold in thresholds or []
+            for field in threshold.fields
+        ]
+        fields = list(
+            dict.fromkeys(locations + other_xs + [*targets] + threshold_fields)
+        )
+        groups = [[*targets]] if common else [[target] for target in targets]
+        with self._pipeline_context():
+            # Read and preprocess once for all targets
+            dataframe = self._reader.retrieve_and_filter(fields)
+            self.raise_if_essential_columns_missing(dataframe)
+            preprocessed = self._preprocess(dataframe)
+            masks = self._targets_masks(preprocessed, targets, common=common)
+            # Mask invalid values, they are then ignored by aggregations
+            samples = pd.concat(
+                [
+                    preprocessed[locations + other_xs],
+                    preprocessed[[*targets]].where(masks),
+                ],
+                axis=1,
+            )
+            remover = None
+            if duplicates_handling_strategy is not None:
+                remover = self._duplicates_remover(
+                    duplicates_handling_strategy=duplicates_handling_strategy,
+                )
+            if remover is not None and remover.aggregates:
+                # Group and aggregate once for all targets
+                samples = remover.aggregate_by_codes(
+                    samples,
+                    codes=remover.group_codes(samples),
+                    columns=[*other_xs, *targets],
+                )
+            dataframes = []
+            for group in groups:
+                selected = samples.loc[
+                    samples[group].notna().all(axis=1),
+                    locations + other_xs + group,
+                ]
+                if remover is not None:
+                    selected = remover.remove_spatial_overlap(selected)
+                dataframes.append(selected)
+        return dataframes
+
+    def retrieve_filtered_dfs(
+        self,
+        xs: list[str],
+        targets: dict[str, list[Threshold | ThresholdSet] | None],
+        *,
+        duplicates_handling_strategy: str | None = None,
+    ) -> dict[str, DataFrame]:
+        """Retrieve the Filtered DataFrames of several targets.
+
+        The source is read, preprocessed and grouped only once. Each
+        target only keeps its own valid values: non-missing and
+        satisfying its thresholds.
+
+        Parameters
+        ----------
+        xs : list[str]
+            X Locator(s).
+        targets : dict[str, list[Threshold | ThresholdSet] | None]
+            Thresholds to satisfy for each target field.
+            If None, only missing values of the target are discarded.
+        duplicates_handling_strategy : str | None, optional
+            Aggregation method to handle duplicates.
+            If None, the duplicates will not be removed., by default None
+
+        Returns
+        -------
+        dict[str, DataFrame]
+            Filtered DataFrame of each target.
+        """
+        dataframes = self._retrieve_targets(
+            xs=xs,
+            targets=targets,
+            duplicates_handling_strategy=duplicates_handling_strategy,
+            common=False,
+        )
+        return dict(zip(targets, dataframes, strict=True))
+
+    def retrieve_dbs(
+        self,
+        xs: list[str],
+        targets: dict[str, list[Threshold | ThresholdSet] | None],
+        *,
+        duplicates_handling_strategy: str | None = None,
+    ) -> dict[str, Db]:
+        """Retrieve the DataBases of several targets.
+
+        See `retrieve_filtered_dfs`.
+
+        Parameters
+        ----------
+        xs : list[str]
+            X Locator(s).
+        targets : dict[str, list[Threshold | ThresholdSet] | None]
+            Thresholds to satisfy for each target field, used as Z Locator.
+            If None, only missing values of the target are discarded.
+        duplicates_handling_strategy : str | None, optional
+            Aggregation method to handle duplicates.
+            If None, the duplicates will not be removed., by default None
+
+        Returns
+        -------
+        dict[str, Db]
+            DataBase of each target.
+        """
+        dataframes = self.retrieve_filtered_dfs(
+            xs=xs,
+            targets=targets,
+            duplicates_handling_strategy=duplicates_handling_strategy,
+        )
+        with self._pipeline_context():
+            return {
+                target: DF2Db(
+                    source=dataframe,
+                    copy=not self.copy_free,
+                ).retrieve_db(xs=xs, zs=target)
+                for target, dataframe in dataframes.items()
+            }
+
+    def retrieve_multi_db(
+        self,
+        xs: list[str],
+        targets: dict[str, list[Threshold | ThresholdSet] | None],
+        *,
+        duplicates_handling_strategy: str | None = None,
+    ) -> Db:
+        """Retrieve a single DataBase with several targets as Z Locators.
+
+        Only the samples valid for all targets are kept.
+
+        Parameters
+        ----------
+        xs : list[str]
+            X Locator(s).
+        targets : dict[str, list[Threshold | ThresholdSet] | None]
+            Thresholds to satisfy for each target field, used as Z Locators.
+            If None, only missing values of the target are discarded.
+        duplicates_handling_strategy : str | None, optional
+            Aggregation method to handle duplicates.
+            If None, the duplicates will not be removed., by default None
+
+        Returns
+        -------
+        Db
+            DataBase.
+        """
+        (dataframe,) = self._retrieve_targets(
+            xs=xs,
+            targets=targets,
+            duplicates_handling_strategy=duplicates_handling_strategy,
+            common=True,
+        )
+        converter = DF2Db(source=dataframe, copy=not self.copy_free)
+        with self._pipeline_context():
+            return converter.retrieve_db(xs=xs, zs=[*targets])
+
+    async def aretrieve_filtered_df(
+        self,
+        fields: list[str],
+        *,
+        duplicates_handling_strategy: str | None = None,
+        thresholds: list[Threshold | ThresholdSet] | None = None,
+        dtypes: dict[str, str] | None = None,
+        chunksize: int | None = None,
+        executor: Executor | None = None,
+    ) -> DataFrame:
+        """Retrieve Filtered DataFrame without blocking the event loop.
+
+        The reading and preprocessing are run in an executor, see
+        `retrieve_filtered_df` for the details.
+
+        Parameters
+        ----------
+        fields : list[str]
+            List of fields to conserve. If empty, return the same DataFrame.
+        duplicates_handling_strategy : str | None, optional
+            Aggregation method to handle duplicates.
+            If None, the duplicates will not be removed., by default None
+        thresholds : list[Threshold | ThresholdSet] | None, optional
+            Thresholds to satisfy for the data.
+              If None, no threshold selection is made., by default None
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the fields when parsing., by default None
+        chunksize : int | None, optional
+            If not None, the source is streamed by chunks of this number
+            of rows., by default None
+        executor : Executor | None, optional
+            Executor in which to run the loading.
+            If None, the event loop's default executor is used.
+            , by default None
+
+        Returns
+        -------
+        DataFrame
+            Filtered DataFrame
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            partial(
+                self.retrieve_filtered_df,
+                fields=fields,
+                duplicates_handling_strategy=duplicates_handling_strategy,
+                thresholds=thresholds,
+                dtypes=dtypes,
+                chunksize=chunksize,
+            ),
+        )
+
+    async def aretrieve_df(
+        self,
+        *,
+        duplicates_handling_strategy: str | None = None,
+        executor: Executor | None = None,
+    ) -> DataFrame:
+        """Retrieve DataFrame without blocking the event loop.
+
+        Parameters
+        ----------
+        duplicates_handling_strategy: str | None
+            Aggregation method to handle duplicates.
+            If None, the duplicates will not be removed., by default None
+        executor : Executor | None, optional
+            Executor in which to run the loading.
+            If None, the event loop's default executor is used.
+            , by default None
+
+        Returns
+        -------
+        DataFrame
+            DataFrame
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            partial(
+                self.retrieve_df,
+                duplicates_handling_strategy=duplicates_handling_strategy,
+            ),
+        )
+
+    async def aretrieve_db(
+        self,
+        *,
+        xs: list[str],
+        zs: list[str],
+        duplicates_handling_strategy: str | None = None,
+        thresholds: list[Threshold | ThresholdSet] | None = None,
+        chunksize: int | None = None,
+        nan_policy: str = "raise",
+        executor: Executor | None = None,
+    ) -> Db:
+        """Retrieve the DataBase without blocking the event loop.
+
+        Parameters
+        ----------
+        xs : list[str]
+            X Loacator(s).
+        zs : list[str]
+            Z Locator(s).
+        duplicates_handling_strategy: str | None
+            Aggregation method to handle duplicates.
+            If None, the duplicates will not be removed., by default None
+        thresholds : list[Threshold | ThresholdSet] | None, optional
+            Thresholds to satisfy for the data.
+              If None, no threshold selection is made., by default None
+        chunksize : int | None, optional
+            If not None, the source is streamed by chunks of this number
+            of rows., by default None
+        nan_policy : str, optional
+            Handling of missing values in the locators: "raise" to raise
+            an error, "drop" to drop the rows with any missing value,
+            "mask" to drop the rows with missing X values and keep missing
+            Z values as undefined values., by default "raise"
+        executor : Executor | None, optional
+            Executor in which to run the loading.
+            If None, the event loop's default executor is used.
+            , by default None
+
+        Returns
+        -------
+        Db
+            DataBase.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            partial(
+                self.retrieve_db,
+                xs=xs,
+                zs=zs,
+                duplicates_handling_strategy=duplicates_handling_strategy,
+                thresholds=thresholds,
+                chunksize=chunksize,
+                nan_policy=nan_policy,
+            ),
+        )
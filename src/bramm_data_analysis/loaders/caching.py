@@ -0,0 +1,339 @@
+"""Cache for Loaders' Results."""
+
+import hashlib
+import os
+import shutil
+import threading
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+
+import pandas as pd
+from pandas.core.api import DataFrame
+
+
+class ResultCache:
+
+    """Two-tier Cache for DataFrames returned by the Loaders.
+
+    The first tier is an in-process LRU cache whose size is bounded in bytes.
+    The second (optional) tier stores pickled DataFrames in a directory
+    and can therefore be shared between processes. Its size is bounded as
+    well, the least recently used entries being removed first.
+
+    Entries can be stored in a namespace (identifying the source of the
+    results) with a version (such as the source's content hash), in
+    `<cache_dir>/<namespace>/<version>/<key>.pkl`. Storing an entry with a
+    new version removes the entries of the namespace's other versions.
+    """
+
+    extension = ".pkl"
+
+    def __init__(
+        self,
+        max_bytes: int = 256 * 1024**2,
+        cache_dir: Path | None = None,
+        max_disk_bytes: int = 1024**3,
+    ) -> None:
+        """Instantiate the Cache.
+
+        Parameters
+        ----------
+        max_bytes : int, optional
+            Maximum size of the in-memory tier, in bytes.
+            , by default 256 MiB
+        cache_dir : Path | None, optional
+            Directory of the on-disk tier.
+            If None, only the in-memory tier is used., by default None
+        max_disk_bytes : int, optional
+            Maximum size of the on-disk tier, in bytes., by default 1 GiB
+        """
+        self._max_bytes = max_bytes
+        self._dir = None if cache_dir is None else Path(cache_dir)
+        self._max_disk_bytes = max_disk_bytes
+        self._entries: OrderedDict[str, tuple[DataFrame, int]] = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._misses = 0
+
+    @property
+    def max_bytes(self) -> int:
+        """Maximum size of the in-memory tier, in bytes."""
+        return self._max_bytes
+
+    @property
+    def cache_dir(self) -> Path | None:
+        """Directory of the on-disk tier."""
+        return self._dir
+
+    @property
+    def max_disk_bytes(self) -> int:
+        """Maximum size of the on-disk tier, in bytes."""
+        return self._max_disk_bytes
+
+    @property
+    def statistics(self) -> dict[str, int]:
+        """Hits and misses counts, and in-memory tier occupation."""
+        with self._lock:
+            return {
+                "memory_hits": self._memory_hits,
+                "disk_hits": self._disk_hits,
+                "misses": self._misses,
+                "memory_entries": len(self._entries),
+                "memory_bytes": self._memory_bytes,
+            }
+
+    @staticmethod
+    def make_key(*components: object) -> str:
+        """Create a key from the components describing a result.
+
+        Parameters
+        ----------
+        *components : object
+            Components identifying the result, with deterministic `repr`.
+
+        Returns
+        -------
+        str
+            Key of the result.
+        """
+        return hashlib.sha256(repr(components).encode()).hexdigest()
+
+    def _entry_path(
+        self,
+        key: str,
+        namespace: str | None,
+        version: str | None,
+    ) -> Path:
+        """Path of an entry in the on-disk tier.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+        namespace : str | None
+            Namespace of the entry, None if the entry has no namespace.
+        version : str | None
+            Version of the entry in its namespace.
+
+        Returns
+        -------
+        Path
+            Path to the pickled DataFrame.
+        """
+        directory = self._dir
+        if namespace is not None:
+            directory = directory / namespace / (version or "")
+        return directory / f"{key}{self.extension}"
+
+    def _evict_from_disk(self) -> None:
+        """Remove the least recently used entries from the on-disk tier.
+
+        Entries are removed until the tier fits its maximum size.
+        """
+        entries = []
+        # Directories purged concurrently are skipped by the walk
+        for directory, _, file_names in os.walk(self.cache_dir):
+            for file_name in file_names:
+                if not file_name.endswith(self.extension):
+                    continue
+                path = Path(directory) / file_name
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    # Removed by another writer
+                    continue
+                entries.append((stat.st_mtime_ns, stat.st_size, path))
+        disk_bytes = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if disk_bytes <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            disk_bytes -= size
+
+    def _store_in_memory(self, key: str, dataframe: DataFrame) -> None:
+        """Store an entry in the in-memory tier, evicting the oldest ones.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+        dataframe : DataFrame
+            DataFrame to store.
+        """
+        size = int(dataframe.memory_usage(deep=True).sum())
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._memory_bytes -= self._entries.pop(key)[1]
+            self._entries[key] = (dataframe, size)
+            self._memory_bytes += size
+            # Evict least recently used entries
+            while self._memory_bytes > self.max_bytes:
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._memory_bytes -= evicted_size
+
+    def _load_from_disk(
+        self,
+        key: str,
+        namespace: str | None,
+        version: str | None,
+    ) -> DataFrame | None:
+        """Load an entry from the on-disk tier.
+
+        Parameters
+        ----------
+        key : str
+            Key of the entry.
+        namespace : str | None
+            Namespace of the entry, None if the entry has no namespace.
+        version : str | None
+            Version of the entry in its namespace.
+
+        Returns
+        -------
+        DataFrame | None
+            Cached DataFrame, None if the entry is not on disk.
+        """
+        if self.cache_dir is None:
+            return None
+        entry_path = self._entry_path(key, namespace, version)
+        try:
+            dataframe = pd.read_pickle(entry_path)
+            # Mark the entry as recently used
+            os.utime(entry_path)
+        except FileNotFoundError:
+            return None
+        return dataframe
+
+    def get(
+        self,
+        key: str,
+        *,
+        namespace: str | None = None,
+        version: str | None = None,
+    ) -> DataFrame | None:
+        """Retrieve a result from the cache.
+
+        Parameters
+        ----------
+        key : str
+            Key of the result.
+        namespace : str | None, optional
+            Namespace of the result., by default None
+        version : str | None, optional
+            Version of the result in its namespace., by default None
+
+        Returns
+        -------
+        DataFrame | None
+            Copy of the cached DataFrame, None if the key is not cached.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self._memory_hits += 1
+                return entry[0].copy()
+        dataframe = self._load_from_disk(key, namespace, version)
+        if dataframe is None:
+            with self._lock:
+                self._misses += 1
+            return None
+        with self._lock:
+            self._disk_hits += 1
+        # Promote to the in-memory tier
+        self._store_in_memory(key, dataframe)
+        return dataframe.copy()
+
+    def put(
+        self,
+        key: str,
+        dataframe: DataFrame,
+        *,
+        namespace: str | None = None,
+        version: str | None = None,
+    ) -> None:
+        """Store a result in the cache.
+
+        Parameters
+        ----------
+        key : str
+            Key of the result.
+        dataframe : DataFrame
+            Result to store. A copy is stored.
+        namespace : str | None, optional
+            Namespace of the result., by default None
+        version : str | None, optional
+            Version of the result in its namespace. Entries of the
+            namespace's other versions are removed from the on-disk tier.
+            , by default None
+        """
+        stored = dataframe.copy()
+        self._store_in_memory(key, stored)
+        if self.cache_dir is None:
+            return
+        entry_path = self._entry_path(key, namespace, version)
+        entry_dir = entry_path.parent
+        if namespace is not None:
+            # Remove entries of outdated versions of the namespace
+            for other_dir in entry_dir.parent.glob("*"):
+                if other_dir != entry_dir:
+                    shutil.rmtree(other_dir, ignore_errors=True)
+        # Write to a temporary file first to never expose partial entries,
+        # unique to the writer for concurrent writes of a key not to mix
+        tmp_path = entry_path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        try:
+            entry_dir.mkdir(parents=True, exist_ok=True)
+            with tmp_path.open("wb") as file:
+                stored.to_pickle(file)
+            tmp_path.replace(entry_path)
+        except (FileNotFoundError, FileExistsError):
+            # The directory has been purged by a concurrent writer of
+            # another version: the entry is outdated, it is not stored
+            tmp_path.unlink(missing_ok=True)
+            return
+        self._evict_from_disk()
+
+    def invalidate(
+        self,
+        key: str | None = None,
+        *,
+        namespace: str | None = None,
+        version: str | None = None,
+    ) -> None:
+        """Remove a result, or all results, from both tiers.
+
+        Parameters
+        ----------
+        key : str | None, optional
+            Key of the result to remove. If None, all results are removed.
+            , by default None
+        namespace : str | None, optional
+            Namespace of the result to remove., by default None
+        version : str | None, optional
+            Version of the result to remove in its namespace.
+            , by default None
+        """
+        with self._lock:
+            if key is None:
+                self._entries.clear()
+                self._memory_bytes = 0
+            elif key in self._entries:
+                self._memory_bytes -= self._entries.pop(key)[1]
+        if self.cache_dir is None:
+            return
+        if key is None:
+            shutil.rmtree(self.cache_dir, ignore_errors=True)
+        else:
+            self._entry_path(key, namespace, version).unlink(missing_ok=True)
+
+    def reset_statistics(self) -> None:
+        """Reset hits and misses counts."""
+        with self._lock:
+            self._memory_hits = 0
+            self._disk_hits = 0
+            self._misses = 0
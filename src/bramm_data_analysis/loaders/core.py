@@ -2,37 +2,160 @@
 
 from pathlib import Path
 
-from bramm_data_analysis.loaders.moss import MossLoader
+from bramm_data_analysis.loaders.caching import ResultCache
+from bramm_data_analysis.loaders.moss import MossCampaignsLoader, MossLoader
 from bramm_data_analysis.loaders.rmqs import RMQSLoader
 
 
-def from_moss_csv(data_path: Path) -> MossLoader:
+def from_moss_csv(
+    data_path: Path,
+    cache_dir: Path | None = None,
+    *,
+    result_cache: ResultCache | None = None,
+    float_dtype: str = "float64",
+) -> MossLoader:
     """Retrieve Loader for Moss Data.
 
     Parameters
     ----------
     data_path : Path
         Path to the source file containing the data.
+    cache_dir : Path | None, optional
+        Directory in which to cache the parsed sheets.
+        If None, the workbook is parsed on every load., by default None
+    result_cache : ResultCache | None, optional
+        Cache of the filtered DataFrames.
+        If None, results are not cached., by default None
+    float_dtype : str, optional
+        Type of the concentrations ("float64" or "float32").
+        , by default "float64"
 
     Returns
     -------
     MossLoader
         Loader for Moss Data.
     """
-    return MossLoader(source=data_path)
+    loader = MossLoader(
+        source=data_path,
+        cache_dir=cache_dir,
+        float_dtype=float_dtype,
+    )
+    loader.result_cache = result_cache
+    return loader
 
 
-def from_rmqs_csv(data_path: Path) -> RMQSLoader:
+def from_moss_campaigns(
+    data_paths: Path | str | list[Path],
+    pattern: str = "*.xlsx",
+    cache_dir: Path | None = None,
+    max_workers: int | None = None,
+    *,
+    result_cache: ResultCache | None = None,
+    float_dtype: str = "float64",
+) -> MossCampaignsLoader:
+    """Retrieve Loader for Moss Data spread over several campaign files.
+
+    Parameters
+    ----------
+    data_paths : Path | str | list[Path]
+        Directory containing the campaign files, glob pattern matching them
+        (possibly over several directory levels, such as
+        "data/*/Mines_*.xlsx") or list of their paths.
+    pattern : str, optional
+        Pattern of the campaign files when `data_paths` is a directory.
+        , by default "*.xlsx"
+    cache_dir : Path | None, optional
+        Directory in which to cache the parsed sheets.
+        If None, the workbooks are parsed on every load., by default None
+    max_workers : int | None, optional
+        Number of processes parsing the files.
+        If None, it is set to the number of processors., by default None
+    result_cache : ResultCache | None, optional
+        Cache of the filtered DataFrames.
+        If None, results are not cached., by default None
+    float_dtype : str, optional
+        Type of the concentrations ("float64" or "float32").
+        , by default "float64"
+
+    Returns
+    -------
+    MossCampaignsLoader
+        Loader for Moss Data.
+    """
+    if isinstance(data_paths, list):
+        paths = data_paths
+    elif Path(data_paths).is_dir():
+        paths = sorted(Path(data_paths).glob(pattern))
+    else:
+        paths = _glob_paths(str(data_paths))
+    loader = MossCampaignsLoader(
+        source=paths,
+        cache_dir=cache_dir,
+        max_workers=max_workers,
+        float_dtype=float_dtype,
+    )
+    loader.result_cache = result_cache
+    return loader
+
+
+def _glob_paths(pattern: str) -> list[Path]:
+    """Find the paths matching a glob pattern.
+
+    The pattern is matched relatively to its longest leading part without
+    wildcards, so that wildcards can span several directory levels.
+
+    Parameters
+    ----------
+    pattern : str
+        Glob pattern.
+
+    Returns
+    -------
+    list[Path]
+        Sorted matching paths.
+    """
+    parts = Path(pattern).parts
+    wildcards = [
+        i for i, part in enumerate(parts) if any(c in part for c in "*?[")
+    ]
+    if not wildcards:
+        return [Path(pattern)] if Path(pattern).exists() else []
+    first = wildcards[0]
+    anchor = Path(*parts[:first]) if first else Path()
+    return sorted(anchor.glob(str(Path(*parts[first:]))))
+
+
+def from_rmqs_csv(
+    data_path: Path,
+    engine: str = "c",
+    *,
+    result_cache: ResultCache | None = None,
+    float_dtype: str = "float64",
+) -> RMQSLoader:
     """Retrieve Loader for RMQS Data.
 
     Parameters
     ----------
     data_path : Path
         Path to the source file containing the data.
+    engine : str, optional
+        CSV parser engine ("c", "python" or "pyarrow")., by default "c"
+    result_cache : ResultCache | None, optional
+        Cache of the filtered DataFrames.
+        If None, results are not cached., by default None
+    float_dtype : str, optional
+        Type of the concentrations ("float64" or "float32").
+        , by default "float64"
 
     Returns
     -------
     RMQSLoader
         Loader for RMQS Data.
     """
-    return RMQSLoader(source=data_path)
+    loader = RMQSLoader(
+        source=data_path,
+        engine=engine,
+        float_dtype=float_dtype,
+    )
+    loader.result_cache = result_cache
+    return loader
@@ -1 +1,5 @@
-"""Conversion Tools from DataFrame to DataBase."""
+"""Conversion Tools between DataFrame and DataBase."""
+
+from bramm_data_analysis.loaders.df_to_db.converters import Db2DF, DF2Db
+
+__all__ = ["DF2Db", "Db2DF"]
@@ -1,7 +1,13 @@
-"""Converter from DataFrame to Db."""
+"""Converters between DataFrame and Db."""
+
+from typing import ClassVar
 
 import gstlearn as gl
+import numpy as np
+import pandas as pd
+import pyarrow as pa
 from gstlearn import Db
+from pandas.api.types import is_float_dtype
 from pandas.core.api import DataFrame
 
 
@@ -9,21 +15,60 @@ class DF2Db:
 
     """Convert Pandas' DataFrame to Gstlearn's Db."""
 
-    def __init__(self, source: DataFrame) -> None:
+    nan_policies: ClassVar[list[str]] = ["raise", "drop", "mask"]
+
+    def __init__(
+        self,
+        source: DataFrame,
+        *,
+        copy: bool = True,
+        nan_policy: str = "raise",
+    ) -> None:
         """INstantiate the Converter.
 
         Parameters
         ----------
         source : DataFrame
             Source DataFrame.
+        copy : bool, optional
+            Whether slices of the source are copies., by default True
+        nan_policy : str, optional
+            Handling of missing values when retrieving the DataBase:
+            "raise" to raise an error, "drop" to drop the rows with any
+            missing value, "mask" to drop the rows with missing
+            coordinates and keep missing Z values as undefined values.
+            , by default "raise"
+
+        Raises
+        ------
+        ValueError
+            If the NaN policy is not supported.
         """
+        if nan_policy not in self.nan_policies:
+            msg = (
+                f"Unsupported NaN policy: {nan_policy}."
+                f" Options are: {', '.join(self.nan_policies)}."
+            )
+            raise ValueError(msg)
         self._df = source
+        self._copy = copy
+        self._nan_policy = nan_policy
 
     @property
     def source(self) -> DataFrame:
         """Source DataFrame."""
         return self._df
 
+    @property
+    def copy(self) -> bool:
+        """Whether slices of the source are copies."""
+        return self._copy
+
+    @property
+    def nan_policy(self) -> str:
+        """Handling of missing values when retrieving the DataBase."""
+        return self._nan_policy
+
     def raise_if_unsuitable(self, column_name: str) -> None:
         """Verify that a column is suitable for the DataBase.
 
@@ -39,7 +84,7 @@ class DF2Db:
         """
         column = self.source[column_name]
         # Assert Column is composed of floats
-        if column.dtype != "float64":
+        if not is_float_dtype(column.dtype):
             msg = f"The column {column_name} must contain only floats."
             raise ValueError(msg)
         # Assert Column has no nans
@@ -60,7 +105,7 @@ class DF2Db:
         Returns
         -------
         DataFrame
-            Sliced copy of source.
+            Sliced copy of source (or view if copies are disabled).
         """
         slice_components = []
         # Check all fields
@@ -79,11 +124,77 @@ class DF2Db:
                 self.raise_if_unsuitable(z)
             slice_components += zs
         # Return filtered DataFrame
-        return self.source.filter(slice_components).copy()
+        sliced = self.source.filter(slice_components)
+        return sliced.copy() if self.copy else sliced
+
+    def to_array(
+        self,
+        xs: list[str] | str,
+        zs: list[str] | str,
+    ) -> np.ndarray:
+        """Gather the locators into a single contiguous float64 block.
+
+        All columns are validated at once and missing values are handled
+        according to the NaN policy.
+
+        Parameters
+        ----------
+        xs : list[str] | str
+            X locators.
+        zs : list[str] | str
+            Z locators.
+
+        Returns
+        -------
+        np.ndarray
+            Column-major array of shape (samples, locators), X locators
+            first.
+
+        Raises
+        ------
+        ValueError
+            If a column is not composed of floats, or if it contains NaNs
+            and the NaN policy is "raise".
+        """
+        xs = [xs] if isinstance(xs, str) else list(xs)
+        zs = [zs] if isinstance(zs, str) else list(zs)
+        columns = xs + zs
+        # Assert Columns are composed of floats
+        dtypes = self.source.dtypes
+        non_floats = [c for c in columns if not is_float_dtype(dtypes[c])]
+        if non_floats:
+            msg = f"The columns {non_floats} must contain only floats."
+            raise ValueError(msg)
+        # Column-major block, each column being contiguous
+        block = np.asfortranarray(
+            self.source[columns].to_numpy(dtype=np.float64, na_value=np.nan),
+        )
+        nans = np.isnan(block)
+        if not nans.any():
+            return block
+        if self.nan_policy == "raise":
+            with_nans = [
+                column
+                for column, has_nans in zip(
+                    columns,
+                    nans.any(axis=0),
+                    strict=True,
+                )
+                if has_nans
+            ]
+            msg = f"The columns {with_nans} contain NaNs."
+            raise ValueError(msg)
+        if self.nan_policy == "drop":
+            return block[~nans.any(axis=1)]
+        # Undefined Z values are supported by the DataBase
+        return block[~nans[:, : len(xs)].any(axis=1)]
 
     def retrieve_db(self, xs: list[str] | str, zs: list[str] | str) -> Db:
         """Retrieve DataBase.
 
+        The DataBase is built directly from the contiguous block of the
+        locators, with their locators already assigned.
+
         Parameters
         ----------
         xs : list[str] | str
@@ -96,17 +207,148 @@ class DF2Db:
         Db
             DataBase.
         """
-        # Slice DataFrame
-        sliced_source = self.slice_df(xs=xs, zs=zs)
-        # Convert to DataFrame
-        database = gl.Db_fromPanda(sliced_source)
-        # Set locator(s)
-        if isinstance(xs, str):
-            database.setLocator(xs, gl.ELoc.X)
-        else:
-            database.setLocators(xs, gl.ELoc.X)
-        if isinstance(zs, str):
-            database.setLocator(zs, gl.ELoc.Z)
-        else:
-            database.setLocators(zs, gl.ELoc.Z)
-        return database
+        block = self.to_array(xs=xs, zs=zs)
+        xs = [xs] if isinstance(xs, str) else list(xs)
+        zs = [zs] if isinstance(zs, str) else list(zs)
+        locators = [f"x{i + 1}" for i in range(len(xs))] + [
+            f"z{i + 1}" for i in range(len(zs))
+        ]
+        return gl.Db.createFromSamples(
+            block.shape[0],
+            gl.ELoadBy.COLUMN,
+            block.ravel(order="F"),
+            xs + zs,
+            locators,
+            False,  # Do not add a sample rank column
+        )
+
+
+class Db2DF:
+
+    """Export Gstlearn's Db variables to Pandas' DataFrame or Arrow Table.
+
+    Variables are extracted in bulk, only for the selected samples
+    (such as the inland cells of a grid).
+    """
+
+    def __init__(self, source: Db, *, use_selection: bool = True) -> None:
+        """Instantiate the Converter.
+
+        Parameters
+        ----------
+        source : Db
+            Source DataBase, for example a DbGrid holding kriging outputs.
+        use_selection : bool, optional
+            Whether to only export the samples of the selection.
+            , by default True
+        """
+        self._db = source
+        self._use_selection = use_selection
+
+    @property
+    def source(self) -> Db:
+        """Source DataBase."""
+        return self._db
+
+    @property
+    def use_selection(self) -> bool:
+        """Whether only the selected samples are exported."""
+        return self._use_selection
+
+    def variable_names(self, names: list[str] | str) -> list[str]:
+        """Expand names and patterns into variable names.
+
+        Parameters
+        ----------
+        names : list[str] | str
+            Names or patterns (such as "*.estim") of the variables.
+
+        Returns
+        -------
+        list[str]
+            Names of the matching variables.
+
+        Raises
+        ------
+        ValueError
+            If a name or pattern does not match any variable.
+        """
+        names = [names] if isinstance(names, str) else list(names)
+        variables = []
+        for name in names:
+            matches = self.source.getNames([name])
+            if not matches:
+                msg = f"No variable matches {name}."
+                raise ValueError(msg)
+            variables += matches
+        return list(dict.fromkeys(variables))
+
+    def _extract(self, names: list[str] | str) -> tuple[list[str], np.ndarray]:
+        """Extract variables with a single call to the DataBase.
+
+        Parameters
+        ----------
+        names : list[str] | str
+            Names or patterns (such as "*.estim") of the variables.
+
+        Returns
+        -------
+        tuple[list[str], np.ndarray]
+            Names of the variables and their values, as an array of shape
+            (variables, samples).
+        """
+        variables = self.variable_names(names)
+        values = np.asarray(
+            self.source.getColumns(variables, self.use_selection),
+            dtype=np.float64,
+        )
+        return variables, values.reshape(len(variables), -1)
+
+    def to_arrays(self, names: list[str] | str) -> dict[str, np.ndarray]:
+        """Extract variables as contiguous float64 arrays.
+
+        Parameters
+        ----------
+        names : list[str] | str
+            Names or patterns (such as "*.estim") of the variables.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Values of each variable, undefined values being NaN.
+        """
+        variables, values = self._extract(names)
+        return dict(zip(variables, values, strict=True))
+
+    def retrieve_df(self, names: list[str] | str) -> DataFrame:
+        """Retrieve a DataFrame of the variables.
+
+        Parameters
+        ----------
+        names : list[str] | str
+            Names or patterns (such as "*.estim") of the variables.
+
+        Returns
+        -------
+        DataFrame
+            DataFrame with one column per variable.
+        """
+        variables, values = self._extract(names)
+        # The transposed block is column-major: the frame is not copied
+        return pd.DataFrame(values.T, columns=variables, copy=False)
+
+    def retrieve_table(self, names: list[str] | str) -> pa.Table:
+        """Retrieve an Arrow Table of the variables.
+
+        Parameters
+        ----------
+        names : list[str] | str
+            Names or patterns (such as "*.estim") of the variables.
+
+        Returns
+        -------
+        pa.Table
+            Table with one column per variable, sharing the memory of the
+            extracted arrays. Undefined values are NaN.
+        """
+        return pa.table(self.to_arrays(names))
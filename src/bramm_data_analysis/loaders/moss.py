@@ -4,6 +4,7 @@ from pathlib import Path
 
 from bramm_data_analysis.loaders._base import BaseLoader
 from bramm_data_analysis.loaders.preprocessing.moss import MossPreprocessor
+from bramm_data_analysis.loaders.reading.campaigns import MossCampaignsReader
 from bramm_data_analysis.loaders.reading.moss import MossReader
 
 
@@ -11,16 +12,65 @@ class MossLoader(BaseLoader[Path]):
 
     """Loader for Moss' data."""
 
-    def __init__(self, source: Path) -> None:
+    def __init__(
+        self,
+        source: Path,
+        cache_dir: Path | None = None,
+        float_dtype: str = "float64",
+    ) -> None:
         """Instantiate the Loader.
 
         Parameters
         ----------
         source : T
             Source object.
+        cache_dir : Path | None, optional
+            Directory in which to cache the parsed sheets.
+            If None, the workbook is parsed on every load., by default None
+        float_dtype : str, optional
+            Type of the concentrations ("float64" or "float32").
+            , by default "float64"
         """
         super().__init__(source=source)
         # Instantiate Reader with MossReader
-        self._reader = MossReader(data_path=self.source)
+        self._reader = MossReader(data_path=self.source, cache_dir=cache_dir)
         # Instantiate Preprocessor wit MossPreprocessor
-        self._preprocessor = MossPreprocessor()
+        self._preprocessor = MossPreprocessor(float_dtype=float_dtype)
+
+
+class MossCampaignsLoader(BaseLoader[list[Path]]):
+
+    """Loader for Moss' data spread over several campaign files."""
+
+    def __init__(
+        self,
+        source: list[Path],
+        cache_dir: Path | None = None,
+        max_workers: int | None = None,
+        float_dtype: str = "float64",
+    ) -> None:
+        """Instantiate the Loader.
+
+        Parameters
+        ----------
+        source : list[Path]
+            Paths to the campaign files.
+        cache_dir : Path | None, optional
+            Directory in which to cache the parsed sheets.
+            If None, the workbooks are parsed on every load., by default None
+        max_workers : int | None, optional
+            Number of processes parsing the files.
+            If None, it is set to the number of processors., by default None
+        float_dtype : str, optional
+            Type of the concentrations ("float64" or "float32").
+            , by default "float64"
+        """
+        super().__init__(source=source)
+        # Instantiate Reader with MossCampaignsReader
+        self._reader = MossCampaignsReader(
+            data_paths=self.source,
+            cache_dir=cache_dir,
+            max_workers=max_workers,
+        )
+        # Instantiate Preprocessor wit MossPreprocessor
+        self._preprocessor = MossPreprocessor(float_dtype=float_dtype)
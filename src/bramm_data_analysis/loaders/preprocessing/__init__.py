@@ -3,6 +3,8 @@
 from bramm_data_analysis.loaders.preprocessing.moss import MossPreprocessor
 from bramm_data_analysis.loaders.preprocessing.outliers.thresholds import (
     QuantileThreshold,
+    SketchQuantileThreshold,
+    ThresholdSet,
     ValueThreshold,
 )
 from bramm_data_analysis.loaders.preprocessing.rmqs import RMQSPreprocessor
@@ -10,11 +12,15 @@ from bramm_data_analysis.loaders.preprocessing.rmqs import RMQSPreprocessor
 from .outliers.outliers_removal import (
     OutlierRemoval,
 )
+from .outliers.spatial_outliers import SpatialOutlierRemoval
 
 __all__ = [
     "MossPreprocessor",
     "RMQSPreprocessor",
     "OutlierRemoval",
+    "SpatialOutlierRemoval",
     "ValueThreshold",
     "QuantileThreshold",
+    "SketchQuantileThreshold",
+    "ThresholdSet",
 ]
@@ -1,10 +1,14 @@
 """Handle Duplicates in Data."""
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterable
 from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 from pandas.core.api import DataFrame
+from scipy.sparse import coo_matrix
+from scipy.sparse.csgraph import connected_components
+from scipy.spatial import cKDTree
 
 aggregating_dict_type = dict[str, Callable[[DataFrame], DataFrame]]
 
@@ -16,8 +20,14 @@ class DuplicatesRemover:
     date_field = "date"
     longitude_field = "longitude"
     latitude_field = "latitude"
+    # Fields identifying separate sets of samples (such as campaigns),
+    # whose samples are never aggregated together
+    group_fields: tuple[str, ...] = ()
+    # Mean Earth radius, in meters
+    earth_radius = 6_371_000
 
     _remove_method = "remove"
+    _cluster_field = "_cluster"
 
     _aggregating_methods: ClassVar[aggregating_dict_type] = {
         "mean": lambda x: x.mean(),
@@ -25,10 +35,141 @@ class DuplicatesRemover:
         "median": lambda x: x.median(),
         _remove_method: None,
     }
+    # Methods which can be computed from partial aggregations of chunks
+    _reducible_methods: ClassVar[list[str]] = ["mean", "sum"]
+    # Number of chunks whose partial aggregates are buffered before
+    # being reduced together
+    _reduction_batch = 16
 
-    def __init__(self, aggregating_method: str = "mean") -> None:
-        """Instantiate the object."""
+    def __init__(
+        self,
+        aggregating_method: str = "mean",
+        *,
+        copy: bool = True,
+        tolerance: float | None = None,
+    ) -> None:
+        """Instantiate the object.
+
+        Parameters
+        ----------
+        aggregating_method : str, optional
+            Aggregation method to handle duplicates., by default "mean"
+        copy : bool, optional
+            Whether to copy the DataFrames before processing them.
+            Processing never modifies its input, so copies can be avoided
+            when the input is not modified elsewhere., by default True
+        tolerance : float | None, optional
+            Distance (in meters) under which two locations are considered
+            the same. If None, only identical coordinates are considered
+            the same., by default None
+        """
         self._method = aggregating_method
+        self._copy = copy
+        self._tolerance = tolerance
+
+    @property
+    def copy(self) -> bool:
+        """Whether DataFrames are copied before processing."""
+        return self._copy
+
+    @property
+    def aggregates(self) -> bool:
+        """Whether duplicates are aggregated before removing overlaps."""
+        return self._aggregating_methods[self.aggregating_method] is not None
+
+    @property
+    def tolerance(self) -> float | None:
+        """Distance (in meters) under which locations are the same."""
+        return self._tolerance
+
+    def spatial_clusters(self, dataframe: DataFrame) -> np.ndarray:
+        """Cluster the locations closer than the tolerance.
+
+        Two locations belong to the same cluster if they are linked by
+        a chain of locations closer than the tolerance. Neighbors are found
+        with a KD-tree, in O(n log n).
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            DataFrame containing the locations.
+
+        Returns
+        -------
+        np.ndarray
+            Cluster label of each row.
+        """
+        # Only cluster unique locations, identified by hashing
+        longitude_codes, longitude_values = pd.factorize(
+            dataframe[self.longitude_field],
+            use_na_sentinel=False,
+        )
+        latitude_codes, latitude_values = pd.factorize(
+            dataframe[self.latitude_field],
+            use_na_sentinel=False,
+        )
+        latitudes_nb = latitude_values.shape[0]
+        inverse, locations = pd.factorize(
+            longitude_codes * latitudes_nb + latitude_codes
+        )
+        longitudes = np.radians(
+            longitude_values.to_numpy(dtype=float)[locations // latitudes_nb]
+        )
+        latitudes = np.radians(
+            latitude_values.to_numpy(dtype=float)[locations % latitudes_nb]
+        )
+        # Cartesian coordinates: chords match arcs at small distances
+        points = self.earth_radius * np.column_stack(
+            [
+                np.cos(latitudes) * np.cos(longitudes),
+                np.cos(latitudes) * np.sin(longitudes),
+                np.sin(latitudes),
+            ]
+        )
+        # Locations with missing coordinates are isolated
+        located = np.isfinite(points).all(axis=1)
+        pairs = cKDTree(points[located]).query_pairs(
+            r=self.tolerance,
+            output_type="ndarray",
+        )
+        # Adjacency matrix of the locations closer than the tolerance
+        adjacency = coo_matrix(
+            (np.ones(pairs.shape[0]), (pairs[:, 0], pairs[:, 1])),
+            shape=(located.sum(), located.sum()),
+        )
+        clusters_nb, located_labels = connected_components(
+            adjacency,
+            directed=False,
+        )
+        labels = np.arange(points.shape[0]) + clusters_nb
+        labels[located] = located_labels
+        return labels[inverse]
+
+    def group_codes(self, dataframe: DataFrame) -> np.ndarray:
+        """Integer code of the space-time location of each row.
+
+        Rows sharing a code are aggregated together by `aggregate_samples`.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            DataFrame containing the samples.
+
+        Returns
+        -------
+        np.ndarray
+            Code of each row, -1 if the row has no location or date.
+        """
+        if self.tolerance is None:
+            by = [
+                dataframe[self.date_field],
+                dataframe[self.longitude_field],
+                dataframe[self.latitude_field],
+            ]
+        else:
+            by = [dataframe[self.date_field], self.spatial_clusters(dataframe)]
+        by += [dataframe[field] for field in self.group_fields]
+        return dataframe.groupby(by=by, sort=False).ngroup().to_numpy()
 
     @property
     def aggregating_method(self) -> str:
@@ -58,7 +199,18 @@ class DuplicatesRemover:
             DataFrame without Spatial overlapping.
         """
         # copy dataframe
-        to_modify = dataframe.copy()
+        to_modify = dataframe.copy() if self.copy else dataframe
+        if self.tolerance is not None:
+            clusters = self.spatial_clusters(to_modify)
+            dates = to_modify[self.date_field].reset_index(drop=True)
+            dated = dates.notna().to_numpy()
+            # Select the first sample of each cluster, then the latest
+            # sample of the clusters with dated samples
+            latest = pd.Series(np.arange(dates.size)).groupby(clusters).first()
+            latest.update(dates[dated].groupby(clusters[dated]).idxmax())
+            return to_modify.iloc[np.sort(latest.to_numpy())].reset_index(
+                drop=True
+            )
         # Sort by Date
         sorted_df = to_modify.sort_values(
             self.date_field, ascending=False, ignore_index=True
@@ -82,14 +234,111 @@ class DuplicatesRemover:
             DataFrame same-location points have been aggregated.
         """
         # copy dataframe
-        to_modify = dataframe.copy()
+        to_modify = dataframe.copy() if self.copy else dataframe
+        aggregate = self._aggregating_methods[self.aggregating_method]
+        if self.tolerance is not None:
+            return self._aggregate_clusters(to_modify, aggregate)
         # Group by Date, Longitude and Latitude
         grouped_data = to_modify.groupby(
-            by=[self.date_field, self.longitude_field, self.latitude_field]
+            by=[
+                self.date_field,
+                self.longitude_field,
+                self.latitude_field,
+                *self.group_fields,
+            ]
         )
-        aggregate = self._aggregating_methods[self.aggregating_method]
         return aggregate(grouped_data).reset_index()
 
+    def _aggregate_clusters(
+        self,
+        dataframe: DataFrame,
+        aggregate: Callable[[DataFrame], DataFrame],
+    ) -> DataFrame:
+        """Aggregate Samples taken at the same date in the same cluster.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            DataFrame to aggregate.
+        aggregate : Callable[[DataFrame], DataFrame]
+            Aggregating method.
+
+        Returns
+        -------
+        DataFrame
+            Aggregated DataFrame, located at the mean location
+            of each cluster.
+        """
+        coordinates = [self.longitude_field, self.latitude_field]
+        by = [self.date_field, self._cluster_field, *self.group_fields]
+        clustered = dataframe.assign(
+            **{self._cluster_field: self.spatial_clusters(dataframe)}
+        )
+        # Group by Date and Cluster
+        grouped_data = clustered.drop(columns=coordinates).groupby(by=by)
+        aggregated = aggregate(grouped_data)
+        aggregated[coordinates] = clustered.groupby(by=by)[coordinates].mean()
+        return (
+            aggregated.reset_index()
+            .drop(columns=self._cluster_field)
+            .reindex(columns=dataframe.columns)
+        )
+
+    def aggregate_by_codes(
+        self,
+        dataframe: DataFrame,
+        codes: np.ndarray,
+        columns: list[str],
+    ) -> DataFrame:
+        """Aggregate columns of the Samples sharing the same code.
+
+        Missing values are ignored: the aggregate of a column is only
+        missing if all the values of the group are missing.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            DataFrame to aggregate.
+        codes : np.ndarray
+            Codes of the rows, as given by `group_codes`.
+        columns : list[str]
+            Columns to aggregate, besides the date and location.
+
+        Returns
+        -------
+        DataFrame
+            Date, location, group fields and aggregated columns of each
+            group.
+        """
+        located = codes >= 0
+        grouped_data = dataframe.loc[located, columns].groupby(codes[located])
+        aggregate = self._aggregating_methods[self.aggregating_method]
+        aggregated = aggregate(grouped_data).where(grouped_data.count() > 0)
+        grouped_locations = dataframe.loc[
+            located,
+            [
+                self.date_field,
+                self.longitude_field,
+                self.latitude_field,
+                *self.group_fields,
+            ],
+        ].groupby(codes[located])
+        if self.tolerance is None:
+            locations = grouped_locations.first()
+        else:
+            # Locate aggregates at the mean location of their cluster
+            locations = grouped_locations.agg(
+                {
+                    self.date_field: "first",
+                    self.longitude_field: "mean",
+                    self.latitude_field: "mean",
+                    **dict.fromkeys(self.group_fields, "first"),
+                }
+            )
+        return pd.concat([locations, aggregated], axis=1).reset_index(
+            drop=True
+        )
+
     def process_duplicates(
         self,
         dataframe: pd.DataFrame,
@@ -108,3 +357,118 @@ class DuplicatesRemover:
         """
         aggregated = self.aggregate_samples(dataframe=dataframe)
         return self.remove_spatial_overlap(dataframe=aggregated)
+
+    def _partial_aggregate(self, dataframe: DataFrame) -> DataFrame:
+        """Compute partial aggregates of a chunk of data.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            Chunk of data.
+
+        Returns
+        -------
+        DataFrame
+            Sums and non-NaN counts of the values, for each space-time
+            location of the chunk.
+        """
+        grouped_data = dataframe.groupby(
+            by=[
+                self.date_field,
+                self.longitude_field,
+                self.latitude_field,
+                *self.group_fields,
+            ]
+        )
+        return pd.concat(
+            {"sum": grouped_data.sum(), "count": grouped_data.count()},
+            axis=1,
+        )
+
+    def _reduce_partials(self, partials: list[DataFrame]) -> DataFrame:
+        """Combine partial aggregates into a single one.
+
+        Parameters
+        ----------
+        partials : list[DataFrame]
+            Partial aggregates, as given by `_partial_aggregate`.
+
+        Returns
+        -------
+        DataFrame
+            Sums and non-NaN counts of the values, for each space-time
+            location of all partial aggregates.
+        """
+        if len(partials) == 1:
+            return partials[0]
+        levels = list(range(partials[0].index.nlevels))
+        return pd.concat(partials).groupby(level=levels).sum()
+
+    def aggregate_samples_by_chunks(
+        self,
+        chunks: Iterable[DataFrame],
+    ) -> DataFrame:
+        """Aggregate Samples taken in same space-time location, by chunks.
+
+        Only the partial aggregates of the locations are kept in memory.
+        They are buffered and reduced by batches of chunks, so that each
+        location is only re-grouped once per batch rather than once
+        per chunk.
+
+        Parameters
+        ----------
+        chunks : Iterable[DataFrame]
+            Chunks of data.
+
+        Returns
+        -------
+        DataFrame
+            DataFrame same-location points have been aggregated.
+
+        Raises
+        ------
+        ValueError
+            If the aggregating method can not be computed by chunks,
+            or if there is a tolerance.
+        """
+        if self.tolerance is not None:
+            msg = "Aggregation with a tolerance can not be computed by chunks."
+            raise ValueError(msg)
+        if self.aggregating_method not in self._reducible_methods:
+            msg = (
+                f"Aggregating method {self.aggregating_method} can not be"
+                f" computed by chunks. Use one of {self._reducible_methods}."
+            )
+            raise ValueError(msg)
+        pending: list[DataFrame] = []
+        for chunk in chunks:
+            pending.append(self._partial_aggregate(chunk))
+            if len(pending) > self._reduction_batch:
+                # Reduce the buffered partial aggregates into a single one
+                pending = [self._reduce_partials(pending)]
+        if not pending:
+            msg = "No chunk to aggregate."
+            raise ValueError(msg)
+        partials = self._reduce_partials(pending)
+        if self.aggregating_method == "sum":
+            return partials["sum"].reset_index()
+        return (partials["sum"] / partials["count"]).reset_index()
+
+    def process_duplicates_by_chunks(
+        self,
+        chunks: Iterable[DataFrame],
+    ) -> DataFrame:
+        """Correct Data according to parameters, by chunks.
+
+        Parameters
+        ----------
+        chunks : Iterable[DataFrame]
+            Chunks of data with potentially duplicated data.
+
+        Returns
+        -------
+        pd.DataFrame
+            Correct DataFrame.
+        """
+        aggregated = self.aggregate_samples_by_chunks(chunks=chunks)
+        return self.remove_spatial_overlap(dataframe=aggregated)
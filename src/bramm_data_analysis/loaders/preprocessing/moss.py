@@ -2,27 +2,77 @@
 
 from typing import ClassVar, Literal, overload
 
+import numpy as np
 import pandas as pd
 
 from bramm_data_analysis.loaders.preprocessing._base import BasePreprocessor
+from bramm_data_analysis.loaders.schemas import MOSS_SCHEMA, DatasetSchema
 
 
 class MossPreprocessor(BasePreprocessor):
 
     """Preprocessor for Moss Data."""
 
-    cols_to_set_as_float: ClassVar[list[str]] = [
-        "sodium",
-        "platinium",
-        "rhodium",
-        "antimony",
-        "strontium",
-        "vanadium",
-        "zinc",
-    ]
+    schema: ClassVar[DatasetSchema] = MOSS_SCHEMA
+    cols_to_set_as_float: ClassVar[list[str]] = MOSS_SCHEMA.censored_columns
+    censored_suffix = "_censored"
+    censoring_mark = "<"
 
-    def __init__(self) -> None:
-        """Instantiate the Preprocessor."""
+    def __init__(self, float_dtype: str = "float64") -> None:
+        """Instantiate the Preprocessor.
+
+        Parameters
+        ----------
+        float_dtype : str, optional
+            Type of the concentrations ("float64" or "float32").
+            , by default "float64"
+        """
+        self._float_dtype = float_dtype
+
+    @property
+    def float_dtype(self) -> str:
+        """Type of the concentrations."""
+        return self._float_dtype
+
+    def parse_floats(
+        self, dataframe: pd.DataFrame, columns: list[str]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Parse textual values as floats.
+
+        Values use commas as decimal separators and censored values
+        (below the detection limit) are written as "< limit". All columns
+        are parsed at once by vectorized string operations.
+
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            DataFrame containing the values.
+        columns : list[str]
+            Columns to parse.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Parsed values and censoring flags, of shape
+            (number of rows, number of columns). Censored values are set
+            to their detection limit.
+        """
+        shape = (len(columns), dataframe.shape[0])
+        # Stack all columns in a single arrow-backed string array
+        raw = dataframe[columns].to_numpy(dtype=object).ravel(order="F")
+        texts = pd.Series(raw).astype("string[pyarrow]").str.strip()
+        censored = texts.str.startswith(self.censoring_mark)
+        numbers = (
+            texts.str.lstrip(self.censoring_mark)
+            .str.lstrip()
+            .str.replace(",", ".", regex=False)
+        )
+        values = pd.to_numeric(numbers, errors="coerce").to_numpy(
+            dtype=self.float_dtype,
+            na_value=np.nan,
+        )
+        flags = censored.to_numpy(dtype=bool, na_value=False)
+        return values.reshape(shape).T, flags.reshape(shape).T
 
     @overload
     def preprocess(
@@ -62,16 +112,17 @@ class MossPreprocessor(BasePreprocessor):
         to_modify = unprocessed_data if inplace else unprocessed_data.copy()
 
         # Correct data
-
-        replace_commas = lambda x: x.replace(",", ".")
-        remove_lt = lambda x: x.replace("< ", "")
-
-        for col in self.cols_to_set_as_float:
-            if col not in to_modify.columns:
-                continue
-            to_modify[col] = to_modify[col].astype(str)
-            to_modify[col] = to_modify[col].apply(replace_commas)
-            to_modify[col] = to_modify[col].apply(remove_lt)
-            to_modify[col].astype("float64")
+        columns = [
+            col
+            for col in self.cols_to_set_as_float
+            if col in to_modify.columns
+        ]
+        if columns:
+            values, flags = self.parse_floats(to_modify, columns)
+            for i, col in enumerate(columns):
+                to_modify[col] = values[:, i]
+                to_modify[f"{col}{self.censored_suffix}"] = flags[:, i]
+        # Assign compact types to all described columns
+        self.schema.cast(to_modify, float_dtype=self.float_dtype)
 
         return None if inplace else to_modify
@@ -1,10 +1,10 @@
 """Tools to Remove Outliers."""
 
-import numpy as np
 import pandas as pd
 
 from bramm_data_analysis.loaders.preprocessing.outliers.thresholds import (
     Threshold,
+    ThresholdSet,
 )
 
 
@@ -23,17 +23,17 @@ class OutlierRemoval:
 
     def apply_thresholds(
         self,
-        *thresholds: Threshold,
+        *thresholds: Threshold | ThresholdSet,
     ) -> pd.DataFrame:
         """Apply a given list of threshold to the DataFrame.
 
+        The thresholds are compiled into a single ThresholdSet.
+
         Returns
         -------
         pd.DataFrame
             Cropped DataFrame Matching all Thresholds.
         """
-        all_checks = np.all(
-            [x.check_threshold(self.data) for x in thresholds], axis=0
-        )
+        all_checks = ThresholdSet(*thresholds).check_threshold(self.data)
 
         return self.data[all_checks]
@@ -0,0 +1,192 @@
+"""Streaming Quantile Sketches."""
+
+import hashlib
+import math
+from typing import ClassVar
+
+import numpy as np
+
+
+class QuantileSketch:
+
+    """Mergeable approximate quantiles sketch (KLL).
+
+    The sketch keeps a bounded number of values, organised in levels of
+    compactors: values of level h stand for 2**h values of the stream.
+    When a level is full, it is sorted and one value out of two is
+    promoted to the next level. Sketches built on separate parts of the
+    data can be merged.
+    """
+
+    # Capacity decay from one level to the level below
+    decay: ClassVar[float] = 2 / 3
+    # Minimal capacity of a level
+    min_capacity: ClassVar[int] = 2
+    # Capacity per unit of targeted error, the rank error remaining
+    # below the targeted error in practice
+    error_factor: ClassVar[float] = 4
+
+    def __init__(self, error: float = 0.01, seed: int | None = None) -> None:
+        """Instantiate an empty sketch.
+
+        Parameters
+        ----------
+        error : float, optional
+            Targeted error on the ranks of the quantiles, as a fraction
+            of the number of values., by default 0.01
+        seed : int | None, optional
+            Seed of the random compactions., by default None
+
+        Raises
+        ------
+        ValueError
+            If the error is not between 0 and 1.
+        """
+        if not 0 < error < 1:
+            msg = f"The error must be between 0 and 1, got {error}."
+            raise ValueError(msg)
+        self._error = error
+        self._k = math.ceil(self.error_factor / error)
+        self._rng = np.random.default_rng(seed)
+        self._levels: list[np.ndarray] = [np.empty(0)]
+        self._count = 0
+        self._min = np.inf
+        self._max = -np.inf
+
+    @property
+    def error(self) -> float:
+        """Targeted error on the ranks of the quantiles."""
+        return self._error
+
+    @property
+    def k(self) -> int:
+        """Capacity of the highest level."""
+        return self._k
+
+    @property
+    def count(self) -> int:
+        """Number of values summarized by the sketch."""
+        return self._count
+
+    @property
+    def size(self) -> int:
+        """Number of values retained by the sketch."""
+        return sum(level.size for level in self._levels)
+
+    @property
+    def digest(self) -> str:
+        """Digest of the sketch's state, identifying its fitted values."""
+        state = hashlib.sha256(repr((self.count, self.k)).encode())
+        for values in self._levels:
+            state.update(values.tobytes())
+            # Separate the levels, for their boundaries to matter
+            state.update(b"|")
+        return state.hexdigest()
+
+    def _capacity(self, level: int) -> int:
+        """Capacity of a level.
+
+        Parameters
+        ----------
+        level : int
+            Level index.
+
+        Returns
+        -------
+        int
+            Maximum number of values of the level.
+        """
+        depth = len(self._levels) - level - 1
+        return max(
+            self.min_capacity,
+            math.ceil(self.k * self.decay**depth),
+        )
+
+    def _compress(self) -> None:
+        """Compact full levels until all levels fit their capacity."""
+        level = 0
+        while level < len(self._levels):
+            values = self._levels[level]
+            if values.size <= self._capacity(level):
+                level += 1
+                continue
+            if level + 1 == len(self._levels):
+                self._levels.append(np.empty(0))
+            values = np.sort(values)
+            # Keep an odd value out, to preserve the total weight
+            odd = values.size % 2
+            kept, compacted = values[:odd], values[odd:]
+            offset = self._rng.integers(2)
+            self._levels[level] = kept
+            self._levels[level + 1] = np.concatenate(
+                [self._levels[level + 1], compacted[offset::2]],
+            )
+            # Lower levels' capacities depend on the number of levels
+            level = 0
+
+    def update(self, values: np.ndarray) -> None:
+        """Add values to the sketch, missing values being ignored.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Values to add.
+        """
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if values.size == 0:
+            return
+        self._count += values.size
+        self._min = min(self._min, values.min())
+        self._max = max(self._max, values.max())
+        self._levels[0] = np.concatenate([self._levels[0], values])
+        self._compress()
+
+    def merge(self, other: "QuantileSketch") -> None:
+        """Merge another sketch into this one.
+
+        Parameters
+        ----------
+        other : QuantileSketch
+            Sketch built on other values.
+        """
+        for level, values in enumerate(other._levels):  # noqa: SLF001
+            if level == len(self._levels):
+                self._levels.append(np.empty(0))
+            self._levels[level] = np.concatenate([self._levels[level], values])
+        self._count += other.count
+        self._min = min(self._min, other._min)  # noqa: SLF001
+        self._max = max(self._max, other._max)  # noqa: SLF001
+        self._compress()
+
+    def quantile(self, levels: list[float]) -> np.ndarray:
+        """Compute approximate quantiles of the summarized values.
+
+        Parameters
+        ----------
+        levels : list[float]
+            Quantiles levels, between 0 and 1.
+
+        Returns
+        -------
+        np.ndarray
+            Quantiles, NaN if the sketch is empty.
+        """
+        levels = np.asarray(levels, dtype=float)
+        if self.count == 0:
+            return np.full(levels.shape, np.nan)
+        values = np.concatenate(self._levels)
+        weights = np.concatenate(
+            [
+                np.full(level_values.size, 2**level)
+                for level, level_values in enumerate(self._levels)
+            ]
+        )
+        order = np.argsort(values, kind="stable")
+        values = values[order]
+        ranks = np.cumsum(weights[order])
+        positions = np.searchsorted(ranks, levels * ranks[-1], side="left")
+        quantiles = values[np.minimum(positions, values.size - 1)]
+        # Extreme quantiles are known exactly
+        quantiles = np.where(levels <= 0, self._min, quantiles)
+        return np.where(levels >= 1, self._max, quantiles)
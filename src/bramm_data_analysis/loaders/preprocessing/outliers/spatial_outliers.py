@@ -0,0 +1,265 @@
+"""Tools to Remove Spatial Outliers."""
+
+import numpy as np
+import pandas as pd
+from scipy.spatial import cKDTree
+
+
+def _nanmedian(values: np.ndarray) -> np.ndarray:
+    """Median along the last axis, ignoring missing values.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Array of shape (n, m, k).
+
+    Returns
+    -------
+    np.ndarray
+        Medians of shape (n, m), NaN where all values are missing.
+    """
+    # NaNs are sorted last
+    sorted_values = np.sort(values, axis=-1)
+    counts = (~np.isnan(values)).sum(axis=-1, keepdims=True)
+    low = np.take_along_axis(
+        sorted_values,
+        np.maximum(counts - 1, 0) // 2,
+        axis=-1,
+    )
+    high = np.take_along_axis(
+        sorted_values,
+        np.minimum(counts // 2, values.shape[-1] - 1),
+        axis=-1,
+    )
+    medians = (low[..., 0] + high[..., 0]) / 2
+    return np.where(counts[..., 0] > 0, medians, np.nan)
+
+
+class SpatialOutlierRemoval:
+
+    """Tool to Remove Local Outliers from Data.
+
+    Each sample is compared with its nearest neighbours: its robust score
+    is its deviation from the neighbours' median, scaled by the
+    neighbours' median absolute deviation (MAD). Neighbours are found
+    with a KD-tree on geocentric coordinates, in O(n log n).
+
+    The neighbours' MAD is floored by a fraction of the field's global MAD:
+    neighbours sharing the same value (such as censored values) would
+    otherwise give infinite scores to any differing value.
+    """
+
+    longitude_field = "longitude"
+    latitude_field = "latitude"
+    earth_radius = 6_371_000
+    # Scale of the MAD for it to estimate the standard deviation
+    mad_scale = 1.4826
+
+    def __init__(
+        self,
+        dataframe: pd.DataFrame,
+        *,
+        neighbors: int = 8,
+        threshold: float = 3.5,
+        mad_floor: float = 0.1,
+        block_size: int = 65_536,
+        workers: int = -1,
+    ) -> None:
+        """Instatiate Object.
+
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            DataFrame containing the samples and their locations.
+        neighbors : int, optional
+            Number of neighbours to compare each sample with., by default 8
+        threshold : float, optional
+            Absolute score above which a value is an outlier.
+            , by default 3.5
+        mad_floor : float, optional
+            Fraction of the field's global MAD under which the neighbours'
+            MAD is floored., by default 0.1
+        block_size : int, optional
+            Number of samples whose neighbourhoods are gathered at once,
+            to bound memory usage., by default 65_536
+        workers : int, optional
+            Number of threads querying the KD-tree, -1 to use all cores.
+            , by default -1
+        """
+        self._df = dataframe
+        self._neighbors = neighbors
+        self._threshold = threshold
+        self._mad_floor = mad_floor
+        self._block_size = block_size
+        self._workers = workers
+        self._neighbors_indices: np.ndarray | None = None
+
+    @property
+    def data(self) -> pd.DataFrame:
+        """DataFrame."""
+        return self._df
+
+    @property
+    def neighbors(self) -> int:
+        """Number of neighbours of each sample."""
+        return self._neighbors
+
+    @property
+    def threshold(self) -> float:
+        """Absolute score above which a value is an outlier."""
+        return self._threshold
+
+    @property
+    def mad_floor(self) -> float:
+        """Fraction of the global MAD under which local MADs are floored."""
+        return self._mad_floor
+
+    @property
+    def block_size(self) -> int:
+        """Number of samples whose neighbourhoods are gathered at once."""
+        return self._block_size
+
+    @property
+    def workers(self) -> int:
+        """Number of threads querying the KD-tree."""
+        return self._workers
+
+    def neighbors_indices(self) -> np.ndarray:
+        """Positions of the nearest neighbours of each sample.
+
+        Samples with missing coordinates have no neighbours.
+        Neighbours are computed once and shared by all fields.
+
+        Returns
+        -------
+        np.ndarray
+            Positions of shape (n, neighbors), -1 for missing neighbours.
+        """
+        if self._neighbors_indices is not None:
+            return self._neighbors_indices
+        longitudes = np.radians(
+            self.data[self.longitude_field].to_numpy(
+                dtype=float,
+                na_value=np.nan,
+            )
+        )
+        latitudes = np.radians(
+            self.data[self.latitude_field].to_numpy(
+                dtype=float,
+                na_value=np.nan,
+            )
+        )
+        points = self.earth_radius * np.column_stack(
+            [
+                np.cos(latitudes) * np.cos(longitudes),
+                np.cos(latitudes) * np.sin(longitudes),
+                np.sin(latitudes),
+            ]
+        )
+        located = np.flatnonzero(np.isfinite(points).all(axis=1))
+        indices = np.full((points.shape[0], self.neighbors), -1)
+        neighbors = min(self.neighbors, located.size - 1)
+        if neighbors > 0:
+            # The closest point is usually the sample itself
+            _, nearest = cKDTree(points[located]).query(
+                points[located],
+                k=neighbors + 1,
+                workers=self.workers,
+            )
+            is_self = nearest == np.arange(located.size)[:, None]
+            # With co-located samples, the sample may not be returned
+            is_self[~is_self.any(axis=1), -1] = True
+            nearest = nearest[~is_self].reshape(located.size, neighbors)
+            indices[located, :neighbors] = located[nearest]
+        self._neighbors_indices = indices
+        return indices
+
+    def scores(self, fields: list[str]) -> pd.DataFrame:
+        """Compute the robust local scores of several fields at once.
+
+        Parameters
+        ----------
+        fields : list[str]
+            Fields to score.
+
+        Returns
+        -------
+        pd.DataFrame
+            Score of each value, NaN for missing values, samples
+            without valid neighbours, or values differing from neighbours
+            which all share the same value when the field's global MAD
+            is zero.
+        """
+        values = np.column_stack(
+            [
+                self.data[field].to_numpy(dtype=float, na_value=np.nan)
+                for field in fields
+            ]
+        )
+        # Global MAD of each field, to floor the neighbours' MAD
+        global_medians = _nanmedian(values.T[None])
+        global_mads = self.mad_scale * _nanmedian(
+            np.abs(values.T[None] - global_medians[..., None])
+        )
+        min_mads = self.mad_floor * global_mads[0]
+        indices = self.neighbors_indices()
+        # Missing neighbours point to an additional row of NaNs
+        padded = np.vstack([values, np.full((1, len(fields)), np.nan)])
+        scores = np.empty_like(values)
+        for start in range(0, values.shape[0], self.block_size):
+            block = slice(start, start + self.block_size)
+            # Neighbours along the last axis, to sort contiguous values
+            neighbors_values = padded[indices[block]].transpose(0, 2, 1)
+            neighbors_values = np.ascontiguousarray(neighbors_values)
+            medians = _nanmedian(neighbors_values)
+            mads = self.mad_scale * _nanmedian(
+                np.abs(neighbors_values - medians[..., None])
+            )
+            mads = np.maximum(mads, min_mads)
+            deviations = values[block] - medians
+            with np.errstate(divide="ignore", invalid="ignore"):
+                scores[block] = np.where(
+                    deviations == 0,
+                    0,
+                    deviations / np.where(mads > 0, mads, np.nan),
+                )
+        return pd.DataFrame(scores, index=self.data.index, columns=fields)
+
+    def check_outliers(self, fields: list[str]) -> pd.DataFrame:
+        """Flag the local outliers of several fields.
+
+        Parameters
+        ----------
+        fields : list[str]
+            Fields to check.
+
+        Returns
+        -------
+        pd.DataFrame
+            Boolean DataFrame : True if the value is a local outlier.
+        """
+        return self.scores(fields).abs() > self.threshold
+
+    def mask_outliers(self, *fields: str) -> pd.DataFrame:
+        """Replace the local outliers of each field by missing values.
+
+        Returns
+        -------
+        pd.DataFrame
+            DataFrame whose outlier values are missing.
+        """
+        outliers = self.check_outliers(list(fields))
+        masked = self.data.copy()
+        masked[list(fields)] = masked[list(fields)].mask(outliers)
+        return masked
+
+    def remove_outliers(self, *fields: str) -> pd.DataFrame:
+        """Remove the samples which are local outliers for any field.
+
+        Returns
+        -------
+        pd.DataFrame
+            Cropped DataFrame without local outliers.
+        """
+        outliers = self.check_outliers(list(fields))
+        return self.data[~outliers.any(axis=1).to_numpy()]
@@ -1,14 +1,26 @@
 """Thresholds."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from typing import ClassVar
 
+import numpy as np
 import pandas as pd
 
+from bramm_data_analysis.loaders.preprocessing.outliers.sketches import (
+    QuantileSketch,
+)
+
 
 class Threshold(ABC):
 
     """Threshold."""
 
+    # Whether the threshold can be checked on chunks of the data
+    chunkable: ClassVar[bool] = True
+    # Whether the threshold is fitted on a first pass over the data
+    fittable: ClassVar[bool] = False
+
     def __init__(self, *, field: str, lower: float, upper: float) -> None:
         """Instantiate a Threshold.
 
@@ -40,7 +52,61 @@ class Threshold(ABC):
         """Upper Bound of the Threshold."""
         return self._upper
 
+    @property
+    def specification(self) -> tuple[str, str, float, float]:
+        """Specification of the Threshold: type, field and bounds."""
+        return (self.__class__.__name__, self.field, self.lower, self.upper)
+
+    @property
+    def fields(self) -> list[str]:
+        """Fields on which the Threshold is applied."""
+        return [self.field]
+
+    def __and__(self, other: "Threshold | ThresholdSet") -> "ThresholdSet":
+        """Compose Thresholds which must all be satisfied."""
+        return ThresholdSet(self, other, combination="all")
+
+    def __or__(self, other: "Threshold | ThresholdSet") -> "ThresholdSet":
+        """Compose Thresholds of which at least one must be satisfied."""
+        return ThresholdSet(self, other, combination="any")
+
     @abstractmethod
+    def compute_bounds(self, values: np.ndarray) -> tuple[float, float]:
+        """Compute the bounds of the Threshold for given values.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Values of the field, missing values being NaN.
+
+        Returns
+        -------
+        tuple[float, float]
+            Lower and upper bounds.
+        """
+
+    def check_values(
+        self,
+        values: np.ndarray,
+        bounds: tuple[float, float],
+    ) -> np.ndarray:
+        """Verify the Threshold for given values.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Values of the field, missing values being NaN.
+        bounds : tuple[float, float]
+            Lower and upper bounds.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask : True if the value matches both Thresholds.
+        """
+        lower, upper = bounds
+        return (values >= lower) & (values <= upper)
+
     def check_threshold(self, dataframe: pd.DataFrame) -> pd.Series:
         """Verify the Threshold for a given DataFrame.
 
@@ -54,38 +120,370 @@ class Threshold(ABC):
         pd.Series
             Boolean Series : True if the value matches both Thresholds.
         """
+        values = field_values(dataframe, self.field)
+        return pd.Series(
+            self.check_values(values, self.compute_bounds(values)),
+            index=dataframe.index,
+        )
 
 
 class ValueThreshold(Threshold):
 
     """Value Threshold."""
 
-    def check_threshold(self, dataframe: pd.DataFrame) -> pd.Series:
-        """Verify the Threshold for a given DataFrame.
+    def compute_bounds(
+        self,
+        values: np.ndarray,  # noqa: ARG002
+    ) -> tuple[float, float]:
+        """Compute the bounds of the Threshold for given values.
 
         Parameters
         ----------
-        dataframe : pd.DataFrame
-            DataFrame to check.
+        values : np.ndarray
+            Values of the field, missing values being NaN.
 
         Returns
         -------
-        pd.Series
-            Boolean Series : True if the value matches both Thresholds.
+        tuple[float, float]
+            Lower and upper bounds.
         """
-        field_values = dataframe[self.field].astype(float)
-        match_lower_bound = field_values >= self.lower
-        match_upper_bound = field_values <= self.upper
-
-        return match_lower_bound & match_upper_bound
+        return self.lower, self.upper
 
 
 class QuantileThreshold(Threshold):
 
     """Quantile Threshold."""
 
-    def check_threshold(self, dataframe: pd.DataFrame) -> pd.Series:
-        """Verify the Threshold for a given DataFrame.
+    chunkable = False
+
+    def compute_bounds(self, values: np.ndarray) -> tuple[float, float]:
+        """Compute the bounds of the Threshold for given values.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Values of the field, missing values being NaN.
+
+        Returns
+        -------
+        tuple[float, float]
+            Lower and upper bounds.
+        """
+        lower, upper = quantiles(values, [self.lower, self.upper])
+        return lower, upper
+
+
+class SketchQuantileThreshold(Threshold):
+
+    """Approximate Quantile Threshold, computed with a streaming sketch.
+
+    The sketch can be fitted on chunks of the data with `partial_fit`,
+    or on separate workers whose thresholds are then merged. If the
+    sketch is not fitted, it is built from the checked values.
+    """
+
+    fittable = True
+
+    def __init__(
+        self,
+        *,
+        field: str,
+        lower: float,
+        upper: float,
+        error: float = 0.01,
+        seed: int | None = None,
+    ) -> None:
+        """Instantiate a SketchQuantileThreshold.
+
+        Parameters
+        ----------
+        field : str
+            Field on which to apply the threshold.
+        lower : float
+            Quantile level of the lower bound.
+        upper : float
+            Quantile level of the upper bound.
+        error : float, optional
+            Targeted error on the ranks of the quantiles., by default 0.01
+        seed : int | None, optional
+            Seed of the sketch's random compactions., by default None
+        """
+        super().__init__(field=field, lower=lower, upper=upper)
+        self._error = error
+        self._seed = seed
+        self._sketch = QuantileSketch(error=error, seed=seed)
+
+    @property
+    def error(self) -> float:
+        """Targeted error on the ranks of the quantiles."""
+        return self._error
+
+    @property
+    def sketch(self) -> QuantileSketch:
+        """Quantile Sketch of the field."""
+        return self._sketch
+
+    @property
+    def seed(self) -> int | None:
+        """Seed of the sketch's random compactions."""
+        return self._seed
+
+    @property
+    def fitted(self) -> bool:
+        """Whether the sketch has been fitted on some values."""
+        return self.sketch.count > 0
+
+    @property
+    def specification(
+        self,
+    ) -> tuple[str, str, float, float, float, int | None, str | None]:
+        """Specification of the Threshold.
+
+        Type, field, bounds, error, seed and digest of the fitted sketch
+        (None if the sketch is not fitted).
+        """
+        digest = self.sketch.digest if self.fitted else None
+        return (*super().specification, self.error, self.seed, digest)
+
+    def unfitted_copy(self) -> "SketchQuantileThreshold":
+        """Copy of the Threshold with an empty sketch.
+
+        Returns
+        -------
+        SketchQuantileThreshold
+            Threshold with the same parameters and an empty sketch.
+        """
+        return SketchQuantileThreshold(
+            field=self.field,
+            lower=self.lower,
+            upper=self.upper,
+            error=self.error,
+            seed=self.seed,
+        )
+
+    def reset(self) -> None:
+        """Discard the values the sketch has been fitted on."""
+        self._sketch = QuantileSketch(error=self.error, seed=self._seed)
+
+    def partial_fit(self, dataframe: pd.DataFrame) -> None:
+        """Add the values of a chunk to the sketch.
+
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            Chunk of the data.
+        """
+        self._sketch.update(field_values(dataframe, self.field))
+
+    def merge(self, other: "SketchQuantileThreshold") -> None:
+        """Merge the sketch of a threshold fitted on other data.
+
+        Parameters
+        ----------
+        other : SketchQuantileThreshold
+            Threshold fitted on other data.
+        """
+        self._sketch.merge(other.sketch)
+
+    def compute_bounds(self, values: np.ndarray) -> tuple[float, float]:
+        """Compute the bounds of the Threshold for given values.
+
+        Parameters
+        ----------
+        values : np.ndarray
+            Values of the field, missing values being NaN.
+
+        Returns
+        -------
+        tuple[float, float]
+            Lower and upper bounds.
+        """
+        sketch = self.sketch
+        if sketch.count == 0:
+            sketch = QuantileSketch(error=self.error, seed=self._seed)
+            sketch.update(values)
+        lower, upper = sketch.quantile([self.lower, self.upper])
+        return lower, upper
+
+
+def field_values(dataframe: pd.DataFrame, field: str) -> np.ndarray:
+    """Values of a field as floats, missing values being NaN.
+
+    Parameters
+    ----------
+    dataframe : pd.DataFrame
+        DataFrame containing the field.
+    field : str
+        Field name.
+
+    Returns
+    -------
+    np.ndarray
+        Values of the field.
+    """
+    return dataframe[field].to_numpy(dtype=float, na_value=np.nan)
+
+
+def quantiles(values: np.ndarray, levels: list[float]) -> np.ndarray:
+    """Compute several quantiles of values with a single partition.
+
+    Missing values are ignored, as in `pd.Series.quantile`.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Values, missing values being NaN.
+    levels : list[float]
+        Quantiles levels, between 0 and 1.
+
+    Returns
+    -------
+    np.ndarray
+        Quantiles, NaN if all values are missing.
+    """
+    present = values[~np.isnan(values)]
+    if present.size == 0:
+        return np.full(len(levels), np.nan)
+    return np.quantile(present, levels)
+
+
+class ThresholdSet:
+
+    """Composition of Thresholds, evaluated as a single mask.
+
+    Thresholds are compiled by field: each field is converted to floats
+    only once and all the quantiles used on a field are computed with a
+    single partition of its values. Identical Thresholds are only
+    evaluated once.
+    """
+
+    combinations: ClassVar[list[str]] = ["all", "any"]
+
+    def __init__(
+        self,
+        *thresholds: "Threshold | ThresholdSet",
+        combination: str = "all",
+    ) -> None:
+        """Instantiate a ThresholdSet.
+
+        Parameters
+        ----------
+        *thresholds : Threshold | ThresholdSet
+            Thresholds (or sets of Thresholds) to compose.
+        combination : str, optional
+            "all" if all Thresholds must be satisfied, "any" if at least
+            one of them must be satisfied., by default "all"
+
+        Raises
+        ------
+        ValueError
+            If the combination is not supported.
+        """
+        if combination not in self.combinations:
+            msg = (
+                f"Unsupported combination: {combination}."
+                f" Options are: {', '.join(self.combinations)}."
+            )
+            raise ValueError(msg)
+        self._thresholds = thresholds
+        self._combination = combination
+        # Compile the Thresholds: unique leaves, grouped by field
+        self._program: dict[str, dict[tuple, Threshold]] = {}
+        for leaf in self.leaves():
+            leaves = self._program.setdefault(leaf.field, {})
+            leaves.setdefault(leaf.specification, leaf)
+        self._rejections: dict[tuple, int] = {}
+
+    @property
+    def thresholds(self) -> tuple["Threshold | ThresholdSet", ...]:
+        """Composed Thresholds."""
+        return self._thresholds
+
+    @property
+    def combination(self) -> str:
+        """Combination of the Thresholds: 'all' or 'any'."""
+        return self._combination
+
+    @property
+    def fields(self) -> list[str]:
+        """Fields on which the Thresholds are applied."""
+        return list(self._program)
+
+    @property
+    def chunkable(self) -> bool:
+        """Whether the Thresholds can be checked on chunks of the data."""
+        return all(leaf.chunkable for leaf in self.leaves())
+
+    @property
+    def specification(self) -> tuple:
+        """Specification of the set: combination and Thresholds."""
+        return (
+            self.__class__.__name__,
+            self.combination,
+            tuple(threshold.specification for threshold in self.thresholds),
+        )
+
+    @property
+    def rejections(self) -> dict[tuple, int]:
+        """Number of rows rejected by each Threshold during the last check.
+
+        Thresholds are identified by their specification.
+        """
+        return dict(self._rejections)
+
+    def __and__(self, other: "Threshold | ThresholdSet") -> "ThresholdSet":
+        """Compose Thresholds which must all be satisfied."""
+        return ThresholdSet(self, other, combination="all")
+
+    def __or__(self, other: "Threshold | ThresholdSet") -> "ThresholdSet":
+        """Compose Thresholds of which at least one must be satisfied."""
+        return ThresholdSet(self, other, combination="any")
+
+    def map_leaves(
+        self,
+        function: Callable[[Threshold], Threshold],
+    ) -> "ThresholdSet":
+        """Create a set of the same composition with replaced Thresholds.
+
+        Parameters
+        ----------
+        function : Callable[[Threshold], Threshold]
+            Function returning the replacement of a Threshold.
+
+        Returns
+        -------
+        ThresholdSet
+            Set whose Thresholds are replaced, recursively.
+        """
+        return ThresholdSet(
+            *(
+                threshold.map_leaves(function)
+                if isinstance(threshold, ThresholdSet)
+                else function(threshold)
+                for threshold in self.thresholds
+            ),
+            combination=self.combination,
+        )
+
+    def leaves(self) -> Iterator[Threshold]:
+        """Iterate over the Thresholds composing the set, recursively.
+
+        Yields
+        ------
+        Threshold
+            Composing Threshold.
+        """
+        for threshold in self.thresholds:
+            if isinstance(threshold, ThresholdSet):
+                yield from threshold.leaves()
+            else:
+                yield threshold
+
+    def _check_leaves(
+        self,
+        dataframe: pd.DataFrame,
+    ) -> dict[tuple, np.ndarray]:
+        """Evaluate each unique Threshold of the set.
 
         Parameters
         ----------
@@ -94,15 +492,83 @@ class QuantileThreshold(Threshold):
 
         Returns
         -------
-        pd.Series
-            Boolean Series : True if the value matches both Thresholds.
+        dict[tuple, np.ndarray]
+            Boolean mask of each Threshold, by specification.
         """
-        field_values = dataframe[self.field].astype(float)
+        masks = {}
+        for field, leaves in self._program.items():
+            values = field_values(dataframe, field)
+            # Compute all the quantiles of the field at once
+            levels = sorted(
+                {
+                    level
+                    for leaf in leaves.values()
+                    if isinstance(leaf, QuantileThreshold)
+                    for level in (leaf.lower, leaf.upper)
+                }
+            )
+            bounds_by_level = dict(
+                zip(levels, quantiles(values, levels), strict=True),
+            )
+            for specification, leaf in leaves.items():
+                if isinstance(leaf, QuantileThreshold):
+                    bounds = (
+                        bounds_by_level[leaf.lower],
+                        bounds_by_level[leaf.upper],
+                    )
+                else:
+                    bounds = leaf.compute_bounds(values)
+                masks[specification] = leaf.check_values(values, bounds)
+        return masks
+
+    def _combine(
+        self,
+        masks: dict[tuple, np.ndarray],
+        size: int,
+    ) -> np.ndarray:
+        """Combine the masks of the Thresholds of the set.
 
-        lower_bound = field_values.quantile(self.lower)
-        upper_bound = field_values.quantile(self.upper)
+        Parameters
+        ----------
+        masks : dict[tuple, np.ndarray]
+            Boolean mask of each Threshold, by specification.
+        size : int
+            Number of rows.
 
-        match_lower_bound = field_values >= lower_bound
-        match_upper_bound = field_values <= upper_bound
+        Returns
+        -------
+        np.ndarray
+            Combined boolean mask.
+        """
+        is_all = self.combination == "all"
+        combined = np.full(size, fill_value=is_all)
+        for threshold in self.thresholds:
+            if isinstance(threshold, ThresholdSet):
+                mask = threshold._combine(masks, size)  # noqa: SLF001
+            else:
+                mask = masks[threshold.specification]
+            if is_all:
+                combined &= mask
+            else:
+                combined |= mask
+        return combined
 
-        return match_lower_bound & match_upper_bound
+    def check_threshold(self, dataframe: pd.DataFrame) -> np.ndarray:
+        """Verify the Thresholds for a given DataFrame.
+
+        Parameters
+        ----------
+        dataframe : pd.DataFrame
+            DataFrame to check.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask : True if the row satisfies the composition.
+        """
+        masks = self._check_leaves(dataframe)
+        self._rejections = {
+            specification: int((~mask).sum())
+            for specification, mask in masks.items()
+        }
+        return self._combine(masks, dataframe.shape[0])
@@ -1,21 +1,35 @@
 """RMQS Preprocessing Tools."""
 
 
-from typing import Literal, overload
+from typing import ClassVar, Literal, overload
 
 import pandas as pd
 
 from bramm_data_analysis.loaders.preprocessing._base import BasePreprocessor
+from bramm_data_analysis.loaders.schemas import RMQS_SCHEMA, DatasetSchema
 
 
 class RMQSPreprocessor(BasePreprocessor):
 
     """Preprocessor for RMQS Data."""
 
-    date_column_to_convert = "date_complete"
+    schema: ClassVar[DatasetSchema] = RMQS_SCHEMA
 
-    def __init__(self) -> None:
-        """Instantiate the Preprocessor."""
+    def __init__(self, float_dtype: str = "float64") -> None:
+        """Instantiate the Preprocessor.
+
+        Parameters
+        ----------
+        float_dtype : str, optional
+            Type of the concentrations ("float64" or "float32").
+            , by default "float64"
+        """
+        self._float_dtype = float_dtype
+
+    @property
+    def float_dtype(self) -> str:
+        """Type of the concentrations."""
+        return self._float_dtype
 
     @overload
     def preprocess(
@@ -54,10 +68,7 @@ class RMQSPreprocessor(BasePreprocessor):
         """
         to_modify = unprocessed_data if inplace else unprocessed_data.copy()
 
-        # Correct data
-
-        date_column = to_modify[self.date_column_to_convert]
-
-        to_modify[self.date_column_to_convert] = pd.to_datetime(date_column)
+        # Parse dates and assign compact types to all described columns
+        self.schema.cast(to_modify, float_dtype=self.float_dtype)
 
         return None if inplace else to_modify
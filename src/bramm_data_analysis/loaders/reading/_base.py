@@ -1,15 +1,22 @@
 """Reading Objects."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from pathlib import Path
+from typing import ClassVar
 
 from pandas.core.api import DataFrame, Index
 
+from bramm_data_analysis.loaders.reading.cache import compute_digest
+
 
 class BaseReader(ABC):
 
     """Base Class for Readers."""
 
+    # Fields kept by the filtering, whichever fields are requested
+    kept_fields: ClassVar[list[str]] = []
+
     def __init__(self, data_path: Path | None) -> None:
         """Instantiate the Reader.
 
@@ -25,6 +32,16 @@ class BaseReader(ABC):
         """Data Path."""
         return self._path
 
+    def fingerprint(self) -> str:
+        """Content hash of the source file.
+
+        Returns
+        -------
+        str
+            Hash identifying the current content of the source.
+        """
+        return compute_digest(self.data_path)
+
     def raise_if_inexistent_column(
         self, df_columns: Index, fields: list[str]
     ) -> None:
@@ -61,7 +78,8 @@ class BaseReader(ABC):
         dataframe : DataFrame
             DataFrame to filter.
         fields : list[str]
-            List of fields to conserve. If empty, return the same DataFrame.
+            List of fields to conserve, besides the kept fields.
+            If empty, return the same DataFrame.
 
         Returns
         -------
@@ -70,6 +88,7 @@ class BaseReader(ABC):
         """
         if not fields:
             return dataframe
+        fields = list(dict.fromkeys([*fields, *self.kept_fields]))
         self.raise_if_inexistent_column(
             df_columns=dataframe.columns,
             fields=fields,
@@ -77,21 +96,79 @@ class BaseReader(ABC):
         # Filter Columns
         return dataframe.filter(fields)
 
-    def retrieve_and_filter(self, fields: list[str]) -> DataFrame:
+    def retrieve_and_filter(
+        self,
+        fields: list[str],
+        dtypes: dict[str, str] | None = None,
+    ) -> DataFrame:
         """Retrieve the DataFrame and Filter its columns.
 
+        Only the requested fields are parsed from the source file.
+
         Parameters
         ----------
         fields : list[str]
             List of fields to conserve. If empty, return the same DataFrame.
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the fields when parsing., by default None
 
         Returns
         -------
         DataFrame
             Final DataFrame.
         """
-        return self.filter_dataframe(self.retrieve(), fields=fields)
+        dataframe = self.retrieve(fields=fields, dtypes=dtypes)
+        return self.filter_dataframe(dataframe, fields=fields)
 
     @abstractmethod
-    def retrieve(self) -> DataFrame:
-        """Retrieve data from the source file."""
+    def retrieve(
+        self,
+        fields: list[str] | None = None,
+        dtypes: dict[str, str] | None = None,
+    ) -> DataFrame:
+        """Retrieve data from the source file.
+
+        Parameters
+        ----------
+        fields : list[str] | None, optional
+            Fields to parse. If None or empty, all fields are parsed.
+            , by default None
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the fields when parsing., by default None
+
+        Returns
+        -------
+        DataFrame
+            DataFrame.
+        """
+
+    def iter_chunks(
+        self,
+        chunksize: int,
+        fields: list[str] | None = None,
+        dtypes: dict[str, str] | None = None,
+    ) -> Iterator[DataFrame]:
+        """Iterate over chunks of the data from the source file.
+
+        Parameters
+        ----------
+        chunksize : int
+            Number of rows of each chunk.
+        fields : list[str] | None, optional
+            Fields to parse. If None or empty, all fields are parsed.
+            , by default None
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the fields when parsing., by default None
+
+        Yields
+        ------
+        DataFrame
+            Chunk of data.
+
+        Raises
+        ------
+        NotImplementedError
+            If the reader can not read its source by chunks.
+        """
+        msg = f"{self.__class__.__name__} can not read data by chunks."
+        raise NotImplementedError(msg)
@@ -0,0 +1,244 @@
+"""Columnar Cache for Parsed Sheets."""
+
+import hashlib
+import os
+import shutil
+import warnings
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+import pyarrow as pa
+from pandas.core.api import DataFrame
+from pyarrow import feather
+
+
+@lru_cache(maxsize=128)
+def _digest_file(
+    data_path: Path,
+    mtime_ns: int,  # noqa: ARG001
+    size: int,  # noqa: ARG001
+) -> str:
+    """Compute the content hash of a file, memoized on its stats.
+
+    Parameters
+    ----------
+    data_path : Path
+        Resolved path to the file to hash.
+    mtime_ns : int
+        Modification time of the file, part of the memoization key.
+    size : int
+        Size of the file, part of the memoization key.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 digest of the file's content.
+    """
+    with data_path.open("rb") as file:
+        return hashlib.file_digest(file, "sha256").hexdigest()
+
+
+def compute_digest(data_path: Path | str) -> str:
+    """Compute the content hash of a file.
+
+    The hash is only recomputed if the file's size or modification time
+    changed since the last call.
+
+    Parameters
+    ----------
+    data_path : Path | str
+        Path to the file to hash.
+
+    Returns
+    -------
+    str
+        Hexadecimal SHA-256 digest of the file's content.
+    """
+    path = Path(data_path).resolve()
+    stat = path.stat()
+    return _digest_file(path, stat.st_mtime_ns, stat.st_size)
+
+
+class SheetCache:
+
+    """On-disk Cache of parsed sheets, stored as Feather files.
+
+    Entries are stored in `<cache_dir>/<file name>/<digest>/<sheet>.feather`.
+    Since the digest is computed from the source file's content, modifying
+    the source file invalidates the entries and the stale ones are removed
+    when the new ones are written.
+    """
+
+    extension = ".feather"
+
+    def __init__(self, cache_dir: Path | str) -> None:
+        """Instantiate the Cache.
+
+        Parameters
+        ----------
+        cache_dir : Path | str
+            Directory in which to store the cached sheets.
+        """
+        self._dir = Path(cache_dir)
+
+    @property
+    def cache_dir(self) -> Path:
+        """Cache Directory."""
+        return self._dir
+
+    def digest(self, data_path: Path | str) -> str:
+        """Content hash of a source file.
+
+        Parameters
+        ----------
+        data_path : Path | str
+            Path to the source file.
+
+        Returns
+        -------
+        str
+            Content hash of the file.
+        """
+        return compute_digest(data_path)
+
+    def _entry_directory(self, data_path: Path | str) -> Path:
+        """Directory containing the entries of a given source file.
+
+        Parameters
+        ----------
+        data_path : Path | str
+            Path to the source file.
+
+        Returns
+        -------
+        Path
+            Directory of the entries for the file's current content.
+        """
+        return self.cache_dir / Path(data_path).name / self.digest(data_path)
+
+    def entry_path(self, data_path: Path | str, sheet_name: str | int) -> Path:
+        """Path of the cached version of a sheet.
+
+        Parameters
+        ----------
+        data_path : Path | str
+            Path to the source file.
+        sheet_name : str | int
+            Name (or position) of the sheet.
+
+        Returns
+        -------
+        Path
+            Path to the Feather file.
+        """
+        directory = self._entry_directory(data_path)
+        return directory / f"{sheet_name}{self.extension}"
+
+    def contains(self, data_path: Path | str, sheet_name: str | int) -> bool:
+        """Whether a sheet is cached for the current source content.
+
+        Parameters
+        ----------
+        data_path : Path | str
+            Path to the source file.
+        sheet_name : str | int
+            Name (or position) of the sheet.
+
+        Returns
+        -------
+        bool
+            True if the sheet can be loaded from the cache.
+        """
+        return self.entry_path(data_path, sheet_name).is_file()
+
+    def load(
+        self,
+        data_path: Path | str,
+        sheet_name: str | int,
+        columns: list[str] | None = None,
+    ) -> DataFrame:
+        """Load a sheet from the cache.
+
+        Parameters
+        ----------
+        data_path : Path | str
+            Path to the source file.
+        sheet_name : str | int
+            Name (or position) of the sheet.
+        columns : list[str] | None, optional
+            Columns to load. Columns which are not in the sheet are ignored.
+            If None, all columns are loaded., by default None
+
+        Returns
+        -------
+        DataFrame
+            Cached sheet.
+        """
+        table = feather.read_table(
+            self.entry_path(data_path, sheet_name),
+            memory_map=True,
+        )
+        if columns is not None:
+            # Projection on a memory-mapped table does not copy any data
+            table = table.select(
+                [name for name in table.column_names if name in columns]
+            )
+        dataframe = table.to_pandas()
+        # Arrow restores missing strings as None, Excel parsing gives NaNs
+        objects = dataframe.select_dtypes(include="object").columns
+        dataframe[objects] = dataframe[objects].fillna(np.nan)
+        return dataframe
+
+    def save(
+        self,
+        data_path: Path | str,
+        sheet_name: str | int,
+        dataframe: DataFrame,
+    ) -> bool:
+        """Save a sheet in the cache.
+
+        Entries computed from a previous version of the source file
+        are removed.
+
+        Parameters
+        ----------
+        data_path : Path | str
+            Path to the source file.
+        sheet_name : str | int
+            Name (or position) of the sheet.
+        dataframe : DataFrame
+            Parsed sheet.
+
+        Returns
+        -------
+        bool
+            True if the sheet has been cached, False if its content
+            could not be stored in a columnar format.
+        """
+        entry_path = self.entry_path(data_path, sheet_name)
+        entry_dir = entry_path.parent
+        # Remove entries of outdated versions of the file
+        for other_dir in entry_dir.parent.glob("*"):
+            if other_dir != entry_dir:
+                shutil.rmtree(other_dir, ignore_errors=True)
+        entry_dir.mkdir(parents=True, exist_ok=True)
+        # Write to a temporary file first to never expose partial entries
+        tmp_path = entry_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            feather.write_feather(
+                dataframe.reset_index(drop=True),
+                tmp_path,
+                compression="uncompressed",
+            )
+        except (pa.ArrowInvalid, pa.ArrowTypeError) as error:
+            tmp_path.unlink(missing_ok=True)
+            msg = f"Sheet {sheet_name} can not be cached: {error}"
+            warnings.warn(msg, stacklevel=2)
+            return False
+        tmp_path.replace(entry_path)
+        return True
+
+    def clear(self) -> None:
+        """Remove all entries from the cache."""
+        shutil.rmtree(self.cache_dir, ignore_errors=True)
@@ -0,0 +1,174 @@
+"""Multi-campaign reading tools."""
+
+import hashlib
+import re
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from pathlib import Path
+from typing import ClassVar
+
+import pandas as pd
+from pandas.core.api import DataFrame
+
+from bramm_data_analysis.loaders.reading._base import BaseReader
+from bramm_data_analysis.loaders.reading.cache import compute_digest
+from bramm_data_analysis.loaders.reading.moss import MossReader
+
+
+def _retrieve_campaign(
+    data_path: Path,
+    fields: list[str] | None,
+    dtypes: dict[str, str] | None,
+    cache_dir: Path | None,
+) -> DataFrame:
+    """Retrieve the data of a single campaign file.
+
+    Parameters
+    ----------
+    data_path : Path
+        Path to the campaign's workbook.
+    fields : list[str] | None
+        Fields to retrieve. If None or empty, all columns are loaded.
+    dtypes : dict[str, str] | None
+        Types to assign to the columns.
+    cache_dir : Path | None
+        Directory in which to cache the parsed sheets.
+
+    Returns
+    -------
+    DataFrame
+        Campaign's DataFrame.
+    """
+    reader = MossReader(data_path=data_path, cache_dir=cache_dir)
+    return reader.retrieve(fields=fields, dtypes=dtypes)
+
+
+class MossCampaignsReader(BaseReader):
+
+    """Reader for several Moss campaign files."""
+
+    campaign_field = "campaign"
+    year_field = "year"
+    kept_fields: ClassVar[list[str]] = [campaign_field, year_field]
+    # Year of a campaign: last 4-digit number of its file name
+    _year_pattern = re.compile(r"(?<!\d)(\d{4})(?!\d)")
+
+    def __init__(
+        self,
+        data_paths: list[Path],
+        cache_dir: Path | None = None,
+        max_workers: int | None = None,
+    ) -> None:
+        """Instantiate the Reader.
+
+        Parameters
+        ----------
+        data_paths : list[Path]
+            Paths to the campaign files.
+        cache_dir : Path | None, optional
+            Directory in which to cache the parsed sheets.
+            If None, the workbooks are parsed on every load., by default None
+        max_workers : int | None, optional
+            Number of processes parsing the files.
+            If None, it is set to the number of processors., by default None
+        """
+        super().__init__(data_path=None)
+        self._paths = [Path(path) for path in data_paths]
+        self._cache_dir = cache_dir
+        self._max_workers = max_workers
+
+    @property
+    def data_paths(self) -> list[Path]:
+        """Paths to the campaign files."""
+        return self._paths
+
+    def campaign_year(self, data_path: Path) -> int:
+        """Year of a campaign, parsed from the name of its file.
+
+        Parameters
+        ----------
+        data_path : Path
+            Path to the campaign file.
+
+        Returns
+        -------
+        int
+            Year of the campaign.
+
+        Raises
+        ------
+        ValueError
+            If the file name does not contain a year.
+        """
+        years = self._year_pattern.findall(data_path.stem)
+        if not years:
+            msg = f"No campaign year in the file name of {data_path}."
+            raise ValueError(msg)
+        return int(years[-1])
+
+    def fingerprint(self) -> str:
+        """Content hash of all campaign files.
+
+        Returns
+        -------
+        str
+            Hash identifying the current content of the campaign files.
+        """
+        digests = [compute_digest(path) for path in self.data_paths]
+        return hashlib.sha256("".join(digests).encode()).hexdigest()
+
+    def retrieve(
+        self,
+        fields: list[str] | None = None,
+        dtypes: dict[str, str] | None = None,
+    ) -> DataFrame:
+        """Retrieve Data from all campaign files.
+
+        Files are parsed in parallel processes. Columns missing in some
+        files are filled with NaNs.
+
+        Parameters
+        ----------
+        fields : list[str] | None, optional
+            Fields to retrieve. If None or empty, all columns are loaded.
+            , by default None
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the columns., by default None
+
+        Returns
+        -------
+        DataFrame
+            Concatenated DataFrame, with the campaign (file name) and
+            the campaign year of each row.
+
+        Raises
+        ------
+        ValueError
+            If there is no file to read.
+        """
+        if not self.data_paths:
+            msg = "No campaign file to read."
+            raise ValueError(msg)
+        years = [self.campaign_year(path) for path in self.data_paths]
+        with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+            campaigns = list(
+                executor.map(
+                    _retrieve_campaign,
+                    self.data_paths,
+                    repeat(fields),
+                    repeat(dtypes),
+                    repeat(self._cache_dir),
+                )
+            )
+        # Concatenate campaigns, missing columns are filled with NaNs
+        return pd.concat(
+            [
+                dataframe.assign(
+                    **{self.campaign_field: path.stem, self.year_field: year}
+                )
+                for path, year, dataframe in zip(
+                    self.data_paths, years, campaigns, strict=True
+                )
+            ],
+            ignore_index=True,
+        )
@@ -5,6 +5,8 @@ from pathlib import Path
 import pandas as pd
 from pandas import DataFrame
 
+from bramm_data_analysis.loaders.reading.cache import SheetCache
+
 
 class ExcelReader:
 
@@ -15,6 +17,7 @@ class ExcelReader:
         column_name_mapping: dict[str, str] | None = None,
         sheet_name: str | int = 0,
         skiprows: int | list[int] | None = None,
+        cache: SheetCache | None = None,
     ) -> None:
         """Reader Initialisation.
 
@@ -26,12 +29,16 @@ class ExcelReader:
             Name or position of the sheet to load., by default 0
         skiprows: int | list[int] | None, optional
             Rows to skip whend loading., by default None
+        cache: SheetCache | None, optional
+            Cache to store the parsed sheet in.
+            If None, the file is parsed on every load., by default None
         """
         if column_name_mapping is None:
             column_name_mapping = {}
         self._column_mapping = column_name_mapping
         self._sheet_name = sheet_name
         self._skiprows = skiprows
+        self._cache = cache
 
     @property
     def columns_mapping(self) -> dict[str, str]:
@@ -60,24 +67,125 @@ class ExcelReader:
     def skiprows(self, skiprows: int | list[int]) -> None:
         self._skiprows = skiprows
 
-    def load(self, data_path: Path | str) -> DataFrame:
+    @property
+    def cache(self) -> SheetCache | None:
+        """Cache for parsed sheets."""
+        return self._cache
+
+    def _source_names(self, columns: list[str]) -> list[str]:
+        """Convert column names into the names used in the excel file.
+
+        Parameters
+        ----------
+        columns : list[str]
+            Columns names, after renaming.
+
+        Returns
+        -------
+        list[str]
+            Column names in the excel file.
+        """
+        inverse_mapping = {v: k for k, v in self.columns_mapping.items()}
+        return [inverse_mapping.get(column, column) for column in columns]
+
+    def _read(
+        self,
+        data_path: Path | str,
+        columns: list[str] | None = None,
+        dtypes: dict[str, str] | None = None,
+        workbook: pd.ExcelFile | None = None,
+    ) -> DataFrame:
+        """Read the sheet from the excel file, or from the cache if possible.
+
+        Parameters
+        ----------
+        data_path : Path | str
+            Path to the excel file.
+        columns : list[str] | None, optional
+            Columns to read, with their original names. Columns which are
+            not in the sheet are ignored. If None, all columns are read.
+            , by default None
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the columns, by original names.
+            , by default None
+        workbook : pd.ExcelFile | None, optional
+            Already opened excel file to parse the sheet from.
+            If None, the file is opened from `data_path`., by default None
+
+        Returns
+        -------
+        DataFrame
+            Dataframe with the original column names.
+        """
+        excel_io = data_path if workbook is None else workbook
+        if self.cache is None:
+            # Parse only the requested columns
+            usecols = None if columns is None else lambda x: x in columns
+            return pd.read_excel(
+                io=excel_io,
+                sheet_name=self.sheet_name,
+                skiprows=self.skiprows,
+                usecols=usecols,
+                dtype=dtypes,
+            )
+        if not self.cache.contains(data_path, self.sheet_name):
+            # Cache the whole sheet to serve any later projection
+            raw_dataframe = pd.read_excel(
+                io=excel_io,
+                sheet_name=self.sheet_name,
+                skiprows=self.skiprows,
+            )
+            self.cache.save(data_path, self.sheet_name, raw_dataframe)
+        raw_dataframe = self.cache.load(
+            data_path,
+            self.sheet_name,
+            columns=columns,
+        )
+        if not dtypes:
+            return raw_dataframe
+        dtypes = {k: v for k, v in dtypes.items() if k in raw_dataframe}
+        return raw_dataframe.astype(dtypes)
+
+    def load(
+        self,
+        data_path: Path | str,
+        columns: list[str] | None = None,
+        dtypes: dict[str, str] | None = None,
+        workbook: pd.ExcelFile | None = None,
+    ) -> DataFrame:
         """Load the dataframe from the excel file.
 
         Parameters
         ----------
         data_path : Path | str
             Path to the excel file.
+        columns : list[str] | None, optional
+            Columns to load, using the renamed names. Columns which are
+            not in the sheet are ignored. If None, all columns are loaded.
+            , by default None
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the columns, using the renamed names.
+            , by default None
+        workbook : pd.ExcelFile | None, optional
+            Already opened excel file to parse the sheet from.
+            If None, the file is opened from `data_path`., by default None
 
         Returns
         -------
         DataFrame
             Dataframe with correct names.
         """
+        if columns is not None:
+            columns = self._source_names(columns)
+        if dtypes is not None:
+            names = self._source_names(list(dtypes.keys()))
+            dtypes = dict(zip(names, dtypes.values(), strict=True))
         # Load Data from Excel File
-        raw_dataframe = pd.read_excel(
-            io=data_path,
-            sheet_name=self.sheet_name,
-            skiprows=self.skiprows,
+        raw_dataframe = self._read(
+            data_path=data_path,
+            columns=columns,
+            dtypes=dtypes,
+            workbook=workbook,
         )
         # Rename Columns as instructed
         return raw_dataframe.rename(columns=self.columns_mapping)
@@ -1,10 +1,20 @@
 """Moss-files reading toools."""
 
 
+from contextlib import nullcontext
+from pathlib import Path
+
+import pandas as pd
 from pandas.core.api import DataFrame
 
 from bramm_data_analysis.loaders.reading._base import BaseReader
+from bramm_data_analysis.loaders.reading.cache import SheetCache
 from bramm_data_analysis.loaders.reading.excel_utils import ExcelReader
+from bramm_data_analysis.loaders.schemas.moss import (
+    MOSS_SAMPLES_SCHEMA,
+    MOSS_SITES_SCHEMA,
+    MOSS_VALUES_SCHEMA,
+)
 
 
 class MossReader(BaseReader):
@@ -13,162 +23,281 @@ class MossReader(BaseReader):
 
     merge_sites_with_samples_on = "site_code"
     merge_sites_samples_with_values_on = "sample_code"
+    sites_sheet = "Sites"
+    samples_sheet = "Echantillons"
+    values_sheet = "Valeurs"
+
+    def __init__(
+        self,
+        data_path: Path | None,
+        cache_dir: Path | None = None,
+        engine: str | None = None,
+    ) -> None:
+        """Instantiate the Reader.
+
+        Parameters
+        ----------
+        data_path : Path | None
+            Path to the file containing data.
+        cache_dir : Path | None, optional
+            Directory in which to cache the parsed sheets.
+            If None, the workbook is parsed on every load., by default None
+        engine : str | None, optional
+            Engine to use to open the workbook.
+            If None, pandas' default engine is used., by default None
+        """
+        super().__init__(data_path=data_path)
+        self._cache = None if cache_dir is None else SheetCache(cache_dir)
+        self._engine = engine
+
+    @property
+    def cache(self) -> SheetCache | None:
+        """Cache for parsed sheets."""
+        return self._cache
 
-    def load_sites(self) -> DataFrame:
+    @property
+    def engine(self) -> str | None:
+        """Engine used to open the workbook."""
+        return self._engine
+
+    def open_workbook(self) -> pd.ExcelFile | nullcontext[None]:
+        """Open the workbook, unless all sheets can be loaded from the cache.
+
+        Returns
+        -------
+        pd.ExcelFile | nullcontext[None]
+            Context manager giving the opened workbook, or None if the
+            workbook does not need to be opened.
+        """
+        sheets = [self.sites_sheet, self.samples_sheet, self.values_sheet]
+        if self.cache is not None and all(
+            self.cache.contains(self.data_path, sheet) for sheet in sheets
+        ):
+            return nullcontext()
+        return pd.ExcelFile(self.data_path, engine=self.engine)
+
+    def load_sites(
+        self,
+        columns: list[str] | None = None,
+        dtypes: dict[str, str] | None = None,
+        workbook: pd.ExcelFile | None = None,
+    ) -> DataFrame:
         """Load data sites.
 
+        Parameters
+        ----------
+        columns : list[str] | None, optional
+            Columns to load. Columns which are not in the sheet are ignored.
+            If None, all columns are loaded., by default None
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the columns., by default None
+        workbook : pd.ExcelFile | None, optional
+            Already opened workbook. If None, the workbook is opened
+            from the data path., by default None
+
         Returns
         -------
         DataFrame
             Sites DataFrame.
         """
-        column_mapping = {
-            "Code_site_2021": "site_code",
-            "CD_INSEE": "site_insee_code",
-            "CD_département": "department_code",
-            "Lat_deg_decim": "latitude",
-            "Long_deg_decim": "longitude",
-            "LambertII_X(m)": "x_lambert",
-            "LambertII_Y(m)": "y_lambert",
-            "Altitude(m)": "altitude",
-            "Date_récolte": "date",
-            "Conditions_météo": "weather",
-            "Nature_strate_arborée": "tree_layer",
-            "Nature_strate_arborée_complément": "tree_layer_complement",
-            "Recouvrement_strate_arborée": "tree_cover",
-        }
-        sheet_name = "Sites"
+        sheet_name = self.sites_sheet
         return ExcelReader(
-            column_name_mapping=column_mapping,
+            column_name_mapping=MOSS_SITES_SCHEMA.rename_mapping,
             sheet_name=sheet_name,
-        ).load(data_path=self.data_path)
+            cache=self.cache,
+        ).load(
+            data_path=self.data_path,
+            columns=columns,
+            dtypes=dtypes,
+            workbook=workbook,
+        )
 
-    def load_samples(self) -> DataFrame:
+    def load_samples(
+        self,
+        columns: list[str] | None = None,
+        dtypes: dict[str, str] | None = None,
+        workbook: pd.ExcelFile | None = None,
+    ) -> DataFrame:
         """Load data samples.
 
+        Parameters
+        ----------
+        columns : list[str] | None, optional
+            Columns to load. Columns which are not in the sheet are ignored.
+            If None, all columns are loaded., by default None
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the columns., by default None
+        workbook : pd.ExcelFile | None, optional
+            Already opened workbook. If None, the workbook is opened
+            from the data path., by default None
+
         Returns
         -------
         DataFrame
             Sites DataFrame.
         """
-        column_mapping = {
-            "Code_site_2021": "site_code",
-            "Code_echantillon_2021": "sample_code",
-            "BRAMM_échantillons hors EC": "sample_outside_complementary_study",
-            "BRAMM_échantillons envoyés à l'Europe": "sample_send_europe",
-            "EC_Comparaison entre 3 espèces": "cs_3_species_comparison",
-            "EC_Comparaison entre Pp & Hc": "cs_2_species_comparison",
-            "EC_Repetition_prelevement": "cs_repeated_sampling",
-            "EC_Repetition_analyse": "cs_repeated_analysis",
-            "Espèce_prélevée": "species",
-            "Nb_tapis prélevés": "samples_nb",
-            "Nb_tapis prélevés_sous fougères": "fern_samples_nb",
-            "Nb_tapis prélevés_sous strate arbustive": "tree_samples_nb",
-            "Nb_tapis prélevés_sous strate herbacée": "herb_samples_nb",
-            "Nb_tapis prélevés_ sur litière": "litter_samples_nb",
-            "Nb_tapis prélevés_ sur humus": "humus_samples_nb",
-            "Nb_tapis prélevés_ sur terre": "soi_samples_nb",
-            "Nb_tapis prélevés_ sur sable": "sand_samples_nb",
-            'Nb_tapis prélevés_pour Hc_ sur souche "dure" (conifères)': "hard_strain_coniferous_samples_nb",  # noqa: E501
-            'Nb_tapis prélevés_pour Hc_ sur souche "dure" (feuillus)': "hard_strain_hardwood_samples_nb",  # noqa: E501
-            'Nb_tapis prélevés_pour Hc_ sur souche "dure" (inconnu)': "hard_strain_unknown_samples_nb",  # noqa: E501
-            "Nb_tapis prélevés_pour Hc_ sur souche en décomposition (conifère": "decomposed_strain_coniferous_samples_nb",  # noqa: E501
-            "Nb_tapis prélevés_pour Hc_ sur souche en décomposition (feuillus": "decomposed_strain_hardwood_samples_nb",  # noqa: E501
-            "Nb_tapis prélevés_pour Hc_ sur souche en décomposition (inconnu)": "decomposed_strain_unknown_samples_nb",  # noqa: E501
-            "Nb_tapis prélevés_pour Hc_ sur BM avec écorce (conifères)": "bark_coniferous_nb",  # noqa: E501
-            "Nb_tapis prélevés_pour Hc_ sur BM avec écorce (feuillus)": "bark_hardwood_samples_nb",  # noqa: E501
-            "Nb_tapis prélevés_pour Hc_ sur BM avec écorce (inconnu)": "bark_unknown_samples_nb",  # noqa: E501
-            'Nb_tapis prélevés_pour Hc_ sur BM "dur" (conifères)': "hard_coniferous_samples_nb",  # noqa: E501
-            'Nb_tapis prélevés_pour Hc_ sur BM "dur" (feuillus)': "hard_hardwood_samples_nb",  # noqa: E501
-            'Nb_tapis prélevés_pour Hc_ sur BM "dur" (inconnu)': "hard_unknown_samples_nb",  # noqa: E501
-            "Nb_tapis prélevés_pour Hc_ sur BM en décomposition (conifères)": "decomposed_coniferous_samples_nb",  # noqa: E501
-            "Nb_tapis prélevés_pour Hc_ sur BM en décomposition (feuillus)": "decomposed_hardwood_samples_nb",  # noqa: E501
-            "Nb_tapis prélevés_pour Hc_ sur BM en décomposition (inconnu)": "decomposed_unknown_samples_nb",  # noqa: E501
-            "Taille_du_brin": "strand_size",
-            "Particules de poussière visibles": "visible_dust_particles",
-            "Particules de pollen visibles": "visible_pollen_particles",
-        }
-        sheet_name = "Echantillons"
+        sheet_name = self.samples_sheet
         return ExcelReader(
-            column_name_mapping=column_mapping,
+            column_name_mapping=MOSS_SAMPLES_SCHEMA.rename_mapping,
             sheet_name=sheet_name,
-        ).load(data_path=self.data_path)
+            cache=self.cache,
+        ).load(
+            data_path=self.data_path,
+            columns=columns,
+            dtypes=dtypes,
+            workbook=workbook,
+        )
 
-    def load_values(self) -> DataFrame:
+    def load_values(
+        self,
+        columns: list[str] | None = None,
+        dtypes: dict[str, str] | None = None,
+        workbook: pd.ExcelFile | None = None,
+    ) -> DataFrame:
         """Load data values.
 
+        Parameters
+        ----------
+        columns : list[str] | None, optional
+            Columns to load. Columns which are not in the sheet are ignored.
+            If None, all columns are loaded., by default None
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the columns., by default None
+        workbook : pd.ExcelFile | None, optional
+            Already opened workbook. If None, the workbook is opened
+            from the data path., by default None
+
         Returns
         -------
         DataFrame
             Sites DataFrame.
         """
-        column_mapping = {
-            "Code_echantillon_2021": "sample_code",
-            "Type_minéralisation": "mineral_type",
-            "Al_µg/g_103°C": "aluminium",
-            "Al_incert_µg/g_103°C": "aluminium_incertitude",
-            "As_µg/g_103°C": "arsenic",
-            "As_incert_µg/g_103°C": "arsenic_incertitude",
-            "Ca_µg/g_103°C": "calcium",
-            "Ca_incert_µg/g_103°C": "calcium_incertitude",
-            "Cd_µg/g_103°C": "cadmium",
-            "Cd_incert_µg/g_103°C": "cadmium_incertitude",
-            "Co_µg/g_103°C": "cobalt",
-            "Co_incert_µg/g_103°C": "cobalt_incertitude",
-            "Cr_µg/g_103°C": "chromium",
-            "Cr_incert_µg/g_103°C": "chromium_incertitude",
-            "Cu_µg/g_103°C": "copper",
-            "Cu_incert_µg/g_103°C": "copper_incertitude",
-            "Fe_µg/g_103°C": "iron",
-            "Fe_incert_µg/g_103°C": "iron_incertitude",
-            "Hg_µg/g_103°C": "mercury",
-            "Hg_incert_µg/g_103°C": "mercury_incertitude",
-            "N_mg/g_103°C": "nitrogen",
-            "N_incert_mg/g_103°C": "nitrogen_incertitude",
-            "Na_µg/g_103°C": "sodium",
-            "Na_incert_µg/g_103°C": "sodium_incertitude",
-            "Ni_µg/g_103°C": "nickel",
-            "Ni_incert_µg/g_103°C": "nickel_incertitude",
-            "Pb_µg/g_103°C": "lead",
-            "Pb_incert_µg/g_103°C": "lead_incertitude",
-            "Pd_µg/g_103°C": "palladium",
-            "Pt_µg/g_103°C": "platinium",
-            "Rh_µg/g_103°C": "rhodium",
-            "S_µg/g_103°C": "sulfur",
-            "S_incert_µg/g_103°C": "sulfur_incertitude",
-            "Sb_µg/g_103°C": "antimony",
-            "Sr_µg/g_103°C": "strontium",
-            "V_µg/g_103°C": "vanadium",
-            "Zn_µg/g_103°C": "zinc",
-            "Zn_incert_µg/g_103°C": "zinc_incertitude",
-        }
-        sheet_name = "Valeurs"
+        sheet_name = self.values_sheet
         skiprows = [1]
         return ExcelReader(
-            column_name_mapping=column_mapping,
+            column_name_mapping=MOSS_VALUES_SCHEMA.rename_mapping,
             sheet_name=sheet_name,
             skiprows=skiprows,
-        ).load(data_path=self.data_path)
+            cache=self.cache,
+        ).load(
+            data_path=self.data_path,
+            columns=columns,
+            dtypes=dtypes,
+            workbook=workbook,
+        )
 
-    def retrieve(self) -> DataFrame:
+    def _sheet_columns(
+        self,
+        fields: list[str] | None,
+        keys: list[str],
+    ) -> list[str] | None:
+        """Columns to load from a sheet to retrieve the given fields.
+
+        Parameters
+        ----------
+        fields : list[str] | None
+            Fields to retrieve. If None or empty, all columns are loaded.
+        keys : list[str]
+            Merging keys of the sheet.
+
+        Returns
+        -------
+        list[str] | None
+            Columns to load, None to load all columns.
+        """
+        if not fields:
+            return None
+        return list(dict.fromkeys(fields + keys))
+
+    @staticmethod
+    def _merge_on_codes(
+        left: DataFrame,
+        right: DataFrame,
+        on: str,
+    ) -> DataFrame:
+        """Inner merge of two DataFrames using integer codes of their keys.
+
+        Parameters
+        ----------
+        left : DataFrame
+            Left DataFrame, whose row order is preserved.
+        right : DataFrame
+            Right DataFrame.
+        on : str
+            Key column, present in both DataFrames.
+
+        Returns
+        -------
+        DataFrame
+            Merged DataFrame. Non-key columns present in both DataFrames
+            are suffixed with "_x" (left) and "_y" (right).
+        """
+        # Encode keys of both sides with the same integer codes
+        codes, _ = pd.factorize(pd.concat([left[on], right[on]]))
+        left_codes = codes[: left.shape[0]]
+        right_codes = codes[left.shape[0] :]
+        # Join on integer indexes
+        merged = left.set_index(left_codes).join(
+            right.drop(columns=on).set_index(right_codes),
+            how="inner",
+            lsuffix="_x",
+            rsuffix="_y",
+        )
+        return merged.reset_index(drop=True)
+
+    def retrieve(
+        self,
+        fields: list[str] | None = None,
+        dtypes: dict[str, str] | None = None,
+    ) -> DataFrame:
         """Retrieve Data from file.
 
+        The workbook is opened once and its sheets are parsed one after
+        the other from it: workbooks are not thread-safe. Sheets which do
+        not contain any of the requested fields are only parsed for their
+        merging keys.
+
+        Parameters
+        ----------
+        fields : list[str] | None, optional
+            Fields to retrieve, the merging keys are always loaded.
+            If None or empty, all columns are loaded., by default None
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the columns., by default None
+
         Returns
         -------
         DataFrame
             Merged DataFrame.
         """
+        sites_key = self.merge_sites_with_samples_on
+        values_key = self.merge_sites_samples_with_values_on
         # Load each important sheet from the Excel File
-        sites_data = self.load_sites()
-        samples_data = self.load_samples()
-        values_data = self.load_values()
+        with self.open_workbook() as workbook:
+            sites_data = self.load_sites(
+                columns=self._sheet_columns(fields, [sites_key]),
+                dtypes=dtypes,
+                workbook=workbook,
+            )
+            samples_data = self.load_samples(
+                columns=self._sheet_columns(fields, [sites_key, values_key]),
+                dtypes=dtypes,
+                workbook=workbook,
+            )
+            values_data = self.load_values(
+                columns=self._sheet_columns(fields, [values_key]),
+                dtypes=dtypes,
+                workbook=workbook,
+            )
         # Merge sites with samples on site_id
-        sites_with_samples = sites_data.merge(
+        sites_with_samples = self._merge_on_codes(
+            left=sites_data,
             right=samples_data,
-            on=self.merge_sites_with_samples_on,
+            on=sites_key,
         )
         # Merge sites/sample with values based on sample_id
-        return sites_with_samples.merge(
+        return self._merge_on_codes(
+            left=sites_with_samples,
             right=values_data,
-            on=self.merge_sites_samples_with_values_on,
+            on=values_key,
         )
@@ -1,22 +1,133 @@
 """Moss-files reading toools."""
 
 
+from collections.abc import Iterator
+from pathlib import Path
+from typing import ClassVar
+
 import pandas as pd
 from pandas.core.api import DataFrame
 
 from bramm_data_analysis.loaders.reading._base import BaseReader
+from bramm_data_analysis.loaders.schemas import RMQS_SCHEMA, DatasetSchema
 
 
 class RMQSReader(BaseReader):
 
     """RMQS File Readers."""
 
-    def retrieve(self) -> DataFrame:
+    na_values = "ND"
+    schema: ClassVar[DatasetSchema] = RMQS_SCHEMA
+
+    def __init__(self, data_path: Path | None, engine: str = "c") -> None:
+        """Instantiate the Reader.
+
+        Parameters
+        ----------
+        data_path : Path | None
+            Path to the file containing data.
+        engine : str, optional
+            Parser engine to use ("c", "python" or "pyarrow")., by default "c"
+        """
+        super().__init__(data_path=data_path)
+        self._engine = engine
+
+    @property
+    def engine(self) -> str:
+        """CSV Parser Engine."""
+        return self._engine
+
+    def _parsing_arguments(
+        self,
+        fields: list[str] | None,
+        dtypes: dict[str, str] | None,
+    ) -> dict:
+        """Arguments to give to the CSV parser.
+
+        Parameters
+        ----------
+        fields : list[str] | None
+            Fields to parse. If None or empty, all fields are parsed.
+        dtypes : dict[str, str] | None
+            Types to assign to the fields when parsing.
+
+        Returns
+        -------
+        dict
+            Keyword arguments for `pd.read_csv`.
+        """
+        if fields:
+            # Only read the header to check fields before projecting
+            header = pd.read_csv(self.data_path, nrows=0).columns
+            self.raise_if_inexistent_column(df_columns=header, fields=fields)
+        # Parse categories as strings, for their values not to depend on
+        # the type inferred from the rows of each chunk
+        text_dtypes = dict.fromkeys(self.schema.categorical_columns, "str")
+        dtypes = {**text_dtypes, **(dtypes or {})}
+        if fields:
+            dtypes = {k: v for k, v in dtypes.items() if k in fields}
+        return {
+            "na_values": self.na_values,
+            "usecols": fields or None,
+            "dtype": dtypes,
+            "engine": self.engine,
+        }
+
+    def retrieve(
+        self,
+        fields: list[str] | None = None,
+        dtypes: dict[str, str] | None = None,
+    ) -> DataFrame:
         """Retrieve Data from file.
 
+        Parameters
+        ----------
+        fields : list[str] | None, optional
+            Fields to parse. If None or empty, all fields are parsed.
+            , by default None
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the fields when parsing., by default None
+
         Returns
         -------
         DataFrame
             RMQS DataFrame.
         """
-        return pd.read_csv(self.data_path, na_values="ND")
+        return pd.read_csv(
+            self.data_path,
+            **self._parsing_arguments(fields=fields, dtypes=dtypes),
+        )
+
+    def iter_chunks(
+        self,
+        chunksize: int,
+        fields: list[str] | None = None,
+        dtypes: dict[str, str] | None = None,
+    ) -> Iterator[DataFrame]:
+        """Iterate over chunks of the data from the source file.
+
+        Parameters
+        ----------
+        chunksize : int
+            Number of rows of each chunk.
+        fields : list[str] | None, optional
+            Fields to parse. If None or empty, all fields are parsed.
+            , by default None
+        dtypes : dict[str, str] | None, optional
+            Types to assign to the fields when parsing., by default None
+
+        Yields
+        ------
+        DataFrame
+            Chunk of RMQS data.
+        """
+        arguments = self._parsing_arguments(fields=fields, dtypes=dtypes)
+        if arguments["engine"] == "pyarrow":
+            # The pyarrow engine does not support chunked reading
+            arguments["engine"] = "c"
+        with pd.read_csv(
+            self.data_path,
+            chunksize=chunksize,
+            **arguments,
+        ) as reader:
+            yield from reader
@@ -13,16 +13,26 @@ class RMQSLoader(BaseLoader[Path]):
 
     date_field = "date_complete"
 
-    def __init__(self, source: Path) -> None:
+    def __init__(
+        self,
+        source: Path,
+        engine: str = "c",
+        float_dtype: str = "float64",
+    ) -> None:
         """Instantiate the Loader.
 
         Parameters
         ----------
         source : Path
             Source object.
+        engine : str, optional
+            CSV parser engine ("c", "python" or "pyarrow")., by default "c"
+        float_dtype : str, optional
+            Type of the concentrations ("float64" or "float32").
+            , by default "float64"
         """
         super().__init__(source=source)
         # Instantiate Reader with RMQSReader
-        self._reader = RMQSReader(data_path=self.source)
+        self._reader = RMQSReader(data_path=self.source, engine=engine)
         # Instantiate Preprocessor wit RMQSPreprocessor
-        self._preprocessor = RMQSPreprocessor()
+        self._preprocessor = RMQSPreprocessor(float_dtype=float_dtype)
@@ -0,0 +1,7 @@
+"""Datasets Schemas."""
+
+from bramm_data_analysis.loaders.schemas._base import Column, DatasetSchema
+from bramm_data_analysis.loaders.schemas.moss import MOSS_SCHEMA
+from bramm_data_analysis.loaders.schemas.rmqs import RMQS_SCHEMA
+
+__all__ = ["MOSS_SCHEMA", "RMQS_SCHEMA", "Column", "DatasetSchema"]
@@ -0,0 +1,248 @@
+"""Base Tools to describe Datasets."""
+
+from typing import ClassVar
+
+import pandas as pd
+from pandas.api.types import is_numeric_dtype
+from pandas.core.api import DataFrame
+
+
+class Column:
+
+    """Description of a Dataset's Column."""
+
+    # Nullable integer types, which require numeric parsing of the values
+    integer_dtypes: ClassVar[list[str]] = [
+        "UInt8",
+        "UInt16",
+        "UInt32",
+        "Int8",
+        "Int16",
+        "Int32",
+        "Int64",
+    ]
+
+    def __init__(
+        self,
+        name: str,
+        dtype: str = "float64",
+        *,
+        source: str | None = None,
+        unit: str | None = None,
+        concentration: bool = False,
+        censored: bool = False,
+    ) -> None:
+        """Instantiate the Column.
+
+        Parameters
+        ----------
+        name : str
+            Name of the column in the loaded DataFrames.
+        dtype : str, optional
+            Type of the column's values., by default "float64"
+        source : str | None, optional
+            Name of the column in the source file.
+            If None, it is the same as `name`., by default None
+        unit : str | None, optional
+            Unit of the values., by default None
+        concentration : bool, optional
+            Whether the column contains concentrations, whose type can
+            be lowered to float32., by default False
+        censored : bool, optional
+            Whether values below the detection limit are written
+            as "< limit" in the source., by default False
+        """
+        self._name = name
+        self._dtype = dtype
+        self._source = name if source is None else source
+        self._unit = unit
+        self._concentration = concentration
+        self._censored = censored
+
+    @property
+    def name(self) -> str:
+        """Name of the column in the loaded DataFrames."""
+        return self._name
+
+    @property
+    def source(self) -> str:
+        """Name of the column in the source file."""
+        return self._source
+
+    @property
+    def unit(self) -> str | None:
+        """Unit of the values."""
+        return self._unit
+
+    @property
+    def concentration(self) -> bool:
+        """Whether the column contains concentrations."""
+        return self._concentration
+
+    @property
+    def censored(self) -> bool:
+        """Whether censored values can be found in the source."""
+        return self._censored
+
+    def dtype(self, float_dtype: str = "float64") -> str:
+        """Type of the column's values.
+
+        Parameters
+        ----------
+        float_dtype : str, optional
+            Type to use for concentrations., by default "float64"
+
+        Returns
+        -------
+        str
+            Type of the values.
+        """
+        if self.concentration:
+            return float_dtype
+        return self._dtype
+
+    def cast(
+        self, series: pd.Series, float_dtype: str = "float64"
+    ) -> pd.Series:
+        """Cast a Series to the column's type.
+
+        Parameters
+        ----------
+        series : pd.Series
+            Values of the column.
+        float_dtype : str, optional
+            Type to use for concentrations., by default "float64"
+
+        Returns
+        -------
+        pd.Series
+            Values with the column's type.
+
+        Raises
+        ------
+        ValueError
+            If missing values would be cast to the non-nullable bool type.
+        """
+        dtype = self.dtype(float_dtype)
+        if series.dtype == dtype:
+            return series
+        if dtype.startswith("datetime64"):
+            return pd.to_datetime(series).astype(dtype)
+        if dtype == "category":
+            return series.astype(dtype)
+        if not is_numeric_dtype(series.dtype):
+            # Textual markers (i.e. 'n.r') are considered as missing values
+            series = pd.to_numeric(series, errors="coerce")
+        if dtype == "bool" and series.isna().any():
+            # Missing values would silently be cast to True
+            msg = (
+                f"The column {self.name} contains missing values, which"
+                " can not be cast to bool: use the 'boolean' type."
+            )
+            raise ValueError(msg)
+        if dtype in self.integer_dtypes:
+            # Go through float values to handle missing values
+            return series.astype("float64").astype(dtype)
+        return series.astype(dtype)
+
+
+class DatasetSchema:
+
+    """Declarative Description of a Dataset's Columns."""
+
+    def __init__(self, columns: list[Column]) -> None:
+        """Instantiate the Schema.
+
+        Parameters
+        ----------
+        columns : list[Column]
+            Columns of the dataset. Columns sharing the same name are
+            only described once.
+        """
+        self._columns = {column.name: column for column in columns}
+
+    def __add__(self, other: "DatasetSchema") -> "DatasetSchema":
+        """Combine two Schemas.
+
+        Parameters
+        ----------
+        other : DatasetSchema
+            Schema to combine with.
+
+        Returns
+        -------
+        DatasetSchema
+            Schema with the columns of both schemas.
+        """
+        return DatasetSchema(self.columns + other.columns)
+
+    def __contains__(self, name: str) -> bool:
+        """Whether a column is described by the schema."""
+        return name in self._columns
+
+    def __getitem__(self, name: str) -> Column:
+        """Column description."""
+        return self._columns[name]
+
+    @property
+    def columns(self) -> list[Column]:
+        """Columns of the dataset."""
+        return list(self._columns.values())
+
+    @property
+    def names(self) -> list[str]:
+        """Names of the columns in the loaded DataFrames."""
+        return list(self._columns.keys())
+
+    @property
+    def rename_mapping(self) -> dict[str, str]:
+        """Mapping from source names to names in the loaded DataFrames."""
+        return {column.source: column.name for column in self.columns}
+
+    @property
+    def censored_columns(self) -> list[str]:
+        """Columns whose source can contain censored values."""
+        return [column.name for column in self.columns if column.censored]
+
+    @property
+    def categorical_columns(self) -> list[str]:
+        """Columns of categorical values."""
+        return [
+            column.name
+            for column in self.columns
+            if column.dtype() == "category"
+        ]
+
+    def dtypes(self, float_dtype: str = "float64") -> dict[str, str]:
+        """Types of the columns.
+
+        Parameters
+        ----------
+        float_dtype : str, optional
+            Type to use for concentrations., by default "float64"
+
+        Returns
+        -------
+        dict[str, str]
+            Type of each column.
+        """
+        return {
+            column.name: column.dtype(float_dtype) for column in self.columns
+        }
+
+    def cast(self, dataframe: DataFrame, float_dtype: str = "float64") -> None:
+        """Cast, in place, the described columns of a DataFrame.
+
+        Columns which are not described by the schema are left untouched.
+
+        Parameters
+        ----------
+        dataframe : DataFrame
+            DataFrame to cast.
+        float_dtype : str, optional
+            Type to use for concentrations., by default "float64"
+        """
+        for name in dataframe.columns:
+            if name not in self:
+                continue
+            dataframe[name] = self[name].cast(dataframe[name], float_dtype)
@@ -0,0 +1,306 @@
+"""Moss Dataset Schema."""
+
+from bramm_data_analysis.loaders.schemas._base import Column, DatasetSchema
+
+
+def _concentration(
+    name: str,
+    *,
+    source: str,
+    unit: str,
+    censored: bool = False,
+) -> Column:
+    """Describe a column of concentrations.
+
+    Parameters
+    ----------
+    name : str
+        Name of the column in the loaded DataFrames.
+    source : str
+        Name of the column in the source file.
+    unit : str
+        Unit of the concentrations.
+    censored : bool, optional
+        Whether values below the detection limit are written
+        as "< limit" in the source., by default False
+
+    Returns
+    -------
+    Column
+        Column of concentrations.
+    """
+    return Column(
+        name,
+        "float64",
+        source=source,
+        unit=unit,
+        concentration=True,
+        censored=censored,
+    )
+
+
+MOSS_SITES_SCHEMA = DatasetSchema(
+    [
+        Column("site_code", "category", source="Code_site_2021"),
+        Column("site_insee_code", "category", source="CD_INSEE"),
+        Column("department_code", "category", source="CD_département"),
+        Column("latitude", "float64", source="Lat_deg_decim", unit="°"),
+        Column("longitude", "float64", source="Long_deg_decim", unit="°"),
+        Column("x_lambert", "Int32", source="LambertII_X(m)", unit="m"),
+        Column("y_lambert", "Int32", source="LambertII_Y(m)", unit="m"),
+        Column("altitude", "Int16", source="Altitude(m)", unit="m"),
+        Column("date", "datetime64[ns]", source="Date_récolte"),
+        Column("weather", "category", source="Conditions_météo"),
+        Column("tree_layer", "category", source="Nature_strate_arborée"),
+        Column(
+            "tree_layer_complement",
+            "category",
+            source="Nature_strate_arborée_complément",
+        ),
+        Column("tree_cover", "category", source="Recouvrement_strate_arborée"),
+    ]
+)
+
+MOSS_SAMPLES_SCHEMA = DatasetSchema(
+    [
+        Column("site_code", "category", source="Code_site_2021"),
+        Column("sample_code", "category", source="Code_echantillon_2021"),
+        Column(
+            "sample_outside_complementary_study",
+            "boolean",
+            source="BRAMM_échantillons hors EC",
+        ),
+        Column(
+            "sample_send_europe",
+            "boolean",
+            source="BRAMM_échantillons envoyés à l'Europe",
+        ),
+        Column(
+            "cs_3_species_comparison",
+            "boolean",
+            source="EC_Comparaison entre 3 espèces",
+        ),
+        Column(
+            "cs_2_species_comparison",
+            "boolean",
+            source="EC_Comparaison entre Pp & Hc",
+        ),
+        Column(
+            "cs_repeated_sampling",
+            "boolean",
+            source="EC_Repetition_prelevement",
+        ),
+        Column(
+            "cs_repeated_analysis", "boolean", source="EC_Repetition_analyse"
+        ),
+        Column("species", "category", source="Espèce_prélevée"),
+        Column("samples_nb", "UInt8", source="Nb_tapis prélevés"),
+        Column(
+            "fern_samples_nb",
+            "UInt8",
+            source="Nb_tapis prélevés_sous fougères",
+        ),
+        Column(
+            "tree_samples_nb",
+            "UInt8",
+            source="Nb_tapis prélevés_sous strate arbustive",
+        ),
+        Column(
+            "herb_samples_nb",
+            "UInt8",
+            source="Nb_tapis prélevés_sous strate herbacée",
+        ),
+        Column(
+            "litter_samples_nb",
+            "UInt8",
+            source="Nb_tapis prélevés_ sur litière",
+        ),
+        Column(
+            "humus_samples_nb", "UInt8", source="Nb_tapis prélevés_ sur humus"
+        ),
+        Column(
+            "soi_samples_nb", "UInt8", source="Nb_tapis prélevés_ sur terre"
+        ),
+        Column(
+            "sand_samples_nb", "UInt8", source="Nb_tapis prélevés_ sur sable"
+        ),
+        Column(
+            "hard_strain_coniferous_samples_nb",
+            "UInt8",
+            source='Nb_tapis prélevés_pour Hc_ sur souche "dure" (conifères)',
+        ),
+        Column(
+            "hard_strain_hardwood_samples_nb",
+            "UInt8",
+            source='Nb_tapis prélevés_pour Hc_ sur souche "dure" (feuillus)',
+        ),
+        Column(
+            "hard_strain_unknown_samples_nb",
+            "UInt8",
+            source='Nb_tapis prélevés_pour Hc_ sur souche "dure" (inconnu)',
+        ),
+        Column(
+            "decomposed_strain_coniferous_samples_nb",
+            "UInt8",
+            source="Nb_tapis prélevés_pour Hc_ sur souche en décomposition (conifère",  # noqa: E501
+        ),
+        Column(
+            "decomposed_strain_hardwood_samples_nb",
+            "UInt8",
+            source="Nb_tapis prélevés_pour Hc_ sur souche en décomposition (feuillus",  # noqa: E501
+        ),
+        Column(
+            "decomposed_strain_unknown_samples_nb",
+            "UInt8",
+            source="Nb_tapis prélevés_pour Hc_ sur souche en décomposition (inconnu)",  # noqa: E501
+        ),
+        Column(
+            "bark_coniferous_nb",
+            "UInt8",
+            source="Nb_tapis prélevés_pour Hc_ sur BM avec écorce (conifères)",
+        ),
+        Column(
+            "bark_hardwood_samples_nb",
+            "UInt8",
+            source="Nb_tapis prélevés_pour Hc_ sur BM avec écorce (feuillus)",
+        ),
+        Column(
+            "bark_unknown_samples_nb",
+            "UInt8",
+            source="Nb_tapis prélevés_pour Hc_ sur BM avec écorce (inconnu)",
+        ),
+        Column(
+            "hard_coniferous_samples_nb",
+            "UInt8",
+            source='Nb_tapis prélevés_pour Hc_ sur BM "dur" (conifères)',
+        ),
+        Column(
+            "hard_hardwood_samples_nb",
+            "UInt8",
+            source='Nb_tapis prélevés_pour Hc_ sur BM "dur" (feuillus)',
+        ),
+        Column(
+            "hard_unknown_samples_nb",
+            "UInt8",
+            source='Nb_tapis prélevés_pour Hc_ sur BM "dur" (inconnu)',
+        ),
+        Column(
+            "decomposed_coniferous_samples_nb",
+            "UInt8",
+            source="Nb_tapis prélevés_pour Hc_ sur BM en décomposition (conifères)",  # noqa: E501
+        ),
+        Column(
+            "decomposed_hardwood_samples_nb",
+            "UInt8",
+            source="Nb_tapis prélevés_pour Hc_ sur BM en décomposition (feuillus)",  # noqa: E501
+        ),
+        Column(
+            "decomposed_unknown_samples_nb",
+            "UInt8",
+            source="Nb_tapis prélevés_pour Hc_ sur BM en décomposition (inconnu)",  # noqa: E501
+        ),
+        Column("strand_size", "category", source="Taille_du_brin"),
+        Column(
+            "visible_dust_particles",
+            "category",
+            source="Particules de poussière visibles",
+        ),
+        Column(
+            "visible_pollen_particles",
+            "category",
+            source="Particules de pollen visibles",
+        ),
+    ]
+)
+
+MOSS_VALUES_SCHEMA = DatasetSchema(
+    [
+        Column("sample_code", "category", source="Code_echantillon_2021"),
+        Column("mineral_type", "category", source="Type_minéralisation"),
+        _concentration("aluminium", source="Al_µg/g_103°C", unit="µg/g"),
+        _concentration(
+            "aluminium_incertitude", source="Al_incert_µg/g_103°C", unit="µg/g"
+        ),
+        _concentration("arsenic", source="As_µg/g_103°C", unit="µg/g"),
+        _concentration(
+            "arsenic_incertitude", source="As_incert_µg/g_103°C", unit="µg/g"
+        ),
+        _concentration("calcium", source="Ca_µg/g_103°C", unit="µg/g"),
+        _concentration(
+            "calcium_incertitude", source="Ca_incert_µg/g_103°C", unit="µg/g"
+        ),
+        _concentration("cadmium", source="Cd_µg/g_103°C", unit="µg/g"),
+        _concentration(
+            "cadmium_incertitude", source="Cd_incert_µg/g_103°C", unit="µg/g"
+        ),
+        _concentration("cobalt", source="Co_µg/g_103°C", unit="µg/g"),
+        _concentration(
+            "cobalt_incertitude", source="Co_incert_µg/g_103°C", unit="µg/g"
+        ),
+        _concentration("chromium", source="Cr_µg/g_103°C", unit="µg/g"),
+        _concentration(
+            "chromium_incertitude", source="Cr_incert_µg/g_103°C", unit="µg/g"
+        ),
+        _concentration("copper", source="Cu_µg/g_103°C", unit="µg/g"),
+        _concentration(
+            "copper_incertitude", source="Cu_incert_µg/g_103°C", unit="µg/g"
+        ),
+        _concentration("iron", source="Fe_µg/g_103°C", unit="µg/g"),
+        _concentration(
+            "iron_incertitude", source="Fe_incert_µg/g_103°C", unit="µg/g"
+        ),
+        _concentration("mercury", source="Hg_µg/g_103°C", unit="µg/g"),
+        _concentration(
+            "mercury_incertitude", source="Hg_incert_µg/g_103°C", unit="µg/g"
+        ),
+        _concentration("nitrogen", source="N_mg/g_103°C", unit="mg/g"),
+        _concentration(
+            "nitrogen_incertitude", source="N_incert_mg/g_103°C", unit="mg/g"
+        ),
+        _concentration(
+            "sodium", source="Na_µg/g_103°C", unit="µg/g", censored=True
+        ),
+        _concentration(
+            "sodium_incertitude", source="Na_incert_µg/g_103°C", unit="µg/g"
+        ),
+        _concentration("nickel", source="Ni_µg/g_103°C", unit="µg/g"),
+        _concentration(
+            "nickel_incertitude", source="Ni_incert_µg/g_103°C", unit="µg/g"
+        ),
+        _concentration("lead", source="Pb_µg/g_103°C", unit="µg/g"),
+        _concentration(
+            "lead_incertitude", source="Pb_incert_µg/g_103°C", unit="µg/g"
+        ),
+        _concentration("palladium", source="Pd_µg/g_103°C", unit="µg/g"),
+        _concentration(
+            "platinium", source="Pt_µg/g_103°C", unit="µg/g", censored=True
+        ),
+        _concentration(
+            "rhodium", source="Rh_µg/g_103°C", unit="µg/g", censored=True
+        ),
+        _concentration("sulfur", source="S_µg/g_103°C", unit="µg/g"),
+        _concentration(
+            "sulfur_incertitude", source="S_incert_µg/g_103°C", unit="µg/g"
+        ),
+        _concentration(
+            "antimony", source="Sb_µg/g_103°C", unit="µg/g", censored=True
+        ),
+        _concentration(
+            "strontium", source="Sr_µg/g_103°C", unit="µg/g", censored=True
+        ),
+        _concentration(
+            "vanadium", source="V_µg/g_103°C", unit="µg/g", censored=True
+        ),
+        _concentration(
+            "zinc", source="Zn_µg/g_103°C", unit="µg/g", censored=True
+        ),
+        _concentration(
+            "zinc_incertitude",
+            source="Zn_incert_µg/g_103°C",
+            unit="µg/g",
+            censored=True,
+        ),
+    ]
+)
+
+MOSS_SCHEMA = MOSS_SITES_SCHEMA + MOSS_SAMPLES_SCHEMA + MOSS_VALUES_SCHEMA
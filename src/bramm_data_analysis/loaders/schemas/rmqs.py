@@ -0,0 +1,78 @@
+"""RMQS Dataset Schema."""
+
+from bramm_data_analysis.loaders.schemas._base import Column, DatasetSchema
+
+RMQS_SCHEMA = DatasetSchema(
+    [
+        Column("no_campagne", "UInt8"),
+        Column("id_site", "UInt32"),
+        Column("date_complete", "datetime64[ns]"),
+        Column("code_dept", "category"),
+        Column("site_officiel", "boolean"),
+        Column("x_theo", "float64", unit="m"),
+        Column("y_theo", "float64", unit="m"),
+        Column("type_profil_rmqs", "category"),
+        Column("no_couche", "UInt8"),
+        Column("profondeur_hz_sup", "Int16", unit="cm"),
+        Column("profondeur_hz_inf", "Int16", unit="cm"),
+        Column("teneur_eau_res_166_1", concentration=True),
+        Column("argile", concentration=True),
+        Column("limon_fin", concentration=True),
+        Column("limon_grossier", concentration=True),
+        Column("sable_fin", concentration=True),
+        Column("sable_grossier", concentration=True),
+        Column("cec_40_1", concentration=True),
+        Column("ca_ech_40_3", concentration=True),
+        Column("k_ech_40_3", concentration=True),
+        Column("mg_ech_40_3", concentration=True),
+        Column("na_ech_40_3", concentration=True),
+        Column("mn_ech_40", concentration=True),
+        Column("al_ech_40_3", concentration=True),
+        Column("fe_ech_40_3", concentration=True),
+        Column("p_ass_81_1", concentration=True),
+        Column("calc_tot_2_1_2", concentration=True),
+        Column("ph_eau_6_1", concentration=True),
+        Column("carbone_16_5_1", concentration=True),
+        Column("n_tot_31_1", concentration=True),
+        Column("mat_org_0", concentration=True),
+        Column("fe_lib_49_2", concentration=True),
+        Column("fe_lib_51", concentration=True),
+        Column("al_tot_hf", concentration=True),
+        Column("ca_tot_hf", concentration=True),
+        Column("fe_tot_hf", concentration=True),
+        Column("mg_tot_hf", concentration=True),
+        Column("mn_tot_hf", concentration=True),
+        Column("k_tot_hf", concentration=True),
+        Column("na_tot_hf", concentration=True),
+        Column("p_tot_hf", concentration=True),
+        Column("b_ext_65_1", concentration=True),
+        Column("cd_tot_hf", concentration=True),
+        Column("cd_ext_66_1", concentration=True),
+        Column("co_tot_hf", concentration=True),
+        Column("cr_tot_hf", concentration=True),
+        Column("cr_ext_66_1", concentration=True),
+        Column("cu_tot_hf", concentration=True),
+        Column("cu_ext_66_1", concentration=True),
+        Column("mo_tot_hf", concentration=True),
+        Column("ni_tot_hf", concentration=True),
+        Column("ni_ext_66_1", concentration=True),
+        Column("pb_tot_hf", concentration=True),
+        Column("pb_ext_66_1", concentration=True),
+        Column("tl_tot_hf", concentration=True),
+        Column("zn_tot_hf", concentration=True),
+        Column("zn_ext_66_1", concentration=True),
+        Column("as_tot_hf", concentration=True),
+        Column("hg_tot_79", concentration=True),
+        Column("cond_elec_119_1", concentration=True),
+        Column("cond_elec_129", concentration=True),
+        Column("cl_sol_195", concentration=True),
+        Column("ca_sol_194", concentration=True),
+        Column("k_sol_201", concentration=True),
+        Column("mg_sol_194", concentration=True),
+        Column("na_sol_201", concentration=True),
+        Column("n_tot_sol_221", concentration=True),
+        Column("s_sol_202", concentration=True),
+        Column("latitude", "float64", unit="°"),
+        Column("longitude", "float64", unit="°"),
+    ]
+)
@@ -1,89 +1,1680 @@
 """Matching Tools to Match Moss Points with RMQS Points.."""
 
-from typing import Literal, overload
+import os
+import pickle
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import ClassVar, Literal, Self, overload
 
 import numpy as np
+import pandas as pd
 from pandas.core.api import DataFrame
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import (
+    breadth_first_order,
+    maximum_bipartite_matching,
+    min_weight_full_bipartite_matching,
+)
+from scipy.spatial import cKDTree
 from sklearn.neighbors import NearestNeighbors
 
 
+class SpatialIndex:
+
+    """KD-tree over reference points, built once and reusable.
+
+    Points are indexed as unit vectors. The index can be saved to disk
+    and loaded back, to match many query batches against the same
+    reference data without rebuilding the tree.
+    """
+
+    _year_threshold: int | None = None
+
+    def __init__(
+        self,
+        data: DataFrame,
+        radians: bool = False,
+        *,
+        longitude: str = "longitude",
+        latitude: str = "latitude",
+        year_threshold: int | None = None,
+    ) -> None:
+        """Build the index.
+
+        Parameters
+        ----------
+        data : DataFrame
+            Reference DataFrame.
+        radians : bool, optional
+            Whether the provided Data is in radians or not.
+            , by default False
+        longitude : str, optional
+            Longitude column., by default "longitude"
+        latitude : str, optional
+            Latitude column., by default "latitude"
+        year_threshold : int | None, optional
+            Year threshold the reference data has been filtered with.
+            If None, the data has not been filtered., by default None
+        """
+        xy = data[[longitude, latitude]].to_numpy(float)
+        if not radians:
+            xy = np.deg2rad(xy)
+        self._data = data
+        self._tree = cKDTree(Matcher.convert_to_unit_vectors(*xy.T))
+        self._year_threshold = year_threshold
+
+    @property
+    def data(self) -> DataFrame:
+        """Reference DataFrame."""
+        return self._data
+
+    @property
+    def year_threshold(self) -> int | None:
+        """Year threshold the reference data has been filtered with."""
+        return self._year_threshold
+
+    @property
+    def tree(self) -> cKDTree:
+        """KD-tree of the reference unit vectors."""
+        return self._tree
+
+    def save(self, path: Path) -> None:
+        """Save the index to disk.
+
+        Parameters
+        ----------
+        path : Path
+            Path of the file to write.
+        """
+        path = Path(path)
+        temporary_path = path.with_suffix(f"{path.suffix}.tmp")
+        with temporary_path.open("wb") as file:
+            pickle.dump(self, file, protocol=pickle.HIGHEST_PROTOCOL)
+        # Replace atomically, not to leave a partial index
+        temporary_path.replace(path)
+
+    @classmethod
+    def load(cls: type["SpatialIndex"], path: Path) -> Self:
+        """Load an index saved with `save`.
+
+        Parameters
+        ----------
+        path : Path
+            Path of the saved index.
+
+        Returns
+        -------
+        Self
+            SpatialIndex.
+
+        Raises
+        ------
+        TypeError
+            If the file does not contain a SpatialIndex.
+        """
+        with Path(path).open("rb") as file:
+            index = pickle.load(file)
+        if not isinstance(index, cls):
+            msg = f"{path} does not contain a {cls.__name__}."
+            raise TypeError(msg)
+        return index
+
+
+class ThresholdSweep:
+
+    """Matches over a grid of distance and year thresholds.
+
+    For each year threshold, the closest recent enough right point of
+    each left point is computed once: the matches of any distance
+    threshold are then read from the sorted distances.
+    """
+
+    def __init__(
+        self,
+        km_thresholds: np.ndarray,
+        year_thresholds: np.ndarray,
+        best_distances: np.ndarray,
+        best_positions: np.ndarray,
+    ) -> None:
+        """Instantiate the sweep.
+
+        Parameters
+        ----------
+        km_thresholds : np.ndarray
+            Sorted distance thresholds, in km.
+        year_thresholds : np.ndarray
+            Sorted year thresholds.
+        best_distances : np.ndarray
+            Distance from each left point to its closest right point for
+            each year threshold, of shape (years, left points), infinite
+            if no right point is within the largest distance threshold.
+        best_positions : np.ndarray
+            Position of the closest right points, -1 if none.
+        """
+        self._km_thresholds = km_thresholds
+        self._year_thresholds = year_thresholds
+        self._best_distances = best_distances
+        self._best_positions = best_positions
+        self._order = np.argsort(best_distances, axis=1, kind="stable")
+        self._sorted_distances = np.take_along_axis(
+            best_distances,
+            self._order,
+            axis=1,
+        )
+
+    @property
+    def km_thresholds(self) -> np.ndarray:
+        """Distance thresholds, in km."""
+        return self._km_thresholds
+
+    @property
+    def year_thresholds(self) -> np.ndarray:
+        """Year thresholds."""
+        return self._year_thresholds
+
+    def _year_index(self, year_threshold: int) -> int:
+        """Find the position of a year threshold in the sweep.
+
+        Parameters
+        ----------
+        year_threshold : int
+            Year threshold.
+
+        Returns
+        -------
+        int
+            Position of the year threshold.
+
+        Raises
+        ------
+        ValueError
+            If the year threshold is not part of the sweep.
+        """
+        index = np.searchsorted(self.year_thresholds, year_threshold)
+        if (
+            index == self.year_thresholds.size
+            or self.year_thresholds[index] != year_threshold
+        ):
+            msg = (
+                f"Year threshold {year_threshold} is not part of the sweep."
+                f" Options are: {', '.join(map(str, self.year_thresholds))}."
+            )
+            raise ValueError(msg)
+        return int(index)
+
+    def _count(self, km_threshold: float, year_index: int) -> int:
+        """Count the matches for a pair of thresholds.
+
+        Parameters
+        ----------
+        km_threshold : float
+            Distance threshold, in km.
+        year_index : int
+            Position of the year threshold.
+
+        Returns
+        -------
+        int
+            Number of matched left points.
+
+        Raises
+        ------
+        ValueError
+            If the distance threshold exceeds the largest one of the sweep.
+        """
+        if km_threshold > self.km_thresholds[-1]:
+            msg = (
+                f"Distance threshold {km_threshold} exceeds the largest one"
+                f" of the sweep: {self.km_thresholds[-1]}."
+            )
+            raise ValueError(msg)
+        return int(
+            np.searchsorted(
+                self._sorted_distances[year_index],
+                km_threshold,
+                side="right",
+            )
+        )
+
+    def counts(self) -> DataFrame:
+        """Count the matched left points for each pair of thresholds.
+
+        Returns
+        -------
+        DataFrame
+            Counts, indexed by year thresholds, with a column per distance
+            threshold.
+        """
+        counts = np.column_stack(
+            [
+                np.searchsorted(distances, self.km_thresholds, side="right")
+                for distances in self._sorted_distances
+            ]
+        )
+        return DataFrame(
+            counts.T,
+            index=pd.Index(self.year_thresholds, name="year_threshold"),
+            columns=pd.Index(self.km_thresholds, name="km_threshold"),
+        )
+
+    def distances(
+        self,
+        km_threshold: float,
+        year_threshold: int,
+    ) -> np.ndarray:
+        """Retrieve the sorted distances of the matched pairs.
+
+        Parameters
+        ----------
+        km_threshold : float
+            Distance threshold, in km.
+        year_threshold : int
+            Year threshold.
+
+        Returns
+        -------
+        np.ndarray
+            Distances of the matched pairs, in km, in ascending order.
+        """
+        year_index = self._year_index(year_threshold)
+        count = self._count(km_threshold, year_index)
+        return self._sorted_distances[year_index, :count]
+
+    def distance_quantiles(self, levels: list[float]) -> DataFrame:
+        """Compute the matched distances quantiles for each pair of thresholds.
+
+        Parameters
+        ----------
+        levels : list[float]
+            Quantiles levels, between 0 and 1.
+
+        Returns
+        -------
+        DataFrame
+            Quantiles, indexed by year and distance thresholds, with a
+            column per level. NaN where no pair is matched.
+        """
+        counts = self.counts()
+        quantiles = np.full((counts.size, len(levels)), np.nan)
+        for row, (year_index, km_index) in enumerate(
+            np.ndindex(counts.shape),
+        ):
+            count = counts.iloc[year_index, km_index]
+            if count > 0:
+                quantiles[row] = np.quantile(
+                    self._sorted_distances[year_index, :count],
+                    levels,
+                )
+        return DataFrame(
+            quantiles,
+            index=pd.MultiIndex.from_product(
+                [self.year_thresholds, self.km_thresholds],
+                names=["year_threshold", "km_threshold"],
+            ),
+            columns=levels,
+        )
+
+    def pairs(
+        self,
+        km_threshold: float,
+        year_threshold: int,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Retrieve the matched pairs for a pair of thresholds.
+
+        Parameters
+        ----------
+        km_threshold : float
+            Distance threshold, in km.
+        year_threshold : int
+            Year threshold.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Positions of the matched left points, in ascending order, and
+            positions of their right points.
+        """
+        year_index = self._year_index(year_threshold)
+        count = self._count(km_threshold, year_index)
+        left_positions = np.sort(self._order[year_index, :count])
+        return (
+            left_positions,
+            self._best_positions[year_index, left_positions],
+        )
+
+
 class Matcher:
 
     """Tool to Match Moss Data With RMQS Data."""
 
     metric = "haversine"
+    engines: ClassVar[list[str]] = ["haversine", "kdtree"]
+    # Column of the matched right index, as named by pandas' merge
+    key_column = "key_0"
+    aggregation_methods: ClassVar[list[str]] = ["mean", "median", "idw"]
+    count_column = "count"
+    # Distance under which right points coincide with the left point, in km
+    _idw_min_distance_km = 1e-6
     moss_suffix = "_moss"
     rmqs_suffix = "_rmqs"
     distance_column = "distance"
+    time_gap_column = "time_gap"
+    moss_date_column = "date"
     rmqs_date_column = "date_complete"
     _earth_radius_km = 6371
 
-    def __init__(
+    def __init__(
+        self,
+        *,
+        year_threshold: int = 2000,
+        km_threshold: float = 1,
+        engine: str = "haversine",
+        one_to_one: bool = False,
+        km_per_year: float = 1,
+        workers: int = 1,
+        chunk_size: int = 65_536,
+    ) -> None:
+        """Instanciate Matcher object.
+
+        Parameters
+        ----------
+        year_threshold : int, optional
+            Date Threshold to verify for RMQS data., by default 2000
+        km_threshold : float, optional
+            Maximum accepted distance for closest point in km., by default 1
+        engine : str, optional
+            Nearest neighbours search engine: "haversine" for a ball tree
+            with the haversine metric, "kdtree" for a KD-tree on unit
+            vectors with radius-bounded queries., by default "haversine"
+        one_to_one : bool, optional
+            Whether each right point can only be matched once. If True,
+            the matching maximizes the number of pairs within the
+            threshold, then minimizes their total distance.
+            , by default False
+        km_per_year : float, optional
+            Distance equivalent to a year of time gap, in km, for
+            space-time matching., by default 1
+        workers : int, optional
+            Number of threads querying the nearest neighbours, -1 to use
+            all cores. Threads share the index and the coordinates, which
+            are never copied., by default 1
+        chunk_size : int, optional
+            Number of left points queried by a thread at once.
+            , by default 65_536
+
+        Raises
+        ------
+        ValueError
+            If the engine is not supported.
+        """
+        if engine not in self.engines:
+            msg = (
+                f"Unsupported engine: {engine}."
+                f" Options are: {', '.join(self.engines)}."
+            )
+            raise ValueError(msg)
+        self.year_threshold = year_threshold
+        self.km_threshold = km_threshold
+        self.engine = engine
+        self.one_to_one = one_to_one
+        self.km_per_year = km_per_year
+        self.workers = (os.cpu_count() or 1) if workers == -1 else workers
+        self.chunk_size = chunk_size
+
+    @property
+    def rad_threshold(self) -> float:
+        """Distance Threshold in Radians."""
+        return self.km_threshold / self._earth_radius_km
+
+    @property
+    def chord_threshold(self) -> float:
+        """Distance Threshold as a chord of the unit sphere."""
+        return 2 * np.sin(self.rad_threshold / 2)
+
+    @staticmethod
+    def convert_to_radians(degree_dataframe: DataFrame) -> DataFrame:
+        """Convert a DataFrame in Degree into a DataFrame in Radian.
+
+        Parameters
+        ----------
+        degree_dataframe : DataFrame
+            DataFrame whose values are all in degree.
+
+        Returns
+        -------
+        DataFrame
+            DataFrame whose values are all in radians.
+        """
+        return np.deg2rad(degree_dataframe)
+
+    @staticmethod
+    def convert_to_unit_vectors(
+        longitudes: np.ndarray,
+        latitudes: np.ndarray,
+    ) -> np.ndarray:
+        """Convert coordinates in radians into unit vectors.
+
+        Parameters
+        ----------
+        longitudes : np.ndarray
+            Longitudes, in radians.
+        latitudes : np.ndarray
+            Latitudes, in radians.
+
+        Returns
+        -------
+        np.ndarray
+            Unit vectors, of shape (n, 3).
+        """
+        return np.column_stack(
+            [
+                np.cos(latitudes) * np.cos(longitudes),
+                np.cos(latitudes) * np.sin(longitudes),
+                np.sin(latitudes),
+            ]
+        )
+
+    @staticmethod
+    def convert_to_years(dates: pd.Series) -> np.ndarray:
+        """Convert dates into fractional years since 1970.
+
+        Parameters
+        ----------
+        dates : pd.Series
+            Dates.
+
+        Returns
+        -------
+        np.ndarray
+            Fractional years, NaN for missing dates.
+        """
+        elapsed = pd.to_datetime(dates) - pd.Timestamp(0)
+        return (elapsed / pd.Timedelta(days=365.25)).to_numpy(
+            dtype=float,
+            na_value=np.nan,
+        )
+
+    def _space_time_points(
+        self,
+        xy: np.ndarray,
+        years: np.ndarray,
+    ) -> np.ndarray:
+        """Embed locations and dates in a single space-time space.
+
+        Parameters
+        ----------
+        xy : np.ndarray
+            Longitudes and latitudes, in radians.
+        years : np.ndarray
+            Fractional years.
+
+        Returns
+        -------
+        np.ndarray
+            Points of shape (n, 4): geocentric coordinates in km and
+            scaled dates, in km.
+        """
+        return np.column_stack(
+            [
+                self._earth_radius_km * self.convert_to_unit_vectors(*xy.T),
+                years * self.km_per_year,
+            ]
+        )
+
+    def _query_in_chunks(
+        self,
+        query: Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]],
+        points: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Run a nearest neighbours query on chunks of points in parallel.
+
+        Queries release the GIL, so that threads run concurrently while
+        sharing the index. Results are concatenated in the points' order,
+        hence identical to a single query.
+
+        Parameters
+        ----------
+        query : Callable[[np.ndarray], tuple[np.ndarray, np.ndarray]]
+            Query returning distances and indexes of some points.
+        points : np.ndarray
+            Points to query.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Distances and indexes of all points.
+        """
+        if self.workers <= 1 or points.shape[0] <= self.chunk_size:
+            return query(points)
+        chunks = [
+            points[start : start + self.chunk_size]
+            for start in range(0, points.shape[0], self.chunk_size)
+        ]
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            results = list(executor.map(query, chunks))
+        distances, indexes = zip(*results, strict=True)
+        return np.concatenate(distances), np.concatenate(indexes)
+
+    @staticmethod
+    def _first_colocated(points: np.ndarray) -> np.ndarray:
+        """Lowest position of the points located at each point.
+
+        Co-located points are equally distant from any other point, so
+        that nearest neighbours searches pick any of them. Replacing
+        positions by the lowest co-located one makes all engines agree.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            Coordinates of the points, of shape (n, d).
+
+        Returns
+        -------
+        np.ndarray
+            Lowest position of the points sharing each point's coordinates.
+        """
+        _, first, inverse = np.unique(
+            points,
+            axis=0,
+            return_index=True,
+            return_inverse=True,
+        )
+        return first[inverse.ravel()]
+
+    def _haversine_neighbors(
+        self,
+        left_xy: np.ndarray,
+        right_xy: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the closest right point of each left point with a ball tree.
+
+        Parameters
+        ----------
+        left_xy : np.ndarray
+            Left longitudes and latitudes, in radians.
+        right_xy : np.ndarray
+            Right longitudes and latitudes, in radians.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Whether each left point has a right point within the distance
+            threshold, and the position of its closest right point, the
+            lowest one among co-located closest right points.
+        """
+        # Haversine metric expects latitudes first
+        estimator = NearestNeighbors(n_neighbors=1, metric=self.metric)
+        estimator.fit(right_xy[:, ::-1])
+        distances, indexes = self._query_in_chunks(
+            estimator.kneighbors,
+            np.ascontiguousarray(left_xy[:, ::-1]),
+        )
+        # Verify Distance Threshold
+        is_lower_than_threshold = (distances <= self.rad_threshold).flatten()
+        return (
+            is_lower_than_threshold,
+            self._first_colocated(right_xy)[indexes.flatten()],
+        )
+
+    def _kdtree_neighbors(
+        self,
+        left_xy: np.ndarray,
+        right_tree: cKDTree,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the closest right point of each left point with a KD-tree.
+
+        Points are indexed as unit vectors, so that the distance threshold
+        becomes a chord: right points beyond it are never considered.
+
+        Parameters
+        ----------
+        left_xy : np.ndarray
+            Left longitudes and latitudes, in radians.
+        right_tree : cKDTree
+            KD-tree of the right unit vectors.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Whether each left point has a right point within the distance
+            threshold, and the position of its closest right point, the
+            lowest one among co-located closest right points.
+        """
+        left_points = self.convert_to_unit_vectors(*left_xy.T)
+        # Widen the bound slightly to keep points exactly at the threshold
+        distances, indexes = self._query_in_chunks(
+            partial(
+                right_tree.query,
+                k=1,
+                distance_upper_bound=np.nextafter(
+                    self.chord_threshold,
+                    np.inf,
+                ),
+            ),
+            left_points,
+        )
+        is_lower_than_threshold = distances <= self.chord_threshold
+        # Missing neighbours are flagged by the number of right points
+        first_colocated = np.append(
+            self._first_colocated(right_tree.data),
+            right_tree.n,
+        )
+        return is_lower_than_threshold, first_colocated[indexes]
+
+    def _radius_pairs(
+        self,
+        left_xy: np.ndarray,
+        right_tree: cKDTree,
+        km_threshold: float | None = None,
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Find all pairs of left and right points within the threshold.
+
+        Parameters
+        ----------
+        left_xy : np.ndarray
+            Left longitudes and latitudes, in radians.
+        right_tree : cKDTree
+            KD-tree of the right unit vectors.
+        km_threshold : float | None, optional
+            Distance threshold in km, `km_threshold` of the Matcher if
+            None., by default None
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray, np.ndarray]
+            Positions of the left points, positions of the right points
+            and great-circle distances of the pairs, in km.
+        """
+        if km_threshold is None:
+            chord_threshold = self.chord_threshold
+        else:
+            chord_threshold = 2 * np.sin(
+                km_threshold / self._earth_radius_km / 2,
+            )
+        left_tree = cKDTree(self.convert_to_unit_vectors(*left_xy.T))
+        # Batched radius query between both trees
+        pairs = left_tree.sparse_distance_matrix(
+            right_tree,
+            max_distance=chord_threshold,
+            output_type="ndarray",
+        )
+        arcs = 2 * np.arcsin(np.minimum(pairs["v"] / 2, 1))
+        return pairs["i"], pairs["j"], arcs * self._earth_radius_km
+
+    def _assign(
+        self,
+        left_xy: np.ndarray,
+        right_tree: cKDTree,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Match left and right points one to one.
+
+        Pairs within the threshold form a sparse bipartite graph. The
+        matching maximizes the number of pairs, then minimizes their total
+        distance, without ever building a dense cost matrix: a maximum
+        matching splits the graph into three blocks (Dulmage-Mendelsohn
+        decomposition), each of which is fully matched by every maximum
+        matching, so each block's full matching of minimal distance is
+        computed on its sparse biadjacency.
+
+        Parameters
+        ----------
+        left_xy : np.ndarray
+            Left longitudes and latitudes, in radians.
+        right_tree : cKDTree
+            KD-tree of the right unit vectors.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Positions of the matched left points, sorted, and positions of
+            their right points.
+        """
+        lefts, rights, distances = self._radius_pairs(left_xy, right_tree)
+        left_nb = left_xy.shape[0]
+        right_nb = right_tree.n
+        structure = csr_matrix(
+            (np.ones(lefts.shape[0]), (lefts, rights)),
+            shape=(left_nb, right_nb),
+        )
+        # Mate of each left point in a maximum matching, -1 if unmatched
+        left_mates = maximum_bipartite_matching(structure, perm_type="column")
+        right_mates = np.full(right_nb, -1)
+        is_left_matched = left_mates >= 0
+        right_mates[left_mates[is_left_matched]] = np.flatnonzero(
+            is_left_matched,
+        )
+        # Points reachable by alternating paths from unmatched points
+        left_surplus, right_of_left_surplus = self._alternating_reach(
+            lefts,
+            rights,
+            left_mates,
+            right_mates,
+        )
+        right_surplus, left_of_right_surplus = self._alternating_reach(
+            rights,
+            lefts,
+            right_mates,
+            left_mates,
+        )
+        left_blocks = np.where(left_surplus, 0, 2)
+        left_blocks[left_of_right_surplus] = 1
+        right_blocks = np.where(right_surplus, 1, 2)
+        right_blocks[right_of_left_surplus] = 0
+        # Pairs between blocks are never part of a maximum matching
+        is_inner = left_blocks[lefts] == right_blocks[rights]
+        matched_lefts = []
+        matched_rights = []
+        for block in range(3):
+            in_block = is_inner & (left_blocks[lefts] == block)
+            if not in_block.any():
+                continue
+            block_lefts, left_inverse = np.unique(
+                lefts[in_block],
+                return_inverse=True,
+            )
+            block_rights, right_inverse = np.unique(
+                rights[in_block],
+                return_inverse=True,
+            )
+            # Every full matching of a block has as many pairs: shifting
+            # all distances by one keeps the optimum without null weights
+            biadjacency = csr_matrix(
+                (distances[in_block] + 1, (left_inverse, right_inverse)),
+                shape=(block_lefts.size, block_rights.size),
+            )
+            rows, columns = min_weight_full_bipartite_matching(biadjacency)
+            matched_lefts.append(block_lefts[rows])
+            matched_rights.append(block_rights[columns])
+        if not matched_lefts:
+            return np.array([], dtype=int), np.array([], dtype=int)
+        matched_lefts = np.concatenate(matched_lefts)
+        matched_rights = np.concatenate(matched_rights)
+        order = np.argsort(matched_lefts)
+        return matched_lefts[order], matched_rights[order]
+
+    @staticmethod
+    def _alternating_reach(
+        sources: np.ndarray,
+        targets: np.ndarray,
+        source_mates: np.ndarray,
+        target_mates: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Find the points reachable by alternating paths from unmatched ones.
+
+        Paths start from the unmatched points of the source side, go to
+        the target side through any pair and come back through the
+        matching.
+
+        Parameters
+        ----------
+        sources : np.ndarray
+            Positions of the source points of the pairs.
+        targets : np.ndarray
+            Positions of the target points of the pairs.
+        source_mates : np.ndarray
+            Mate of each source point in the maximum matching, -1 if
+            unmatched.
+        target_mates : np.ndarray
+            Mate of each target point in the maximum matching, -1 if
+            unmatched.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Boolean masks of the reachable source and target points.
+        """
+        source_nb = source_mates.shape[0]
+        target_nb = target_mates.shape[0]
+        # Nodes: source points, then target points, then a root node
+        root = source_nb + target_nb
+        is_target_matched = target_mates >= 0
+        unmatched_sources = np.flatnonzero(source_mates < 0)
+        tails = np.concatenate(
+            [
+                sources,
+                np.flatnonzero(is_target_matched) + source_nb,
+                np.full(unmatched_sources.shape[0], root),
+            ],
+        )
+        heads = np.concatenate(
+            [
+                targets + source_nb,
+                target_mates[is_target_matched],
+                unmatched_sources,
+            ],
+        )
+        graph = csr_matrix(
+            (np.ones(tails.shape[0]), (tails, heads)),
+            shape=(root + 1, root + 1),
+        )
+        reached = breadth_first_order(
+            graph,
+            root,
+            directed=True,
+            return_predecessors=False,
+        )
+        is_reached = np.zeros(root + 1, dtype=bool)
+        is_reached[reached] = True
+        return is_reached[:source_nb], is_reached[source_nb:root]
+
+    @staticmethod
+    def _grouped_median(
+        groups: np.ndarray,
+        values: np.ndarray,
+        groups_nb: int,
+    ) -> np.ndarray:
+        """Median of the values of each group, ignoring missing values.
+
+        Parameters
+        ----------
+        groups : np.ndarray
+            Group of each value.
+        values : np.ndarray
+            Values.
+        groups_nb : int
+            Number of groups.
+
+        Returns
+        -------
+        np.ndarray
+            Median of each group, NaN for groups without values.
+        """
+        present = ~np.isnan(values)
+        groups, values = groups[present], values[present]
+        # Sort values within each group
+        order = np.lexsort((values, groups))
+        sorted_values = values[order]
+        counts = np.bincount(groups, minlength=groups_nb)
+        starts = np.cumsum(counts) - counts
+        medians = np.full(groups_nb, np.nan)
+        has_values = counts > 0
+        low = starts + (counts - 1) // 2
+        high = starts + counts // 2
+        medians[has_values] = (
+            sorted_values[low[has_values]] + sorted_values[high[has_values]]
+        ) / 2
+        return medians
+
+    def aggregate_right_to_left(
+        self,
+        left_data: DataFrame,
+        right_data: DataFrame,
+        radians: bool,
+        *,
+        fields: list[str],
+        method: str = "mean",
+        idw_power: float = 2,
+        left_longitude: str = "longitude",
+        left_latitude: str = "latitude",
+        right_longitude: str = "longitude",
+        right_latitude: str = "latitude",
+        suffix: str = "_right",
+    ) -> DataFrame:
+        """Aggregate all right points within the threshold onto left ones.
+
+        All pairs are found with a single batched radius query, then
+        aggregated with sparse reductions.
+
+        Parameters
+        ----------
+        left_data : DataFrame
+            Left DataFrame.
+        right_data : DataFrame
+            Right DataFrame.
+        radians: bool
+            Whether the provided Data is in radians or not.
+        fields : list[str]
+            Fields of the right DataFrame to aggregate.
+        method : str, optional
+            Aggregation method: "mean", "median" or "idw" for the
+            inverse-distance-weighted mean., by default "mean"
+        idw_power : float, optional
+            Power of the distance in the inverse-distance weights.
+            , by default 2
+        left_longitude : str, optional
+            Longitude column for the left DataFrame., by default "longitude"
+        left_latitude : str, optional
+            Latitude column for the left DataFrame., by default "latitude"
+        right_longitude : str, optional
+            Longitude column for the right DataFrame., by default "longitude"
+        right_latitude : str, optional
+            Latitude column for the right DataFrame., by default "latitude"
+        suffix : str, optional
+            Suffix of the aggregated fields., by default "_right"
+
+        Returns
+        -------
+        DataFrame
+            Left points with at least one right point within the
+            threshold, with the aggregated fields and the number of right
+            points within the threshold.
+
+        Raises
+        ------
+        ValueError
+            If the aggregation method is not supported.
+        """
+        if method not in self.aggregation_methods:
+            msg = (
+                f"Unsupported aggregation method: {method}."
+                f" Options are: {', '.join(self.aggregation_methods)}."
+            )
+            raise ValueError(msg)
+        left_xy = left_data[[left_longitude, left_latitude]].to_numpy(float)
+        right_xy = right_data[[right_longitude, right_latitude]].to_numpy(
+            float,
+        )
+        if not radians:
+            left_xy = np.deg2rad(left_xy)
+            right_xy = np.deg2rad(right_xy)
+        lefts, rights, distances = self._radius_pairs(
+            left_xy,
+            cKDTree(self.convert_to_unit_vectors(*right_xy.T)),
+        )
+        shape = (left_data.shape[0], right_data.shape[0])
+        counts = np.bincount(lefts, minlength=shape[0])
+        values = right_data[fields].to_numpy(dtype=float, na_value=np.nan)
+        if method == "median":
+            aggregated = np.column_stack(
+                [
+                    self._grouped_median(lefts, values[rights, i], shape[0])
+                    for i in range(len(fields))
+                ]
+            )
+        else:
+            if method == "idw":
+                weights = np.maximum(
+                    distances,
+                    self._idw_min_distance_km,
+                ) ** (-idw_power)
+            else:
+                weights = np.ones(lefts.shape[0])
+            # Sparse matrix of the weights of the pairs
+            pairs_weights = csr_matrix((weights, (lefts, rights)), shape=shape)
+            present = ~np.isnan(values)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                aggregated = (pairs_weights @ np.where(present, values, 0)) / (
+                    pairs_weights @ present.astype(float)
+                )
+        has_neighbors = counts > 0
+        matched = left_data[has_neighbors].copy()
+        for i, field in enumerate(fields):
+            matched[f"{field}{suffix}"] = aggregated[has_neighbors, i]
+        matched[self.count_column] = counts[has_neighbors]
+        return matched
+
+    def _apply_year_threshold(
+        self,
+        rmqs_data: DataFrame,
+        date_column: str,
+    ) -> DataFrame:
+        """Apply the year threshold to the RMQS Data.
+
+        Parameters
+        ----------
+        rmqs_data : DataFrame
+            RMQS Data.
+        date_column : str
+            Name of the column with the year informations.
+
+        Returns
+        -------
+        DataFrame
+            RMQS Data whose dates are more recent than the threshold.
+        """
+        dates = rmqs_data[date_column]
+
+        is_greater_than_threshold = dates.dt.year >= self.year_threshold
+
+        return rmqs_data[is_greater_than_threshold]
+
+    @overload
+    def right_to_left(
+        self,
+        left_data: DataFrame,
+        right_data: DataFrame,
+        radians: bool,
+        *,
+        left_longitude: str = ...,
+        left_latitude: str = ...,
+        right_longitude: str = ...,
+        right_latitude: str = ...,
+        suffixes: tuple[str, str] = ...,
+        leftovers: Literal[False] = ...,
+    ) -> DataFrame:
+        ...
+
+    @overload
+    def right_to_left(
+        self,
+        left_data: DataFrame,
+        right_data: DataFrame,
+        radians: bool,
+        *,
+        left_longitude: str = ...,
+        left_latitude: str = ...,
+        right_longitude: str = ...,
+        right_latitude: str = ...,
+        suffixes: tuple[str, str] = ...,
+        leftovers: Literal[True] = ...,
+    ) -> tuple[DataFrame, DataFrame]:
+        ...
+
+    def right_to_left(
+        self,
+        left_data: DataFrame,
+        right_data: DataFrame,
+        radians: bool,
+        *,
+        left_longitude: str = "longitude",
+        left_latitude: str = "latitude",
+        right_longitude: str = "longitude",
+        right_latitude: str = "latitude",
+        suffixes: tuple[str, str] = ("_left", "_right"),
+        leftovers: bool = False,
+    ) -> DataFrame | tuple[DataFrame, DataFrame]:
+        """Match a Dataframe (right) onto another one (left).
+
+        Parameters
+        ----------
+        left_data : DataFrame
+            Left DataFrame.
+        right_data : DataFrame
+            Right DataFrame.
+        radians: bool
+            Whether the provided Data is in radians or not.
+        left_longitude : str, optional
+            Longitude column for the left DataFrame., by default "longitude"
+        left_latitude : str, optional
+            Latitude column for the left DataFrame., by default "latitude"
+        right_longitude : str, optional
+            Longitude column for the right DataFrame., by default "longitude"
+        right_latitude : str, optional
+            Latitude column for the right DataFrame., by default "latitude"
+        suffixes : tuple[str, str], optional
+            Suffixes to use for merging., by default ("_left", "_right")
+        leftovers: bool, optional
+            Whether to return unused data from right dataframe or not.
+            , by default False
+
+        Returns
+        -------
+        DataFrame | tuple[DataFrame, DataFrame]
+            Matched DataFrame of right onto left and
+             leftovers dataframe if `leftovers` is True.
+        """
+        # Slice to conserve only coordinates.
+        left_xy = left_data[[left_longitude, left_latitude]].to_numpy(float)
+        right_xy = right_data[[right_longitude, right_latitude]].to_numpy(
+            float,
+        )
+        if not radians:
+            left_xy = np.deg2rad(left_xy)
+            right_xy = np.deg2rad(right_xy)
+
+        if self.one_to_one or self.engine == "kdtree":
+            right_tree = cKDTree(self.convert_to_unit_vectors(*right_xy.T))
+            left_positions, right_positions = self._match_positions(
+                left_xy,
+                right_tree,
+            )
+        else:
+            is_lower_than_threshold, indexes = self._haversine_neighbors(
+                left_xy,
+                right_xy,
+            )
+            left_positions = np.flatnonzero(is_lower_than_threshold)
+            right_positions = indexes[is_lower_than_threshold]
+        return self._join(
+            left_data=left_data,
+            right_data=right_data,
+            left_positions=left_positions,
+            right_positions=right_positions,
+            suffixes=suffixes,
+            leftovers=leftovers,
+        )
+
+    def _match_positions(
+        self,
+        left_xy: np.ndarray,
+        right_tree: cKDTree,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Match left points onto the right points of a KD-tree.
+
+        Parameters
+        ----------
+        left_xy : np.ndarray
+            Left longitudes and latitudes, in radians.
+        right_tree : cKDTree
+            KD-tree of the right unit vectors.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Positions of the matched left points, sorted, and positions of
+            their right points.
+        """
+        if self.one_to_one:
+            return self._assign(left_xy, right_tree)
+        is_lower_than_threshold, indexes = self._kdtree_neighbors(
+            left_xy,
+            right_tree,
+        )
+        left_positions = np.flatnonzero(is_lower_than_threshold)
+        return left_positions, indexes[is_lower_than_threshold]
+
+    def _join(
+        self,
+        left_data: DataFrame,
+        right_data: DataFrame,
+        left_positions: np.ndarray,
+        right_positions: np.ndarray,
+        *,
+        suffixes: tuple[str, str],
+        leftovers: bool,
+    ) -> DataFrame | tuple[DataFrame, DataFrame]:
+        """Join matched left and right rows based on their positions.
+
+        Parameters
+        ----------
+        left_data : DataFrame
+            Left DataFrame.
+        right_data : DataFrame
+            Right DataFrame.
+        left_positions : np.ndarray
+            Positions of the matched left rows.
+        right_positions : np.ndarray
+            Positions of their matched right rows.
+        suffixes : tuple[str, str]
+            Suffixes to use for overlapping columns.
+        leftovers : bool
+            Whether to return unused data from right dataframe or not.
+
+        Returns
+        -------
+        DataFrame | tuple[DataFrame, DataFrame]
+            Matched DataFrame of right onto left and
+             leftovers dataframe if `leftovers` is True.
+        """
+        # Conserve points matching threshold
+        left_data_cropped = left_data.take(left_positions)
+        # Join left data to right data based on positions.
+        right_matched = right_data.take(right_positions)
+        overlap = left_data.columns.intersection(right_data.columns)
+        merged = pd.concat(
+            [
+                left_data_cropped.rename(
+                    columns={c: f"{c}{suffixes[0]}" for c in overlap},
+                ),
+                right_matched.rename(
+                    columns={c: f"{c}{suffixes[1]}" for c in overlap},
+                ).set_axis(left_data_cropped.index),
+            ],
+            axis=1,
+        )
+        merged.insert(0, self.key_column, right_matched.index)
+        if leftovers:
+            is_conserved = np.zeros(right_data.shape[0], dtype=bool)
+            is_conserved[right_positions] = True
+            # Extract unmerged points to return as leftovers
+            return merged, right_data[~is_conserved]
+        return merged
+
+    @overload
+    def match_rmqs_to_moss(
+        self,
+        moss_data: DataFrame,
+        rmqs_data: DataFrame,
+        radians: bool = ...,
+        *,
+        moss_longitude: str = ...,
+        moss_latitude: str = ...,
+        rmqs_longitude: str = ...,
+        rmqs_latitude: str = ...,
+        leftovers: Literal[True],
+    ) -> tuple[DataFrame, DataFrame]:
+        ...
+
+    @overload
+    def match_rmqs_to_moss(
+        self,
+        moss_data: DataFrame,
+        rmqs_data: DataFrame,
+        radians: bool = ...,
+        *,
+        moss_longitude: str = ...,
+        moss_latitude: str = ...,
+        rmqs_longitude: str = ...,
+        rmqs_latitude: str = ...,
+        leftovers: Literal[False],
+    ) -> DataFrame:
+        ...
+
+    def match_rmqs_to_moss(
+        self,
+        moss_data: DataFrame,
+        rmqs_data: DataFrame,
+        radians: bool = False,
+        *,
+        moss_longitude: str = "longitude",
+        moss_latitude: str = "latitude",
+        rmqs_longitude: str = "longitude",
+        rmqs_latitude: str = "latitude",
+        leftovers: bool = False,
+    ) -> tuple[DataFrame, DataFrame] | DataFrame:
+        """Match RMQS to Moss Data.
+
+        Final Output will have as many rows as Moss DataFrame.
+
+        Parameters
+        ----------
+        moss_data : DataFrame
+            DataFrame containing Moss Data.
+        rmqs_data : DataFrame
+            DataFrame containing RMQS Data.
+        radians: bool
+            Whether the provided Data is in radians or not.by default False
+        moss_longitude : str, optional
+            Label for longitude in moss DataFrame., by default "longitude"
+        moss_latitude : str, optional
+            Label for latitude in moss DataFrame., by default "latitude"
+        rmqs_longitude : str, optional
+            Label for longitude in RMQS DataFrame., by default "longitude"
+        rmqs_latitude : str, optional
+            Label for latitude in RMQS DataFrame., by default "latitude"
+        leftovers: bool, optional
+            Whether to return unused data from right dataframe or not.
+            , by default False
+
+        Returns
+        -------
+        DataFrame | tuple[DataFrame, DataFrame]
+            Matched DataFrame of right onto left and
+             leftovers dataframe if `leftovers` is True.
+        """
+        rmqs_sliced = self._apply_year_threshold(
+            rmqs_data=rmqs_data,
+            date_column=self.rmqs_date_column,
+        )
+        # Perform right to left match with moss as left and rmqs as right
+        return self.right_to_left(
+            left_data=moss_data,
+            right_data=rmqs_sliced,
+            radians=radians,
+            left_longitude=moss_longitude,
+            left_latitude=moss_latitude,
+            right_longitude=rmqs_longitude,
+            right_latitude=rmqs_latitude,
+            suffixes=(self.moss_suffix, self.rmqs_suffix),
+            leftovers=leftovers,
+        )
+
+    @overload
+    def match_moss_to_rmqs(
+        self,
+        moss_data: DataFrame,
+        rmqs_data: DataFrame,
+        radians: bool = ...,
+        *,
+        moss_longitude: str = ...,
+        moss_latitude: str = ...,
+        rmqs_longitude: str = ...,
+        rmqs_latitude: str = ...,
+        leftovers: Literal[True],
+    ) -> tuple[DataFrame, DataFrame]:
+        ...
+
+    @overload
+    def match_moss_to_rmqs(
+        self,
+        moss_data: DataFrame,
+        rmqs_data: DataFrame,
+        radians: bool = ...,
+        *,
+        moss_longitude: str = ...,
+        moss_latitude: str = ...,
+        rmqs_longitude: str = ...,
+        rmqs_latitude: str = ...,
+        leftovers: Literal[False],
+    ) -> DataFrame:
+        ...
+
+    def match_moss_to_rmqs(
+        self,
+        moss_data: DataFrame,
+        rmqs_data: DataFrame,
+        radians: bool = True,
+        *,
+        moss_longitude: str = "longitude",
+        moss_latitude: str = "latitude",
+        rmqs_longitude: str = "longitude",
+        rmqs_latitude: str = "latitude",
+        leftovers: bool = False,
+    ) -> tuple[DataFrame, DataFrame] | DataFrame:
+        """Match Moss to RMQS Data.
+
+        Final Output will have as many rows as RMQS DataFrame.
+
+        Parameters
+        ----------
+        moss_data : DataFrame
+            DataFrame containing Moss Data.
+        rmqs_data : DataFrame
+            DataFrame containing RMQS Data.
+        radians: bool
+            Whether the provided Data is in radians or not.by default False
+        moss_longitude : str, optional
+            Label for longitude in moss DataFrame., by default "longitude"
+        moss_latitude : str, optional
+            Label for latitude in moss DataFrame., by default "latitude"
+        rmqs_longitude : str, optional
+            Label for longitude in RMQS DataFrame., by default "longitude"
+        rmqs_latitude : str, optional
+            Label for latitude in RMQS DataFrame., by default "latitude"
+        leftovers: bool, optional
+            Whether to return unused data from right dataframe or not.
+            , by default False
+
+        Returns
+        -------
+        DataFrame | tuple[DataFrame, DataFrame]
+            Matched DataFrame of right onto left and
+             leftovers dataframe if `leftovers` is True.
+        """
+        rmqs_sliced = self._apply_year_threshold(
+            rmqs_data=rmqs_data,
+            date_column=self.rmqs_date_column,
+        )
+        # Perform right to left match with rmqs as left and rmqs as left
+        return self.right_to_left(
+            right_data=moss_data,
+            left_data=rmqs_sliced,
+            radians=radians,
+            right_longitude=moss_longitude,
+            right_latitude=moss_latitude,
+            left_longitude=rmqs_longitude,
+            left_latitude=rmqs_latitude,
+            suffixes=(self.moss_suffix, self.rmqs_suffix),
+            leftovers=leftovers,
+        )
+
+    def aggregate_rmqs_to_moss(
+        self,
+        moss_data: DataFrame,
+        rmqs_data: DataFrame,
+        radians: bool = False,
+        *,
+        fields: list[str],
+        method: str = "mean",
+        idw_power: float = 2,
+        moss_longitude: str = "longitude",
+        moss_latitude: str = "latitude",
+        rmqs_longitude: str = "longitude",
+        rmqs_latitude: str = "latitude",
+    ) -> DataFrame:
+        """Aggregate all RMQS sites within the threshold onto Moss Data.
+
+        Parameters
+        ----------
+        moss_data : DataFrame
+            DataFrame containing Moss Data.
+        rmqs_data : DataFrame
+            DataFrame containing RMQS Data.
+        radians: bool
+            Whether the provided Data is in radians or not.by default False
+        fields : list[str]
+            RMQS fields to aggregate.
+        method : str, optional
+            Aggregation method: "mean", "median" or "idw" for the
+            inverse-distance-weighted mean., by default "mean"
+        idw_power : float, optional
+            Power of the distance in the inverse-distance weights.
+            , by default 2
+        moss_longitude : str, optional
+            Label for longitude in moss DataFrame., by default "longitude"
+        moss_latitude : str, optional
+            Label for latitude in moss DataFrame., by default "latitude"
+        rmqs_longitude : str, optional
+            Label for longitude in RMQS DataFrame., by default "longitude"
+        rmqs_latitude : str, optional
+            Label for latitude in RMQS DataFrame., by default "latitude"
+
+        Returns
+        -------
+        DataFrame
+            Moss Data with RMQS sites within the threshold, with the
+            aggregated RMQS fields and the number of RMQS sites.
+        """
+        rmqs_sliced = self._apply_year_threshold(
+            rmqs_data=rmqs_data,
+            date_column=self.rmqs_date_column,
+        )
+        return self.aggregate_right_to_left(
+            left_data=moss_data,
+            right_data=rmqs_sliced,
+            radians=radians,
+            fields=fields,
+            method=method,
+            idw_power=idw_power,
+            left_longitude=moss_longitude,
+            left_latitude=moss_latitude,
+            right_longitude=rmqs_longitude,
+            right_latitude=rmqs_latitude,
+            suffix=self.rmqs_suffix,
+        )
+
+    def build_rmqs_index(
+        self,
+        rmqs_data: DataFrame,
+        radians: bool = False,
+        *,
+        rmqs_longitude: str = "longitude",
+        rmqs_latitude: str = "latitude",
+    ) -> SpatialIndex:
+        """Build a reusable index over RMQS Data.
+
+        The year threshold is applied before building the index.
+
+        Parameters
+        ----------
+        rmqs_data : DataFrame
+            DataFrame containing RMQS Data.
+        radians: bool
+            Whether the provided Data is in radians or not.by default False
+        rmqs_longitude : str, optional
+            Label for longitude in RMQS DataFrame., by default "longitude"
+        rmqs_latitude : str, optional
+            Label for latitude in RMQS DataFrame., by default "latitude"
+
+        Returns
+        -------
+        SpatialIndex
+            Index over the RMQS Data more recent than the threshold.
+        """
+        rmqs_sliced = self._apply_year_threshold(
+            rmqs_data=rmqs_data,
+            date_column=self.rmqs_date_column,
+        )
+        return SpatialIndex(
+            rmqs_sliced,
+            radians=radians,
+            longitude=rmqs_longitude,
+            latitude=rmqs_latitude,
+            year_threshold=self.year_threshold,
+        )
+
+    @overload
+    def match_to_index(
+        self,
+        left_data: DataFrame,
+        index: SpatialIndex,
+        radians: bool = ...,
+        *,
+        left_longitude: str = ...,
+        left_latitude: str = ...,
+        suffixes: tuple[str, str] = ...,
+        leftovers: Literal[False] = ...,
+    ) -> DataFrame:
+        ...
+
+    @overload
+    def match_to_index(
+        self,
+        left_data: DataFrame,
+        index: SpatialIndex,
+        radians: bool = ...,
+        *,
+        left_longitude: str = ...,
+        left_latitude: str = ...,
+        suffixes: tuple[str, str] = ...,
+        leftovers: Literal[True] = ...,
+    ) -> tuple[DataFrame, DataFrame]:
+        ...
+
+    def match_to_index(
         self,
+        left_data: DataFrame,
+        index: SpatialIndex,
+        radians: bool = False,
         *,
-        year_threshold: int = 2000,
-        km_threshold: float = 1,
-    ) -> None:
-        """Instanciate Matcher object.
-
-        Parameters
-        ----------
-        year_threshold : int, optional
-            Date Threshold to verify for RMQS data., by default 2000
-        km_threshold : float, optional
-            Maximum accepted distance for closest point in km., by default 1
-        """
-        self.year_threshold = year_threshold
-        self.km_threshold = km_threshold
-
-    @property
-    def rad_threshold(self) -> float:
-        """Distance Threshold in Radians."""
-        return self.km_threshold / self._earth_radius_km
+        left_longitude: str = "longitude",
+        left_latitude: str = "latitude",
+        suffixes: tuple[str, str] = ("_left", "_right"),
+        leftovers: bool = False,
+    ) -> DataFrame | tuple[DataFrame, DataFrame]:
+        """Match the indexed Data (right) onto a DataFrame (left).
 
-    @staticmethod
-    def convert_to_radians(degree_dataframe: DataFrame) -> DataFrame:
-        """Convert a DataFrame in Degree into a DataFrame in Radian.
+        Same as `right_to_left`, without building the right tree.
 
         Parameters
         ----------
-        degree_dataframe : DataFrame
-            DataFrame whose values are all in degree.
+        left_data : DataFrame
+            Left DataFrame.
+        index : SpatialIndex
+            Index over the right Data.
+        radians: bool
+            Whether the provided Data is in radians or not.by default False
+        left_longitude : str, optional
+            Longitude column for the left DataFrame., by default "longitude"
+        left_latitude : str, optional
+            Latitude column for the left DataFrame., by default "latitude"
+        suffixes : tuple[str, str], optional
+            Suffixes to use for merging., by default ("_left", "_right")
+        leftovers: bool, optional
+            Whether to return unused data from right dataframe or not.
+            , by default False
 
         Returns
         -------
-        DataFrame
-            DataFrame whose values are all in radians.
+        DataFrame | tuple[DataFrame, DataFrame]
+            Matched DataFrame of right onto left and
+             leftovers dataframe if `leftovers` is True.
         """
-        return np.deg2rad(degree_dataframe)
+        left_xy = left_data[[left_longitude, left_latitude]].to_numpy(float)
+        if not radians:
+            left_xy = np.deg2rad(left_xy)
+        left_positions, right_positions = self._match_positions(
+            left_xy,
+            index.tree,
+        )
+        return self._join(
+            left_data=left_data,
+            right_data=index.data,
+            left_positions=left_positions,
+            right_positions=right_positions,
+            suffixes=suffixes,
+            leftovers=leftovers,
+        )
 
-    def _apply_year_threshold(
+    @overload
+    def match_rmqs_index_to_moss(
         self,
-        rmqs_data: DataFrame,
-        date_column: str,
+        moss_data: DataFrame,
+        rmqs_index: SpatialIndex,
+        radians: bool = ...,
+        *,
+        moss_longitude: str = ...,
+        moss_latitude: str = ...,
+        leftovers: Literal[True],
+    ) -> tuple[DataFrame, DataFrame]:
+        ...
+
+    @overload
+    def match_rmqs_index_to_moss(
+        self,
+        moss_data: DataFrame,
+        rmqs_index: SpatialIndex,
+        radians: bool = ...,
+        *,
+        moss_longitude: str = ...,
+        moss_latitude: str = ...,
+        leftovers: Literal[False],
     ) -> DataFrame:
-        """Apply the year threshold to the RMQS Data.
+        ...
+
+    def match_rmqs_index_to_moss(
+        self,
+        moss_data: DataFrame,
+        rmqs_index: SpatialIndex,
+        radians: bool = False,
+        *,
+        moss_longitude: str = "longitude",
+        moss_latitude: str = "latitude",
+        leftovers: bool = False,
+    ) -> tuple[DataFrame, DataFrame] | DataFrame:
+        """Match indexed RMQS to Moss Data.
+
+        Same as `match_rmqs_to_moss`, with an index built by
+        `build_rmqs_index`.
 
         Parameters
         ----------
-        rmqs_data : DataFrame
-            RMQS Data.
-        date_column : str
-            Name of the column with the year informations.
+        moss_data : DataFrame
+            DataFrame containing Moss Data.
+        rmqs_index : SpatialIndex
+            Index over RMQS Data.
+        radians: bool
+            Whether the provided Data is in radians or not.by default False
+        moss_longitude : str, optional
+            Label for longitude in moss DataFrame., by default "longitude"
+        moss_latitude : str, optional
+            Label for latitude in moss DataFrame., by default "latitude"
+        leftovers: bool, optional
+            Whether to return unused data from right dataframe or not.
+            , by default False
 
         Returns
         -------
-        DataFrame
-            RMQS Data whose dates are more recent than the threshold.
-        """
-        dates = rmqs_data[date_column]
-
-        is_greater_than_threshold = dates.dt.year >= self.year_threshold
+        DataFrame | tuple[DataFrame, DataFrame]
+            Matched DataFrame of right onto left and
+             leftovers dataframe if `leftovers` is True.
 
-        return rmqs_data[is_greater_than_threshold]
+        Raises
+        ------
+        ValueError
+            If the index was not built with the matcher's year threshold.
+        """
+        if rmqs_index.year_threshold != self.year_threshold:
+            msg = (
+                "RMQS index built with a year threshold of "
+                f"{rmqs_index.year_threshold}, but the matcher's year "
+                f"threshold is {self.year_threshold}."
+            )
+            raise ValueError(msg)
+        return self.match_to_index(
+            left_data=moss_data,
+            index=rmqs_index,
+            radians=radians,
+            left_longitude=moss_longitude,
+            left_latitude=moss_latitude,
+            suffixes=(self.moss_suffix, self.rmqs_suffix),
+            leftovers=leftovers,
+        )
 
     @overload
-    def right_to_left(
+    def space_time_right_to_left(
         self,
         left_data: DataFrame,
         right_data: DataFrame,
@@ -91,15 +1682,17 @@ class Matcher:
         *,
         left_longitude: str = ...,
         left_latitude: str = ...,
+        left_date: str = ...,
         right_longitude: str = ...,
         right_latitude: str = ...,
+        right_date: str = ...,
         suffixes: tuple[str, str] = ...,
         leftovers: Literal[False] = ...,
     ) -> DataFrame:
         ...
 
     @overload
-    def right_to_left(
+    def space_time_right_to_left(
         self,
         left_data: DataFrame,
         right_data: DataFrame,
@@ -107,14 +1700,16 @@ class Matcher:
         *,
         left_longitude: str = ...,
         left_latitude: str = ...,
+        left_date: str = ...,
         right_longitude: str = ...,
         right_latitude: str = ...,
+        right_date: str = ...,
         suffixes: tuple[str, str] = ...,
         leftovers: Literal[True] = ...,
     ) -> tuple[DataFrame, DataFrame]:
         ...
 
-    def right_to_left(
+    def space_time_right_to_left(
         self,
         left_data: DataFrame,
         right_data: DataFrame,
@@ -122,12 +1717,20 @@ class Matcher:
         *,
         left_longitude: str = "longitude",
         left_latitude: str = "latitude",
+        left_date: str = "date",
         right_longitude: str = "longitude",
         right_latitude: str = "latitude",
+        right_date: str = "date",
         suffixes: tuple[str, str] = ("_left", "_right"),
         leftovers: bool = False,
     ) -> DataFrame | tuple[DataFrame, DataFrame]:
-        """Match a Dataframe (right) onto another one (left).
+        """Match a Dataframe (right) onto another one (left) in space-time.
+
+        Dates are scaled by `km_per_year` into a fourth axis, so that the
+        closest right point minimizes the combined distance
+        sqrt(distance**2 + (km_per_year * time_gap)**2), which must not
+        exceed `km_threshold`. All points are matched with a single
+        batched query. Points with missing dates are not matched.
 
         Parameters
         ----------
@@ -141,10 +1744,14 @@ class Matcher:
             Longitude column for the left DataFrame., by default "longitude"
         left_latitude : str, optional
             Latitude column for the left DataFrame., by default "latitude"
+        left_date : str, optional
+            Date column for the left DataFrame., by default "date"
         right_longitude : str, optional
             Longitude column for the right DataFrame., by default "longitude"
         right_latitude : str, optional
             Latitude column for the right DataFrame., by default "latitude"
+        right_date : str, optional
+            Date column for the right DataFrame., by default "date"
         suffixes : tuple[str, str], optional
             Suffixes to use for merging., by default ("_left", "_right")
         leftovers: bool, optional
@@ -154,43 +1761,64 @@ class Matcher:
         Returns
         -------
         DataFrame | tuple[DataFrame, DataFrame]
-            Matched DataFrame of right onto left and
-             leftovers dataframe if `leftovers` is True.
+            Matched DataFrame of right onto left, with the spatial
+            distance (in km) and the time gap (left date minus right date,
+            in years) of each pair, and leftovers dataframe if `leftovers`
+            is True.
         """
-        # Slice to conserve only coordinates.
-        left_xy = left_data.filter([left_longitude, left_latitude])
-        right_xy = right_data.filter([right_longitude, right_latitude])
+        left_xy = left_data[[left_longitude, left_latitude]].to_numpy(float)
+        right_xy = right_data[[right_longitude, right_latitude]].to_numpy(
+            float,
+        )
         if not radians:
-            left_xy = Matcher.convert_to_radians(left_xy)
-            right_xy = Matcher.convert_to_radians(right_xy)
-
-        # Estimator fitting
-        estimator = NearestNeighbors(n_neighbors=1, metric=self.metric)
-        estimator.fit(right_xy)
-        distances, indexes = estimator.kneighbors(left_xy)
-
-        # Verify Distance Threshold
-        is_lower_than_threshold = (distances <= self.rad_threshold).flatten()
-        # Conserve points matching threshold
-        left_data_cropped = left_data[is_lower_than_threshold]
-        indexes_cropped = indexes.flatten()[is_lower_than_threshold]
-
-        # Merge left data to right data based on indexes.
-        merged = left_data_cropped.merge(
-            right=right_data,
-            left_on=right_data.index[indexes_cropped],
-            right_index=True,
+            left_xy = np.deg2rad(left_xy)
+            right_xy = np.deg2rad(right_xy)
+        left_years = self.convert_to_years(left_data[left_date])
+        right_years = self.convert_to_years(right_data[right_date])
+        left_points = self._space_time_points(left_xy, left_years)
+        right_points = self._space_time_points(right_xy, right_years)
+        # Points with missing coordinates or dates are not indexed
+        left_valid = np.flatnonzero(np.isfinite(left_points).all(axis=1))
+        right_valid = np.flatnonzero(np.isfinite(right_points).all(axis=1))
+        bound = self._earth_radius_km * self.chord_threshold
+        distances, indexes = self._query_in_chunks(
+            partial(
+                cKDTree(right_points[right_valid]).query,
+                k=1,
+                distance_upper_bound=np.nextafter(bound, np.inf),
+            ),
+            left_points[left_valid],
+        )
+        is_lower_than_threshold = distances <= bound
+        left_positions = left_valid[is_lower_than_threshold]
+        right_positions = right_valid[indexes[is_lower_than_threshold]]
+        matched = self._join(
+            left_data=left_data,
+            right_data=right_data,
+            left_positions=left_positions,
+            right_positions=right_positions,
             suffixes=suffixes,
+            leftovers=leftovers,
         )
-        if leftovers:
-            is_conserved = right_data.index.isin(indexes_cropped)
-            # Extract unmerged points to return as leftovers
-            leftovers = right_data[~is_conserved]
-            return merged, leftovers
-        return merged
+        merged = matched[0] if leftovers else matched
+        # Spatial distance of the pairs, from their chords
+        chords = np.linalg.norm(
+            left_points[left_positions, :3]
+            - right_points[right_positions, :3],
+            axis=1,
+        )
+        merged[self.distance_column] = (
+            2
+            * self._earth_radius_km
+            * np.arcsin(np.minimum(chords / (2 * self._earth_radius_km), 1))
+        )
+        merged[self.time_gap_column] = (
+            left_years[left_positions] - right_years[right_positions]
+        )
+        return matched
 
     @overload
-    def match_rmqs_to_moss(
+    def space_time_match_rmqs_to_moss(
         self,
         moss_data: DataFrame,
         rmqs_data: DataFrame,
@@ -205,7 +1833,7 @@ class Matcher:
         ...
 
     @overload
-    def match_rmqs_to_moss(
+    def space_time_match_rmqs_to_moss(
         self,
         moss_data: DataFrame,
         rmqs_data: DataFrame,
@@ -219,7 +1847,7 @@ class Matcher:
     ) -> DataFrame:
         ...
 
-    def match_rmqs_to_moss(
+    def space_time_match_rmqs_to_moss(
         self,
         moss_data: DataFrame,
         rmqs_data: DataFrame,
@@ -231,9 +1859,10 @@ class Matcher:
         rmqs_latitude: str = "latitude",
         leftovers: bool = False,
     ) -> tuple[DataFrame, DataFrame] | DataFrame:
-        """Match RMQS to Moss Data.
+        """Match RMQS to Moss Data in space-time.
 
-        Final Output will have as many rows as Moss DataFrame.
+        The year threshold is not applied: time gaps are weighed against
+        distances through `km_per_year` instead.
 
         Parameters
         ----------
@@ -258,71 +1887,155 @@ class Matcher:
         Returns
         -------
         DataFrame | tuple[DataFrame, DataFrame]
-            Matched DataFrame of right onto left and
-             leftovers dataframe if `leftovers` is True.
+            Matched DataFrame of right onto left, with distances and time
+            gaps, and leftovers dataframe if `leftovers` is True.
         """
-        rmqs_sliced = self._apply_year_threshold(
-            rmqs_data=rmqs_data,
-            date_column=self.rmqs_date_column,
-        )
-        # Perform right to left match with moss as left and rmqs as right
-        return self.right_to_left(
+        return self.space_time_right_to_left(
             left_data=moss_data,
-            right_data=rmqs_sliced,
+            right_data=rmqs_data,
             radians=radians,
             left_longitude=moss_longitude,
             left_latitude=moss_latitude,
+            left_date=self.moss_date_column,
             right_longitude=rmqs_longitude,
             right_latitude=rmqs_latitude,
+            right_date=self.rmqs_date_column,
             suffixes=(self.moss_suffix, self.rmqs_suffix),
             leftovers=leftovers,
         )
 
-    @overload
-    def match_moss_to_rmqs(
+    def sweep_right_to_left(
         self,
-        moss_data: DataFrame,
-        rmqs_data: DataFrame,
-        radians: bool = ...,
+        left_data: DataFrame,
+        right_data: DataFrame,
+        radians: bool,
         *,
-        moss_longitude: str = ...,
-        moss_latitude: str = ...,
-        rmqs_longitude: str = ...,
-        rmqs_latitude: str = ...,
-        leftovers: Literal[True],
-    ) -> tuple[DataFrame, DataFrame]:
-        ...
+        km_thresholds: list[float],
+        year_thresholds: list[int],
+        left_longitude: str = "longitude",
+        left_latitude: str = "latitude",
+        right_longitude: str = "longitude",
+        right_latitude: str = "latitude",
+        right_date: str = "date",
+    ) -> ThresholdSweep:
+        """Match a Dataframe (right) onto another one for many thresholds.
 
-    @overload
-    def match_moss_to_rmqs(
-        self,
-        moss_data: DataFrame,
-        rmqs_data: DataFrame,
-        radians: bool = ...,
-        *,
-        moss_longitude: str = ...,
-        moss_latitude: str = ...,
-        rmqs_longitude: str = ...,
-        rmqs_latitude: str = ...,
-        leftovers: Literal[False],
-    ) -> DataFrame:
-        ...
+        All pairs within the largest distance threshold are found with a
+        single search. Pairs are then sorted by left point and by date, so
+        that the closest recent enough right point of each left point
+        is a running minimum, read for each year threshold. Among equally
+        distant right points, the lowest position is matched, as by
+        `right_to_left`.
 
-    def match_moss_to_rmqs(
+        Parameters
+        ----------
+        left_data : DataFrame
+            Left DataFrame.
+        right_data : DataFrame
+            Right DataFrame.
+        radians: bool
+            Whether the provided Data is in radians or not.
+        km_thresholds : list[float]
+            Distance thresholds, in km.
+        year_thresholds : list[int]
+            Year thresholds: right points must be dated from this year or
+            later.
+        left_longitude : str, optional
+            Longitude column for the left DataFrame., by default "longitude"
+        left_latitude : str, optional
+            Latitude column for the left DataFrame., by default "latitude"
+        right_longitude : str, optional
+            Longitude column for the right DataFrame., by default "longitude"
+        right_latitude : str, optional
+            Latitude column for the right DataFrame., by default "latitude"
+        right_date : str, optional
+            Date column for the right DataFrame., by default "date"
+
+        Returns
+        -------
+        ThresholdSweep
+            Matches for each pair of thresholds.
+        """
+        km_thresholds = np.sort(np.asarray(km_thresholds, dtype=float))
+        year_thresholds = np.sort(np.asarray(year_thresholds, dtype=int))
+        left_xy = left_data[[left_longitude, left_latitude]].to_numpy(float)
+        right_xy = right_data[[right_longitude, right_latitude]].to_numpy(
+            float,
+        )
+        if not radians:
+            left_xy = np.deg2rad(left_xy)
+            right_xy = np.deg2rad(right_xy)
+        lefts, rights, distances = self._radius_pairs(
+            left_xy,
+            cKDTree(self.convert_to_unit_vectors(*right_xy.T)),
+            km_threshold=km_thresholds[-1],
+        )
+        years = right_data[right_date].dt.year.to_numpy(
+            dtype=float,
+            na_value=np.nan,
+        )[rights]
+        # Undated right points never pass the year threshold
+        dated = ~np.isnan(years)
+        lefts, rights = lefts[dated].astype(np.int64), rights[dated]
+        distances, years = distances[dated], years[dated].astype(np.int64)
+        # Pairs by left point, most recent first
+        order = np.lexsort((-years, lefts))
+        lefts, rights = lefts[order], rights[order]
+        distances, years = distances[order], years[order]
+        pairs_nb = lefts.size
+        # Running minimum of the distances within each left point, on
+        # integer ranks shifted down by left point not to cross them.
+        # Equally distant (co-located) right points are ranked by position
+        # for the lowest one to be matched, as by the search engines
+        by_distance = np.lexsort((rights, distances))
+        ranks = np.empty(pairs_nb, dtype=np.int64)
+        ranks[by_distance] = np.arange(pairs_nb)
+        running = np.minimum.accumulate(ranks - lefts * pairs_nb)
+        closest = by_distance[running + lefts * pairs_nb]
+        # Pairs of a left point dated from a year or later form a prefix
+        first_year = years.min(initial=0)
+        last_year = years.max(initial=0)
+        span = last_year - first_year + 1
+        keys = lefts * span + (last_year - years)
+        left_nb = left_data.shape[0]
+        starts = np.searchsorted(lefts, np.arange(left_nb))
+        best_distances = np.full((year_thresholds.size, left_nb), np.inf)
+        best_positions = np.full((year_thresholds.size, left_nb), -1)
+        for i, year_threshold in enumerate(year_thresholds):
+            year = np.clip(year_threshold, first_year, last_year + 1)
+            ends = np.searchsorted(
+                keys,
+                np.arange(left_nb) * span + (last_year - year),
+                side="right",
+            )
+            has_pairs = ends > starts
+            best = closest[ends[has_pairs] - 1]
+            best_distances[i, has_pairs] = distances[best]
+            best_positions[i, has_pairs] = rights[best]
+        return ThresholdSweep(
+            km_thresholds=km_thresholds,
+            year_thresholds=year_thresholds,
+            best_distances=best_distances,
+            best_positions=best_positions,
+        )
+
+    def sweep_rmqs_to_moss(
         self,
         moss_data: DataFrame,
         rmqs_data: DataFrame,
-        radians: bool = True,
+        radians: bool = False,
         *,
+        km_thresholds: list[float],
+        year_thresholds: list[int],
         moss_longitude: str = "longitude",
         moss_latitude: str = "latitude",
         rmqs_longitude: str = "longitude",
         rmqs_latitude: str = "latitude",
-        leftovers: bool = False,
-    ) -> tuple[DataFrame, DataFrame] | DataFrame:
-        """Match Moss to RMQS Data.
+    ) -> ThresholdSweep:
+        """Match RMQS to Moss Data for a grid of thresholds.
 
-        Final Output will have as many rows as RMQS DataFrame.
+        Matches of each pair of thresholds are the ones
+        `match_rmqs_to_moss` would return with these thresholds.
 
         Parameters
         ----------
@@ -332,6 +2045,10 @@ class Matcher:
             DataFrame containing RMQS Data.
         radians: bool
             Whether the provided Data is in radians or not.by default False
+        km_thresholds : list[float]
+            Distance thresholds, in km.
+        year_thresholds : list[int]
+            Year thresholds to verify for RMQS data.
         moss_longitude : str, optional
             Label for longitude in moss DataFrame., by default "longitude"
         moss_latitude : str, optional
@@ -340,29 +2057,21 @@ class Matcher:
             Label for longitude in RMQS DataFrame., by default "longitude"
         rmqs_latitude : str, optional
             Label for latitude in RMQS DataFrame., by default "latitude"
-        leftovers: bool, optional
-            Whether to return unused data from right dataframe or not.
-            , by default False
 
         Returns
         -------
-        DataFrame | tuple[DataFrame, DataFrame]
-            Matched DataFrame of right onto left and
-             leftovers dataframe if `leftovers` is True.
+        ThresholdSweep
+            Matches for each pair of thresholds.
         """
-        rmqs_sliced = self._apply_year_threshold(
-            rmqs_data=rmqs_data,
-            date_column=self.rmqs_date_column,
-        )
-        # Perform right to left match with rmqs as left and rmqs as left
-        return self.right_to_left(
-            right_data=moss_data,
-            left_data=rmqs_sliced,
+        return self.sweep_right_to_left(
+            left_data=moss_data,
+            right_data=rmqs_data,
             radians=radians,
-            right_longitude=moss_longitude,
-            right_latitude=moss_latitude,
-            left_longitude=rmqs_longitude,
-            left_latitude=rmqs_latitude,
-            suffixes=(self.moss_suffix, self.rmqs_suffix),
-            leftovers=leftovers,
+            km_thresholds=km_thresholds,
+            year_thresholds=year_thresholds,
+            left_longitude=moss_longitude,
+            left_latitude=moss_latitude,
+            right_longitude=rmqs_longitude,
+            right_latitude=rmqs_latitude,
+            right_date=self.rmqs_date_column,
         )
@@ -1,10 +1,12 @@
 """Generate a regular grid in a (multi)polygon."""
 
 from pathlib import Path
-from typing import Self
+from typing import ClassVar, Self
 
 import geopandas as gpd
 import gstlearn as gl
+import numpy as np
+import shapely
 from gstlearn import DbGrid
 
 from bramm_data_analysis.spatial.boundary import Boundary
@@ -17,22 +19,50 @@ class RegularGrid:
     x_field = "longitude"
     y_field = "latitude"
     insider_field = "inland"
-
-    def __init__(self, boundary: Boundary) -> None:
+    mask_methods: ClassVar[list[str]] = ["within", "scanline"]
+
+    def __init__(
+        self,
+        boundary: Boundary,
+        *,
+        mask_method: str = "within",
+    ) -> None:
         """Instantiate the Regulargrid.
 
         Parameters
         ----------
         boundary : Boundary
             Boundaries for the grid.
+        mask_method : str, optional
+            Method to select the cells within the boundary: "within" to
+            test a point per cell against the polygon, "scanline" to
+            rasterize the polygon onto the grid lattice.
+            , by default "within"
+
+        Raises
+        ------
+        ValueError
+            If the mask method is not supported.
         """
+        if mask_method not in self.mask_methods:
+            msg = (
+                f"Unsupported mask method: {mask_method}."
+                f" Options are: {', '.join(self.mask_methods)}."
+            )
+            raise ValueError(msg)
         self._boundary = boundary
+        self._mask_method = mask_method
 
     @property
     def boundary(self) -> Boundary:
         """Boundary Object."""
         return self._boundary
 
+    @property
+    def mask_method(self) -> str:
+        """Method selecting the cells within the boundary."""
+        return self._mask_method
+
     def _mesh(self, step: float) -> DbGrid:
         """Generate points all around the boundary, separated by given step.
 
@@ -63,6 +93,86 @@ class RegularGrid:
         grid.setName("x2", self.y_field)
         return grid
 
+    def _rasterize(self, full_grid: DbGrid) -> np.ndarray:
+        """Rasterize the boundary onto the grid lattice.
+
+        Each row of cells is crossed by the polygon edges spanning its
+        latitude. A cell is inside the boundary if an odd number of
+        crossings lie on its right (even-odd rule), all rings included.
+        As with `within`, cells lying exactly on an edge are outside.
+
+        Parameters
+        ----------
+        full_grid : DbGrid
+            DbGrid containing all points.
+
+        Returns
+        -------
+        np.ndarray
+            Whether each cell is inside the boundary, in the grid order.
+        """
+        nx, ny = full_grid.getNX(0), full_grid.getNX(1)
+        # Lattice coordinates, exactly as in the grid
+        xs = np.asarray(full_grid[self.x_field])[:nx]
+        ys = np.asarray(full_grid[self.y_field])[::nx]
+        # Edges of all rings, between consecutive vertices of a ring
+        rings = shapely.get_rings(shapely.get_parts(self.boundary.polygon))
+        coordinates, ring_indexes = shapely.get_coordinates(
+            rings,
+            return_index=True,
+        )
+        is_edge = ring_indexes[1:] == ring_indexes[:-1]
+        starts, ends = coordinates[:-1][is_edge], coordinates[1:][is_edge]
+        # Rows whose latitude is in [min, max] of the edge latitudes
+        first_rows = np.searchsorted(ys, np.minimum(starts, ends)[:, 1])
+        last_rows = np.searchsorted(
+            ys,
+            np.maximum(starts, ends)[:, 1],
+            side="right",
+        )
+        rows_nb = last_rows - first_rows
+        edges = np.repeat(np.arange(rows_nb.size), rows_nb)
+        rows = np.arange(edges.size) - np.repeat(
+            np.cumsum(rows_nb) - rows_nb - first_rows,
+            rows_nb,
+        )
+        (x1, y1), (x2, y2) = starts[edges].T, ends[edges].T
+        horizontal = y1 == y2
+        with np.errstate(divide="ignore", invalid="ignore"):
+            crossings = x1 + (ys[rows] - y1) * (x2 - x1) / (y2 - y1)
+        # Number of cells left of each crossing
+        columns = np.searchsorted(xs, crossings)
+        # Only rows in [min, max) of the edge latitudes are crossed
+        crossed = ~horizontal & (ys[rows] < np.maximum(y1, y2))
+        counts = np.bincount(
+            rows[crossed] * (nx + 1) + columns[crossed],
+            minlength=ny * (nx + 1),
+        ).reshape(ny, nx + 1)
+        # Crossings on the right of each cell
+        right_crossings = np.cumsum(counts[:, ::-1], axis=1)[:, ::-1]
+        inside = right_crossings[:, 1:] % 2 == 1
+        # Cells on the edges: on a crossing, or along a horizontal edge
+        on_crossing = ~horizontal & (
+            xs[np.minimum(columns, nx - 1)] == crossings
+        )
+        lows = np.where(
+            horizontal,
+            np.searchsorted(xs, np.minimum(x1, x2)),
+            columns,
+        )
+        highs = np.where(
+            horizontal,
+            np.searchsorted(xs, np.maximum(x1, x2), side="right"),
+            columns + 1,
+        )
+        on_edge = horizontal | on_crossing
+        # Flag the ranges of cells on the edges of each row
+        bounds = np.zeros((ny, nx + 1), dtype=int)
+        np.add.at(bounds, (rows[on_edge], lows[on_edge]), 1)
+        np.add.at(bounds, (rows[on_edge], highs[on_edge]), -1)
+        on_boundary = np.cumsum(bounds, axis=1)[:, :nx] > 0
+        return (inside & ~on_boundary).ravel()
+
     def _filter(self, full_grid: DbGrid) -> DbGrid:
         """Filter a dataframe of points.
 
@@ -76,13 +186,17 @@ class RegularGrid:
         DbGrid
             DbGrid with selection zone.
         """
-        # Make GeoPandas geometry from grid points.
-        geometry = gpd.points_from_xy(
-            x=full_grid[self.x_field],
-            y=full_grid[self.y_field],
-        )
-        # Check whether points are inside the boundary or not
-        full_grid[self.insider_field] = geometry.within(self._boundary.polygon)
+        if self.mask_method == "scanline":
+            inland = self._rasterize(full_grid)
+        else:
+            # Make GeoPandas geometry from grid points.
+            geometry = gpd.points_from_xy(
+                x=full_grid[self.x_field],
+                y=full_grid[self.y_field],
+            )
+            # Check whether points are inside the boundary or not
+            inland = geometry.within(self._boundary.polygon)
+        full_grid[self.insider_field] = inland
         # Define as selection
         full_grid.setLocator(self.insider_field, gl.ELoc.SEL)
         return full_grid
@@ -105,7 +219,10 @@ class RegularGrid:
 
     @classmethod
     def from_boundary_path(
-        cls: type["RegularGrid"], boundary_geojson_path: Path
+        cls: type["RegularGrid"],
+        boundary_geojson_path: Path,
+        *,
+        mask_method: str = "within",
     ) -> Self:
         """Instantiate the RegularGrid from the boundaries geojson.
 
@@ -113,6 +230,9 @@ class RegularGrid:
         ----------
         boundary_geojson_path : Path
             Path to the geojson boundary file.
+        mask_method : str, optional
+            Method to select the cells within the boundary.
+            , by default "within"
 
         Returns
         -------
@@ -122,4 +242,5 @@ class RegularGrid:
         # Create regularGrid from geojson path instead of Boundary object
         return cls(
             boundary=Boundary(boundary_geojson_path=boundary_geojson_path),
+            mask_method=mask_method,
         )
@@ -0,0 +1,121 @@
+"""Tests of the matching engines."""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from bramm_data_analysis.matching import Matcher
+
+LEFT_SIZE = 2_000
+SITES_NB = 300
+LAYERS_NB = 4
+
+
+@pytest.fixture(scope="module")
+def left() -> pd.DataFrame:
+    """Left points, around the right sites."""
+    rng = np.random.default_rng(0)
+    return pd.DataFrame(
+        {
+            "longitude": rng.uniform(2, 4, LEFT_SIZE),
+            "latitude": rng.uniform(45, 47, LEFT_SIZE),
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def right() -> pd.DataFrame:
+    """Right points, several layers sharing the coordinates of a site."""
+    rng = np.random.default_rng(1)
+    sites = pd.DataFrame(
+        {
+            "longitude": rng.uniform(2, 4, SITES_NB),
+            "latitude": rng.uniform(45, 47, SITES_NB),
+            Matcher.rmqs_date_column: pd.to_datetime("2000-01-01")
+            + pd.to_timedelta(rng.uniform(0, 10 * 365, SITES_NB), "D"),
+        }
+    )
+    layers = sites.loc[sites.index.repeat(LAYERS_NB)]
+    # Shuffle layers not to store co-located points contiguously
+    layers = layers.sample(frac=1, random_state=2)
+    return layers.reset_index(drop=True).assign(
+        layer=np.arange(layers.shape[0]),
+    )
+
+
+def matched_layers(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    engine: str,
+) -> np.ndarray:
+    """Layers matched to the left points by an engine.
+
+    Parameters
+    ----------
+    left : pd.DataFrame
+        Left points.
+    right : pd.DataFrame
+        Right points.
+    engine : str
+        Nearest neighbours search engine.
+
+    Returns
+    -------
+    np.ndarray
+        Matched layer of each matched left point.
+    """
+    matcher = Matcher(km_threshold=10, engine=engine)
+    matched = matcher.right_to_left(left, right, radians=False)
+    return matched["layer"].to_numpy()
+
+
+def test_engines_agree_on_colocated_points(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+) -> None:
+    """Both engines match the same right point among co-located ones."""
+    haversine = matched_layers(left, right, "haversine")
+    kdtree = matched_layers(left, right, "kdtree")
+    assert haversine.size > 0
+    np.testing.assert_array_equal(haversine, kdtree)
+
+
+@pytest.mark.parametrize("engine", Matcher.engines)
+def test_lowest_colocated_position(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    engine: str,
+) -> None:
+    """The lowest position among co-located right points is matched."""
+    lowest = right.groupby(["longitude", "latitude"])["layer"].transform("min")
+    layers = matched_layers(left, right, engine)
+    np.testing.assert_array_equal(layers, lowest.to_numpy()[layers])
+
+
+@pytest.mark.parametrize("year_threshold", [2000, 2005])
+def test_sweep_pairs_match(
+    left: pd.DataFrame,
+    right: pd.DataFrame,
+    year_threshold: int,
+) -> None:
+    """The sweep matches the same pairs as matching once per threshold."""
+    sweep = Matcher().sweep_rmqs_to_moss(
+        left,
+        right,
+        km_thresholds=[5, 10],
+        year_thresholds=[year_threshold],
+    )
+    for km_threshold in [5, 10]:
+        matched = Matcher(
+            km_threshold=km_threshold,
+            year_threshold=year_threshold,
+        ).match_rmqs_to_moss(left, right)
+        left_positions, right_positions = sweep.pairs(
+            km_threshold,
+            year_threshold,
+        )
+        np.testing.assert_array_equal(left_positions, matched.index)
+        np.testing.assert_array_equal(
+            right_positions,
+            matched[Matcher.key_column],
+        )
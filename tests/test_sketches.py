@@ -0,0 +1,131 @@
+"""Tests of the streaming quantile sketches."""
+
+import numpy as np
+import pytest
+
+from bramm_data_analysis.loaders.preprocessing.outliers.sketches import (
+    QuantileSketch,
+)
+
+SIZE = 200_000
+LEVELS = [0.001, 0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99, 0.999]
+ERRORS = [0.05, 0.01]
+
+
+@pytest.fixture(scope="module")
+def values() -> np.ndarray:
+    """Values summarized by the sketches."""
+    return np.random.default_rng(0).lognormal(size=SIZE)
+
+
+def rank_error(values: np.ndarray, sketch: QuantileSketch) -> float:
+    """Maximal error on the ranks of the sketch's quantiles.
+
+    Parameters
+    ----------
+    values : np.ndarray
+        Values summarized by the sketch, missing values being NaN.
+    sketch : QuantileSketch
+        Sketch to evaluate.
+
+    Returns
+    -------
+    float
+        Maximal rank error, as a fraction of the number of values.
+    """
+    present = np.sort(values[~np.isnan(values)])
+    quantiles = sketch.quantile(LEVELS)
+    # Ranks of the quantiles, ties spanning an interval of ranks
+    lowest = np.searchsorted(present, quantiles, side="left") / present.size
+    highest = np.searchsorted(present, quantiles, side="right") / present.size
+    errors = np.maximum(lowest - LEVELS, 0) + np.maximum(LEVELS - highest, 0)
+    return float(errors.max())
+
+
+@pytest.mark.parametrize("error", ERRORS)
+def test_single_update(values: np.ndarray, error: float) -> None:
+    """A sketch updated at once is within the targeted error."""
+    sketch = QuantileSketch(error=error, seed=0)
+    sketch.update(values)
+    assert sketch.count == values.size
+    assert rank_error(values, sketch) <= error
+
+
+@pytest.mark.parametrize("error", ERRORS)
+def test_chunked_updates(values: np.ndarray, error: float) -> None:
+    """A sketch updated chunk after chunk is within the targeted error."""
+    sketch = QuantileSketch(error=error, seed=0)
+    for chunk in np.array_split(values, 100):
+        sketch.update(chunk)
+    assert sketch.count == values.size
+    assert sketch.size < values.size
+    assert rank_error(values, sketch) <= error
+
+
+@pytest.mark.parametrize("error", ERRORS)
+def test_merged_sketches(values: np.ndarray, error: float) -> None:
+    """Sketches built on separate parts and merged are within the error."""
+    sketches = []
+    for seed, part in enumerate(np.array_split(values, 4)):
+        sketch = QuantileSketch(error=error, seed=seed)
+        for chunk in np.array_split(part, 25):
+            sketch.update(chunk)
+        sketches.append(sketch)
+    merged, *others = sketches
+    for other in others:
+        merged.merge(other)
+    assert merged.count == values.size
+    assert rank_error(values, merged) <= error
+
+
+def test_missing_values_are_ignored(values: np.ndarray) -> None:
+    """Missing values are neither counted nor used for the quantiles."""
+    with_nans = values.copy()
+    with_nans[::3] = np.nan
+    sketch = QuantileSketch(error=0.01, seed=0)
+    for chunk in np.array_split(with_nans, 10):
+        sketch.update(chunk)
+    assert sketch.count == np.count_nonzero(~np.isnan(with_nans))
+    assert not np.isnan(sketch.quantile(LEVELS)).any()
+    assert rank_error(with_nans, sketch) <= sketch.error
+
+
+def test_extreme_levels_are_exact(values: np.ndarray) -> None:
+    """The 0 and 1 quantiles are the minimum and the maximum."""
+    sketch = QuantileSketch(error=0.05, seed=0)
+    for chunk in np.array_split(values, 10):
+        sketch.update(chunk)
+    np.testing.assert_array_equal(
+        sketch.quantile([0, 1]),
+        [values.min(), values.max()],
+    )
+
+
+def test_empty_sketch() -> None:
+    """Quantiles of an empty sketch are missing."""
+    sketch = QuantileSketch(error=0.01, seed=0)
+    sketch.update(np.array([]))
+    sketch.update(np.full(10, np.nan))
+    assert sketch.count == 0
+    assert np.isnan(sketch.quantile(LEVELS)).all()
+
+
+def test_merge_empty_sketch(values: np.ndarray) -> None:
+    """Merging an empty sketch does not change the quantiles."""
+    sketch = QuantileSketch(error=0.01, seed=0)
+    sketch.update(values)
+    quantiles = sketch.quantile(LEVELS)
+    sketch.merge(QuantileSketch(error=0.01, seed=1))
+    assert sketch.count == values.size
+    np.testing.assert_array_equal(sketch.quantile(LEVELS), quantiles)
+    empty = QuantileSketch(error=0.01, seed=1)
+    empty.merge(sketch)
+    assert empty.count == values.size
+    assert rank_error(values, empty) <= empty.error
+
+
+@pytest.mark.parametrize("error", [0, 1, -0.1])
+def test_invalid_error(error: float) -> None:
+    """Errors outside of ]0, 1[ are rejected."""
+    with pytest.raises(ValueError, match="between 0 and 1"):
+        QuantileSketch(error=error)